@@ -0,0 +1,90 @@
+"""
+Benchmark dos Presets de Inicialização do Chrome
+=================================================
+
+Mede, para cada preset, o tempo de inicialização do Chrome, o tempo de
+carregamento de uma página simples e a memória (RSS) da árvore de processos.
+
+Uso:
+    python benchmark_presets.py
+    python benchmark_presets.py --runs 5 --url https://example.com
+    python benchmark_presets.py --presets default lean-headless
+"""
+
+import argparse
+import statistics
+import time
+
+from selenium_linkedin import ChromeConfig, MemoryWatchdog, LAUNCH_PRESETS
+
+
+def benchmark_preset(preset: str, url: str, runs: int) -> dict:
+    """
+    Executa o benchmark de um preset
+
+    Args:
+        preset: Nome do preset
+        url: URL carregada em cada execução
+        runs: Quantidade de execuções
+
+    Returns:
+        dict: Medianas de inicialização (s), carregamento (s) e memória (MB)
+    """
+    startups, loads, memory = [], [], []
+    watchdog = MemoryWatchdog()
+
+    for run in range(1, runs + 1):
+        # "default" roda em headless para comparar com o preset enxuto
+        config = ChromeConfig(headless=True, preset=preset)
+
+        started = time.perf_counter()
+        driver = config.create_driver()
+        startups.append(time.perf_counter() - started)
+
+        try:
+            started = time.perf_counter()
+            driver.get(url)
+            loads.append(time.perf_counter() - started)
+
+            memory.append(watchdog.browser_rss_mb(driver))
+        finally:
+            driver.quit()
+
+        print(f"   [{preset}] execução {run}: inicialização {startups[-1]:.2f}s | "
+              f"carregamento {loads[-1]:.2f}s | memória {memory[-1]:.0f} MB")
+
+    return {
+        'startup_s': statistics.median(startups),
+        'load_s': statistics.median(loads),
+        'rss_mb': statistics.median(memory),
+    }
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Benchmark dos presets de inicialização do Chrome")
+    parser.add_argument('--runs', type=int, default=3, help="Execuções por preset")
+    parser.add_argument('--url', default="data:text/html,<h1>benchmark</h1>", help="URL carregada")
+    parser.add_argument('--presets', nargs='+', default=list(LAUNCH_PRESETS),
+                        help="Presets a comparar")
+    args = parser.parse_args()
+
+    # visual-debug abre janela e DevTools: não faz sentido em benchmark headless
+    presets = [p for p in args.presets if p != 'visual-debug']
+
+    results = {}
+    for preset in presets:
+        print(f"\n⏱️ Preset: {preset}")
+        results[preset] = benchmark_preset(preset, args.url, args.runs)
+
+    print("\n" + "="*60)
+    print(f"{'Preset':<16}{'Inicialização':>15}{'Carregamento':>15}{'Memória':>12}")
+    print("="*60)
+    for preset, result in results.items():
+        print(f"{preset:<16}{result['startup_s']:>14.2f}s{result['load_s']:>14.2f}s"
+              f"{result['rss_mb']:>9.0f} MB")
+    print("="*60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
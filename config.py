@@ -4,7 +4,11 @@ Configurações do Selenium para Web Scraping
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium_linkedin.request_blocking import apply_blocking_profile
+from selenium_linkedin.launch_presets import apply_preset, chromedriver_path, get_preset
+
+
+HIDE_WEBDRIVER_JS = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
 
 
 class SeleniumConfig:
@@ -12,16 +16,24 @@ class SeleniumConfig:
     Classe para configurar o driver do Selenium com Chrome
     """
     
-    def __init__(self, headless=False, disable_images=False):
+    def __init__(self, headless=False, disable_images=False, block_profile=None, preset=None):
         """
         Inicializa a configuração do Selenium
         
         Args:
             headless (bool): Se True, executa sem abrir janela do navegador
             disable_images (bool): Se True, desabilita carregamento de imagens (mais rápido)
+            block_profile (str): Perfil de bloqueio de requisições via CDP (ex: "lean")
+            preset (str): Preset de inicialização (ex: "lean-headless", "visual-debug")
         """
         self.headless = headless
         self.disable_images = disable_images
+        self.block_profile = block_profile
+        self.preset = preset
+        
+        # Presets podem fixar o modo headless
+        if preset and get_preset(preset)['headless'] is not None:
+            self.headless = get_preset(preset)['headless']
     
     def get_chrome_options(self):
         """
@@ -68,6 +80,14 @@ class SeleniumConfig:
         # Maximizar janela ao abrir
         chrome_options.add_argument('--start-maximized')
         
+        # Flags do preset (serviços desativados, DevTools, etc)
+        if self.preset:
+            apply_preset(chrome_options, self.preset)
+        
+        # Eventos de rede para o contador de tráfego do perfil de bloqueio
+        if self.block_profile:
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        
         return chrome_options
     
     def create_driver(self):
@@ -82,7 +102,8 @@ class SeleniumConfig:
         
         # Configurar o serviço do ChromeDriver com webdriver-manager
         # Isso baixa automaticamente a versão correta do ChromeDriver
-        service = Service(ChromeDriverManager().install())
+        # (a do chrome-headless-shell quando o preset o utiliza)
+        service = Service(chromedriver_path(options.binary_location))
         
         # Criar driver
         driver = webdriver.Chrome(service=service, options=options)
@@ -92,24 +113,51 @@ class SeleniumConfig:
         driver.set_page_load_timeout(30)  # Timeout de carregamento de página
         
         # Executar script para esconder indicadores de automação
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        driver.execute_script(HIDE_WEBDRIVER_JS)
+        
+        self.configure_tab(driver)
         
         return driver
+    
+    def configure_tab(self, driver, handle=None):
+        """
+        Aplica a configuração CDP que vale só para uma aba
+        
+        Abas abertas depois do driver (TabPool, TabPrefetcher) não herdam a
+        configuração da primeira: chame para cada aba nova.
+        
+        Args:
+            driver: WebDriver do Chrome
+            handle (str): Aba a configurar (padrão: a aba atual)
+        """
+        if handle:
+            driver.switch_to.window(handle)
+        
+        # Esconder indicadores de automação em cada documento da aba
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': HIDE_WEBDRIVER_JS})
+        
+        # Bloquear recursos desnecessários (fontes, mídia, rastreadores...)
+        if self.block_profile:
+            apply_blocking_profile(driver, self.block_profile)
 
 
 # Função auxiliar para criar driver rapidamente
-def get_driver(headless=False, disable_images=False):
+def get_driver(headless=False, disable_images=False, block_profile=None, preset=None):
     """
     Função auxiliar para criar um driver configurado rapidamente
     
     Args:
         headless (bool): Se True, executa sem abrir janela do navegador
         disable_images (bool): Se True, desabilita carregamento de imagens
+        block_profile (str): Perfil de bloqueio de requisições via CDP (ex: "lean")
+        preset (str): Preset de inicialização (ex: "lean-headless")
     
     Returns:
         webdriver.Chrome: Driver do Chrome configurado
     """
-    config = SeleniumConfig(headless=headless, disable_images=disable_images)
+    config = SeleniumConfig(
+        headless=headless, disable_images=disable_images, block_profile=block_profile, preset=preset
+    )
     return config.create_driver()
 
 
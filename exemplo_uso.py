@@ -26,7 +26,7 @@ def exemplo_1_apenas_proxy():
     # Listar proxies disponíveis
     pm.list_proxies()
     
-    # Obter próximo proxy
+    # Obter próximo proxy (a rotação avança em memória)
     proxy = pm.get_next_proxy()
     
     # Validar proxy
@@ -45,6 +45,9 @@ def exemplo_1_apenas_proxy():
     print(f"   Total de proxies: {stats['total_proxies']}")
     print(f"   Índice atual: {stats['current_index']}")
     print(f"   Modo: {stats['rotation_mode']}")
+    
+    # Gravar a posição da rotação para a próxima execução
+    pm.save_state()
 
 
 def exemplo_2_apenas_sessao():
@@ -10,51 +10,189 @@ Script de exemplo para fazer scraping no LinkedIn usando:
 
 Uso:
     python linkedin_scraper.py
+
+Vários scrapers logados em paralelo (cada um com uma cópia do perfil):
+    LinkedInScraper(worker_id=1), LinkedInScraper(worker_id=2), ...
+
+Busca sem navegador (API JSON + sessão exportada com make session-export):
+    LinkedInScraper(search_backend="http")
+
+Proxies verificados antes do uso (pula os fora do ar; histórico em proxy_registry.db):
+    LinkedInScraper(proxy_rotation=ProxyRotation.HEALTH_WEIGHTED, proxy_registry=ProxyRegistry())
+
+Várias contas (um perfil por conta, com cotas e proxy fixo):
+    pool = AccountPool(["linkedin-ana", "linkedin-bia"], proxy_manager=ProxyManager())
+    search_across_accounts(["Recrutador TI", "Tech Recruiter"], pool)
 """
 
 import time
 import random
+import requests
+from urllib.parse import quote_plus
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
-from selenium_linkedin import ProxyManager, ProxyRotation, SessionManager, ChromeConfig
+from selenium_linkedin import (
+    ProxyManager, ProxyRotation, SessionManager, ChromeConfig, ScrollHarvester,
+    NetworkCapture, parse_people, SEARCH_URL_PATTERNS, TrafficCounter,
+    SnapshotStore, HtmlPage, MemoryWatchdog, ACTION_RECYCLE, DriverSupervisor,
+    BrowserDaemon, LinkedInHttpClient, HttpSearchError, AccountPool, ProxyRegistry
+)
 from utils import enrich_and_save  # Importar nossa nova função
 
 
+LINKEDIN_FEED_URL = "https://www.linkedin.com/feed/"
+
+# Espera por um proxy livre (todos ocupados por outros workers) antes de desistir
+PROXY_WAIT_SECONDS = 120
+PROXY_RETRY_INTERVAL = 5
+
+# Erros de rede do Chrome causados pelo proxy (os demais não contam contra ele)
+PROXY_ERROR_MARKERS = (
+    'ERR_PROXY_CONNECTION_FAILED', 'ERR_TUNNEL_CONNECTION_FAILED',
+    'ERR_SOCKS_CONNECTION_FAILED', 'ERR_PROXY_AUTH_UNSUPPORTED',
+    'ERR_PROXY_CERTIFICATE_INVALID', 'ERR_NO_SUPPORTED_PROXIES',
+)
+
+# Seletores da página de busca de pessoas
+RESULT_NAME_SELECTOR = ".entity-result__title-text a span[aria-hidden='true']"
+NEXT_PAGE_SELECTOR = "button.artdeco-pagination__button--next"
+
+
 class LinkedInScraper:
     """
     Scraper do LinkedIn com recursos avançados
     """
     
-    def __init__(self, headless: bool = False, use_proxy: bool = True):
+    def __init__(
+        self,
+        headless: bool = False,
+        use_proxy: bool = True,
+        capture_network: bool = False,
+        block_profile: str = None,
+        snapshot_dir: str = None,
+        replay: bool = False,
+        watchdog: MemoryWatchdog = None,
+        preset: str = None,
+        daemon: BrowserDaemon = None,
+        worker_id=None,
+        ram_profile: bool = False,
+        use_cookie_jar: bool = False,
+        search_backend: str = "browser",
+        profile_name: str = "linkedin",
+        account_pool: AccountPool = None,
+        proxy_rotation: ProxyRotation = ProxyRotation.SEQUENTIAL,
+        proxy_registry: ProxyRegistry = None
+    ):
         """
         Inicializa o scraper
         
         Args:
             headless: Se True, executa sem interface gráfica
             use_proxy: Se True, usa proxy da lista
+            capture_network: Se True, lê os resultados das respostas JSON (CDP)
+                             em vez do texto renderizado
+            block_profile: Perfil de bloqueio de requisições (None = sem bloqueio)
+            snapshot_dir: Se definido, salva snapshots (HTML + JSON) de cada página de busca
+            replay: Se True, roda a extração sobre os snapshots salvos (sem navegador)
+            watchdog: Watchdog de memória (padrão: MemoryWatchdog com limites padrão)
+            preset: Preset de inicialização do Chrome (ex: "lean-headless")
+            daemon: Se definido, usa uma aba do Chrome persistente do daemon
+                    (perfil e proxy são os do daemon) em vez de abrir um Chrome novo
+            worker_id: Se definido, usa uma cópia própria do perfil salvo, permitindo
+                       vários scrapers logados em paralelo
+            ram_profile: Se True, usa o perfil em memória (tmpfs) e salva apenas
+                         cookies e local storage no disco ao fechar
+            use_cookie_jar: Se True, abre um Chrome sem perfil e injeta a sessão
+                            exportada (make session-export)
+            search_backend: "browser" (padrão) ou "http" (chama a API JSON da busca
+                            com a sessão exportada; o navegador só abre como fallback)
+            profile_name: Perfil salvo da conta (ex: "linkedin-ana")
+            account_pool: Se definido, reserva uma conta do pool ao iniciar (perfil,
+                          proxy fixo e cota diária da conta; ignora profile_name)
+            proxy_rotation: Modo de rotação dos proxies (ex: ProxyRotation.HEALTH_WEIGHTED
+                            para verificar os proxies e pular os que estão fora do ar)
+            proxy_registry: Registro persistente dos proxies (reaproveita verificações recentes)
         """
+        if replay and not snapshot_dir:
+            raise ValueError("Modo replay requer snapshot_dir")
+        
+        if search_backend not in ("browser", "http"):
+            raise ValueError(f"Backend de busca inválido: {search_backend}")
+        
+        if account_pool and daemon:
+            raise ValueError("account_pool não pode ser usado com daemon (o perfil é o do daemon)")
+        
+        if account_pool and use_proxy and not account_pool.proxy_manager:
+            # Sem proxy fixo a conta cairia em proxies rotativos (IP diferente a cada execução)
+            raise ValueError("account_pool sem proxy_manager: configure os proxies do pool ou use use_proxy=False")
+        
         self.headless = headless
         self.use_proxy = use_proxy
+        self.capture_network = capture_network
+        self.block_profile = block_profile
+        self.preset = preset
         self.driver = None
+        self.chrome_config = None
+        
+        # Prazos por comando + reinício automático se o Chrome travar
+        self.supervisor = None
+        self.network_capture = None
+        
+        # Chrome persistente (aba reservada enquanto o job roda)
+        self.daemon = daemon
+        self.tab_lease = None
+        
+        # Limpeza de caches / reciclagem do Chrome em sessões longas
+        self.watchdog = watchdog or MemoryWatchdog()
+        
+        # Bytes baixados nesta execução (requer capture_network)
+        self.traffic = TrafficCounter()
+        
+        # Snapshots para re-parsing offline
+        self.replay = replay
+        self.snapshots = SnapshotStore(snapshot_dir) if snapshot_dir else None
         
         # Gerenciador de sessão
-        self.session_manager = SessionManager(profile_name="linkedin")
+        self.session_manager = SessionManager(profile_name=profile_name)
+        
+        # Conta reservada no pool (perfil, proxy fixo e cota)
+        self.account_pool = account_pool
+        self.account = None
+        # True se a conta foi pausada (sessão inválida, bloqueio): a busca vai para outra conta
+        self.account_paused = False
+        # Página de onde a busca interrompida continua (em outra conta)
+        self.next_page = 1
+        self.worker_id = worker_id
+        self.ram_profile = ram_profile
+        # Busca HTTP usa o jar; o navegador de fallback recebe a mesma sessão
+        self.search_backend = search_backend
+        self.http_client = None
+        self.use_cookie_jar = use_cookie_jar or search_backend == "http"
         
         # Gerenciador de proxies (se habilitado)
         self.proxy_manager = None
         self.current_proxy = None
+        # Proxy reservado para este worker (devolvido em stop)
+        self.proxy_lease = None
         
-        if use_proxy:
+        if use_proxy and account_pool:
+            # Contas usam o proxy fixo atribuído pelo pool
+            self.proxy_manager = account_pool.proxy_manager
+        elif use_proxy:
             self.proxy_manager = ProxyManager(
                 proxy_file="proxies.txt",
-                rotation_mode=ProxyRotation.SEQUENTIAL
+                rotation_mode=proxy_rotation,
+                registry=proxy_registry
             )
             
         # Lista para armazenar nomes coletados
         self.collected_names = []
+        
+        # Registros completos (nome, headline, localização, URL) quando disponíveis
+        self.collected_people = []
     
     def start(self):
         """Inicializa o navegador"""
@@ -62,39 +200,321 @@ class LinkedInScraper:
         print("INICIANDO LINKEDIN SCRAPER")
         print("="*60 + "\n")
         
-        # Verificar se tem sessão salva
-        if not self.session_manager.profile_exists():
-            print("❌ ERRO: Sessão não encontrada!")
-            print("\n👉 Execute primeiro: python setup_linkedin_session.py")
-            print("   ou: make session\n")
+        if self.replay:
+            print(f"⏪ Modo replay: lendo snapshots de {self.snapshots.root} (sem navegador)")
+            return True
+        
+        if self.account_pool:
+            self.account = self.account_pool.acquire()
+            if not self.account:
+                return False
+            self.session_manager = SessionManager(profile_name=self.account.profile_name)
+            # A conta sempre sai pelo mesmo proxy
+            if self.use_proxy:
+                self.current_proxy = self.account.proxy
+                if not self.current_proxy:
+                    print(f"❌ Conta {self.account.profile_name} sem proxy fixo (nenhum proxy disponível)")
+                    self._pause_account("sem proxy fixo")
+                    return False
+        
+        if self.use_cookie_jar:
+            # Sessão portátil: só o jar precisa existir
+            session_status = self.session_manager.check_jar()
+        else:
+            # Verificar se tem sessão salva
+            if not self.session_manager.profile_exists():
+                print("❌ ERRO: Sessão não encontrada!")
+                print("\n👉 Execute primeiro: python setup_linkedin_session.py")
+                print("   ou: make session\n")
+                self._pause_account("perfil não encontrado")
+                return False
+            
+            # Validar o login pelo banco de cookies antes de gastar tempo abrindo o Chrome
+            session_status = self.session_manager.check_session()
+        
+        if session_status['valid'] is False:
+            print(f"❌ ERRO: Sessão do LinkedIn inválida: {session_status['reason']}")
+            hint = "make session && make session-export" if self.use_cookie_jar else "make session"
+            print(f"\n👉 Refaça o login: {hint}\n")
+            self._pause_account("sessão inválida")
             return False
+        if session_status['valid'] is None:
+            print(f"⚠️ Não foi possível verificar a sessão: {session_status['reason']}")
+        else:
+            print(f"🍪 Sessão: {session_status['reason']}")
         
-        # Obter próximo proxy (se habilitado)
-        if self.use_proxy and self.proxy_manager:
-            self.current_proxy = self.proxy_manager.get_next_proxy()
+        if self.search_backend == "http":
+            return self._start_http_client()
+        
+        return self._launch_browser()
+    
+    def _select_proxy(self) -> bool:
+        """
+        Reserva um proxy para este worker (se habilitado)
+        
+        Com use_proxy nunca segue sem proxy (exporia o IP da máquina): espera
+        um proxy liberar por até PROXY_WAIT_SECONDS.
+        
+        Returns:
+            False se nenhum proxy ficou disponível
+        """
+        if self.account or not self.use_proxy:
+            return True  # Conta do pool: só o proxy fixo da conta
+        
+        deadline = time.time() + PROXY_WAIT_SECONDS
+        while True:
+            # Lease compartilhado: scrapers em paralelo se espalham pelos proxies
+            self.proxy_lease = self.proxy_manager.acquire_proxy(exclusive=False)
+            if self.proxy_lease:
+                self.current_proxy = self.proxy_lease.proxy
+                return True
             
-            if not self.current_proxy:
-                print("⚠️  Nenhum proxy disponível. Continuando sem proxy...")
+            if not self.proxy_manager.has_live_proxies() or time.time() >= deadline:
+                print("❌ Nenhum proxy disponível. Abortando (use_proxy=False para rodar sem proxy)")
+                return False
+            
+            print(f"⏳ Aguardando um proxy livre ({PROXY_RETRY_INTERVAL}s)...")
+            time.sleep(PROXY_RETRY_INTERVAL)
+    
+    def _report_proxy(self, ok: bool):
+        """Registra na saúde dos proxies o resultado de um uso real do proxy atual"""
+        if not (self.proxy_manager and self.current_proxy):
+            return
+        self.proxy_manager.report_result(self.current_proxy, ok)
         
-        # Configurar Chrome
-        chrome_config = ChromeConfig(
-            headless=self.headless,
-            profile_path=self.session_manager.get_profile_path(),
+        # Proxy fixo da conta morreu: a conta passa a sair por outro (na próxima abertura)
+        if not ok and self.account and self.proxy_manager.health.is_dead(self.current_proxy):
+            self.account.proxy = self.account_pool.reassign_proxy(self.account.profile_name)
+    
+    @staticmethod
+    def _is_proxy_error(error: Exception) -> bool:
+        """True se o erro do Chrome veio da conexão/túnel com o proxy"""
+        message = str(error)
+        return any(marker in message for marker in PROXY_ERROR_MARKERS)
+    
+    def _renew_proxy_lease(self):
+        """Mantém o lease do proxy válido durante buscas longas"""
+        if self.proxy_lease and not self.proxy_lease.renew_if_needed():
+            print("⚠️ Lease do proxy expirou (outro worker pode reservá-lo)")
+            self.proxy_lease = None
+    
+    def _pause_account(self, reason: str):
+        """Coloca a conta em cooldown para o pool escolher outra (devolvida em stop)"""
+        if self.account:
+            self.account_pool.cooldown(self.account.profile_name, reason=reason)
+            self.account_paused = True
+    
+    def _release_account(self):
+        """Devolve a conta ao pool"""
+        if self.account:
+            self.account_pool.release(self.account.profile_name)
+            self.account = None
+    
+    def _consume_search(self) -> bool:
+        """
+        Desconta uma página de busca da cota diária da conta
+        
+        Returns:
+            False se a cota da conta acabou
+        """
+        if not self.account:
+            return True
+        if self.account_pool.try_consume(self.account.profile_name):
+            return True
+        print(f"⚠️ Cota diária da conta {self.account.profile_name} esgotada. Encerrando busca.")
+        return False
+    
+    def _start_http_client(self) -> bool:
+        """Prepara a busca via HTTP (sem abrir o navegador)"""
+        if not self.current_proxy and not self._select_proxy():
+            return False
+        
+        self.http_client = LinkedInHttpClient(
+            jar_path=str(self.session_manager.jar_path),
             proxy=self.current_proxy
         )
         
-        # Criar driver
-        self.driver = chrome_config.create_driver()
+        print("\n⚡ Busca via HTTP pronta (navegador apenas como fallback)")
+        return True
+    
+    def _launch_browser(self) -> bool:
+        """Abre o Chrome (ou conecta ao daemon) com a sessão e o proxy"""
+        if self.daemon:
+            return self._start_on_daemon()
+        
+        # Obter próximo proxy (se habilitado)
+        if not self.current_proxy and not self._select_proxy():
+            return False
+        
+        # Workers paralelos usam uma cópia do perfil (o Chrome trava o user-data-dir)
+        if self.use_cookie_jar:
+            profile_path = None  # Chrome limpo; a sessão vem do jar
+        elif self.worker_id is not None:
+            profile_path = self.session_manager.clone_profile(self.worker_id, in_ram=self.ram_profile)
+        elif self.ram_profile:
+            profile_path = self.session_manager.stage_in_ram()
+        else:
+            profile_path = self.session_manager.get_profile_path()
+        
+        # Configurar Chrome (guardado para reciclar o navegador com o mesmo perfil e proxy)
+        self.chrome_config = ChromeConfig(
+            headless=self.headless,
+            profile_path=profile_path,
+            proxy=self.current_proxy,
+            capture_network=self.capture_network,
+            block_profile=self.block_profile,
+            preset=self.preset,
+            cookie_jar=str(self.session_manager.jar_path) if self.use_cookie_jar else None
+        )
+        
+        # Criar driver (supervisionado: self.driver continua válido após reinícios)
+        self.supervisor = DriverSupervisor(
+            self.chrome_config.create_driver,
+            timeouts={'get': 75},
+            on_restart=self._on_driver_started
+        )
+        try:
+            self.supervisor.start()
+        except Exception as e:
+            # stop() não vai rodar sem driver: não deixar a cópia do perfil para trás
+            self._release_profile_copy()
+            # Binário ausente, versão do chromedriver, perfil travado: não são do proxy
+            if self._is_proxy_error(e):
+                self._report_proxy(False)
+            raise
+        self.driver = self.supervisor.driver
+        self._on_driver_started()
         
         print("\n✅ Navegador iniciado!")
         return True
     
+    def _start_on_daemon(self) -> bool:
+        """Conecta a uma aba própria do Chrome persistente (BrowserDaemon)"""
+        if not self.daemon.start():
+            return False
+        
+        self.chrome_config = ChromeConfig(
+            capture_network=self.capture_network,
+            block_profile=self.block_profile,
+            debugger_address=self.daemon.address
+        )
+        
+        self.supervisor = DriverSupervisor(
+            self._attach_to_daemon,
+            timeouts={'get': 75},
+            on_restart=self._on_driver_started,
+            release_driver=self._release_tab
+        )
+        self.supervisor.start()
+        self.driver = self.supervisor.driver
+        self._on_driver_started()
+        
+        print("\n✅ Conectado ao daemon do navegador!")
+        return True
+    
+    def _attach_to_daemon(self):
+        """Reserva uma aba nova no daemon e conecta o driver a ela"""
+        # Após um travamento a aba anterior pode ter ficado reservada
+        self._release_tab()
+        
+        # O supervisor mata o Chrome do daemon quando ele trava: reabrir
+        if not self.daemon.is_running() and not self.daemon.start():
+            raise RuntimeError("Daemon do navegador não reiniciou")
+        
+        self.tab_lease = self.daemon.acquire_tab()
+        self.chrome_config.attach_target = self.tab_lease.target_id
+        return self.chrome_config.create_driver()
+    
+    def _release_tab(self, driver=None):
+        """Fecha a aba do job e desconecta o driver, mantendo o Chrome do daemon aberto"""
+        if self.tab_lease:
+            self.tab_lease.release(driver)
+            self.tab_lease = None
+    
+    def _poll_traffic(self):
+        """Lê os eventos de rede pendentes no contador de tráfego"""
+        if self.network_capture:
+            self.network_capture.poll()
+        elif self.block_profile:
+            self.traffic.poll(self.driver)  # Sem captura: direto do log de performance
+    
+    def _on_driver_started(self):
+        """Prepara recursos ligados ao navegador (após iniciar ou reiniciar)"""
+        if self.capture_network:
+            self.network_capture = NetworkCapture(self.driver, SEARCH_URL_PATTERNS)
+            self.network_capture.add_listener(self.traffic)
+    
+    def restart_browser(self):
+        """
+        Fecha e reabre o Chrome com o mesmo perfil (sessão) e proxy
+        
+        Libera toda a memória acumulada pelo navegador sem interromper o job.
+        """
+        print("\n♻️ Reiniciando navegador...")
+        
+        try:
+            self._poll_traffic()  # Contabilizar o tráfego pendente
+        except Exception:
+            pass
+        
+        self.supervisor.restart()
+        self.watchdog.mark_recycled()
+        print("✅ Navegador reiniciado")
+    
+    def _check_memory(self) -> bool:
+        """
+        Consulta o watchdog após uma página e recicla o navegador se necessário
+        
+        Returns:
+            True se o navegador foi reiniciado
+        """
+        if self.watchdog.after_page(self.driver) == ACTION_RECYCLE:
+            self.restart_browser()
+            return True
+        return False
+    
     def stop(self):
         """Fecha o navegador"""
+        if self.http_client:
+            print(f"⚡ Busca HTTP: {self.http_client.requests} requisições")
+            self.http_client.close()
+            self.http_client = None
+        
         if self.driver:
+            if self.network_capture or self.block_profile:
+                try:
+                    self._poll_traffic()
+                    self.traffic.print_summary()
+                except Exception as e:
+                    print(f"⚠️ Não foi possível ler o tráfego: {e}")
+            
+            if self.watchdog:
+                stats = self.watchdog.get_stats()
+                print(f"🧠 Memória: pico {stats['peak_rss_mb']} MB | "
+                      f"{stats['recycles']} reciclagens | {stats['cache_clears']} limpezas")
+            
             print("\n🔴 Fechando navegador...")
-            self.driver.quit()
+            self.supervisor.quit()
             print("✅ Navegador fechado")
+            
+            self._release_profile_copy()
+        
+        if self.proxy_lease:
+            self.proxy_lease.release()
+            self.proxy_lease = None
+        if self.proxy_manager:
+            self.proxy_manager.save_state()
+        self._release_account()
+    
+    def _release_profile_copy(self):
+        """Remove a cópia do worker ou salva e remove o perfil em memória (Chrome já fechado)"""
+        # Jar e daemon não usam cópias locais do perfil
+        if self.use_cookie_jar or self.daemon:
+            return
+        if self.worker_id is not None:
+            self.session_manager.remove_clone(self.worker_id)
+        elif self.ram_profile:
+            self.session_manager.sync_back()
     
     def random_delay(self, min_sec: float = 1.0, max_sec: float = 3.0):
         """Delay aleatório para parecer mais humano"""
@@ -103,8 +523,17 @@ class LinkedInScraper:
     
     def navigate_to_linkedin(self):
         """Navega para o LinkedIn"""
+        if self.replay or not self.driver:
+            return
+        
         print("\n🌐 Navegando para LinkedIn...")
-        self.driver.get("https://www.linkedin.com/feed/")
+        try:
+            self.supervisor.run_step(lambda: self.driver.get(LINKEDIN_FEED_URL))
+        except Exception as e:
+            # Primeira navegação: é aqui que um proxy fora do ar aparece
+            if self._is_proxy_error(e):
+                self._report_proxy(False)
+            raise
         self.random_delay(2, 4)
     
     def check_login_status(self) -> bool:
@@ -114,10 +543,17 @@ class LinkedInScraper:
         Returns:
             True se está logado, False caso contrário
         """
+        if self.replay or not self.driver:
+            return True  # Sem navegador (replay ou busca HTTP)
+        
         try:
             # Tentar encontrar elementos que só aparecem quando logado
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, "global-nav"))
+            # (após um reinício do navegador, voltar ao feed antes de repetir)
+            self.supervisor.run_step(
+                lambda: WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.ID, "global-nav"))
+                ),
+                checkpoint=lambda: self.driver.get(LINKEDIN_FEED_URL)
             )
             print("✅ Login verificado - Você está logado!")
             return True
@@ -125,60 +561,386 @@ class LinkedInScraper:
             print("❌ Não está logado. Execute o setup da sessão primeiro.")
             return False
     
-    def search_people(self, query: str, max_results: int = 10):
+    def search_people(self, query: str, max_results: int = 10, max_pages: int = 10,
+                      start_page: int = 1):
         """
-        Busca pessoas no LinkedIn e coleta nomes
+        Busca pessoas no LinkedIn e coleta nomes (percorrendo várias páginas)
+        
+        Para quando:
+        - max_results nomes novos foram coletados
+        - max_pages páginas foram lidas
+        - uma página não traz nenhum nome novo
+        - não existe próxima página
         
         Args:
             query: Termo de busca
             max_results: Máximo de resultados
+            max_pages: Máximo de páginas de resultados a percorrer
+            start_page: Primeira página (retomada de uma busca interrompida)
+        
+        Returns:
+            int: Quantidade de nomes novos coletados
         """
+        if self.replay:
+            return self._replay_search(query, max_results, max_pages)
+        
+        count = 0
+        first_page = self.next_page = start_page
+        total_before = len(self.collected_names)
+        
+        if self.http_client:
+            try:
+                count = self._http_search(query, max_results, max_pages, start_page)
+                self._report_proxy(True)
+                return count
+            except HttpSearchError as e:
+                # Só falhas de conexão contam contra o proxy (401/999 são da conta)
+                if isinstance(e.__cause__, (requests.ConnectionError, requests.Timeout)):
+                    self._report_proxy(False)
+                
+                # Páginas já baixadas (e descontadas da cota) não são descartadas
+                count = self._add_people(e.people, max_results)
+                first_page = self.next_page = e.next_page
+                
+                if self.account:
+                    # Bloqueio ou sessão recusada: pausar a conta em vez de insistir pelo navegador
+                    self._pause_account(str(e))
+                    return count
+                if count >= max_results:
+                    return count
+                print(f"⚠️ Busca HTTP falhou: {e} - continuando pelo navegador a partir da página {first_page}")
+                self.http_client.close()
+                self.http_client = None
+                if not self._launch_browser():
+                    return count
+                self.navigate_to_linkedin()
+        
         try:
             print(f"\n🔍 Buscando: {query}")
             
-            # Ir para busca
-            search_url = f"https://www.linkedin.com/search/results/people/?keywords={query}"
-            self.driver.get(search_url)
-            self.random_delay(3, 5)
+            # Ir para busca (primeira página, ou a que falhou na busca HTTP)
+            self.supervisor.run_step(lambda: self._open_search_page(query, first_page))
+            
+            for page in range(first_page, max_pages + 1):
+                if not self._consume_search():
+                    break
+                self._renew_proxy_lease()
+                
+                # Se o navegador travar, reabre a página atual (checkpoint) e repete
+                new_on_page = self.supervisor.run_step(
+                    lambda: self._collect_page(query, page, max_results - count),
+                    checkpoint=lambda: self._open_search_page(query, page)
+                )
+                # Contar pelo total (inclui nomes coletados antes de um travamento)
+                count = len(self.collected_names) - total_before
+                
+                if count >= max_results:
+                    break
+                
+                if new_on_page == 0:
+                    print("⚠️ Nenhum nome novo nesta página. Encerrando busca.")
+                    break
+                
+                if page == max_pages:
+                    print(f"⚠️ Limite de {max_pages} páginas atingido.")
+                    break
+                
+                if not self.supervisor.run_step(lambda: self._advance_page(query, page + 1)):
+                    print("✅ Não há mais páginas.")
+                    break
+                
+                self.random_delay(2, 4)
+            
+            print(f"\n✅ Total coletado nesta busca: {count}")
+            return count
             
+        except Exception as e:
+            print(f"❌ Erro na busca: {e}")
+            return count
+    
+    def _http_search(self, query: str, max_results: int, max_pages: int, start_page: int = 1) -> int:
+        """
+        Busca pessoas pela API JSON, sem navegador
+        
+        Raises:
+            HttpSearchError: se a sessão for recusada (o chamador usa o navegador)
+        """
+        print(f"\n🔍 Buscando via HTTP: {query}")
+        
+        def before_page(page: int) -> bool:
+            if page > start_page:
+                self.random_delay(1, 2)
+            if not self._consume_search():
+                return False
+            self._renew_proxy_lease()
+            return True
+        
+        # O cliente controla a paginação e as condições de parada
+        people = self.http_client.search_people(
+            query,
+            max_results=max_results,
+            max_pages=max_pages,
+            before_page=before_page,
+            seen={person['profile_url'] for person in self.collected_people},
+            start_page=start_page
+        )
+        count = self._add_people(people, max_results)
+        
+        print(f"\n✅ Total coletado nesta busca: {count}")
+        return count
+    
+    def _open_search_page(self, query: str, page: int):
+        """Carrega uma página de resultados pela URL (início da busca ou checkpoint)"""
+        # Descartar respostas de navegações anteriores
+        if self.network_capture:
+            self.network_capture.clear()
+        
+        self.driver.get(self._build_search_url(query, page))
+        self.random_delay(3, 5)
+    
+    def _collect_page(self, query: str, page: int, limit: int) -> int:
+        """
+        Coleta as pessoas da página de resultados atual
+        
+        Args:
+            query: Termo de busca
+            page: Número da página atual
+            limit: Máximo de pessoas novas a coletar
+        
+        Returns:
+            int: Quantidade de pessoas novas coletadas
+        """
+        new_on_page = 0
+        responses = []
+        
+        # Ler resultados direto das respostas JSON (sem esperar renderização)
+        if self.network_capture:
+            # Sem JSON de busca até a página terminar de carregar: ir logo para o DOM
+            responses = self.network_capture.wait_for_responses(timeout=15, until_loaded=True)
+            new_on_page = self._collect_people(responses, limit)
+        
+        if not new_on_page:
             # Aguardar resultados carregarem
             WebDriverWait(self.driver, 15).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".search-results-container"))
             )
             
-            print("✅ Resultados carregados")
+            print(f"\n✅ Página {page} carregada\n")
+            
+            # Rolar e coletar incrementalmente até o limite ou o fim da página
+            new_on_page = self._collect_names(limit)
+        
+        # Guardar a página para re-parsing offline
+        if self.snapshots:
+            self.snapshots.save(
+                self._build_search_url(query, page),
+                self.driver.page_source,
+                captured=responses
+            )
+        
+        # Sem captura, o log de performance só é lido aqui: esvaziar a cada
+        # página (senão cresce dentro do chromedriver até o stop)
+        if not self.network_capture:
+            try:
+                self._poll_traffic()
+            except Exception as e:
+                print(f"⚠️ Não foi possível ler o tráfego: {e}")
+        
+        return new_on_page
+    
+    def _advance_page(self, query: str, page: int) -> bool:
+        """
+        Avança para a próxima página de resultados
+        
+        Returns:
+            True se navegou, False se não há próxima página
+        """
+        # Navegador reiniciado: ir direto para a URL da próxima página
+        if self._check_memory():
+            self._open_search_page(query, page)
+            return True
+        
+        return self._go_to_next_page(query, page)
+    
+    def _build_search_url(self, query: str, page: int = 1) -> str:
+        """Monta a URL de busca de pessoas (com página opcional)"""
+        url = f"https://www.linkedin.com/search/results/people/?keywords={quote_plus(query)}"
+        if page > 1:
+            url += f"&page={page}"
+        return url
+    
+    def _replay_search(self, query: str, max_results: int, max_pages: int) -> int:
+        """
+        Executa a extração da busca sobre os snapshots salvos
+        
+        Usa o mesmo parsing da busca ao vivo: primeiro o JSON capturado,
+        depois o HTML (seletor de nomes).
+        
+        Returns:
+            int: Quantidade de nomes novos coletados
+        """
+        print(f"\n⏪ Replay da busca: {query}")
+        count = 0
+        
+        for page in range(1, max_pages + 1):
+            url = self._build_search_url(query, page)
+            snapshot = self.snapshots.latest(url)
             
-            # Scroll para carregar mais resultados
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            self.random_delay(1, 2)
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            self.random_delay(2, 3)
+            if not snapshot:
+                print(f"⚠️ Nenhum snapshot da página {page}")
+                break
             
-            # Coletar nomes
-            results = self.driver.find_elements(By.CSS_SELECTOR, ".entity-result__title-text a span[aria-hidden='true']")
+            print(f"\n📄 Página {page} (snapshot de {snapshot['timestamp']})")
             
-            print(f"\n📋 Encontrados {len(results)} resultados na página:\n")
+            new_on_page = self._collect_people(snapshot['captured'], max_results - count)
             
-            count = 0
-            for result in results:
-                if count >= max_results:
-                    break
-                    
-                try:
-                    name = result.text.strip()
+            if not new_on_page:
+                html_page = HtmlPage(url, snapshot['html'])
+                names = [html_page.text_of(e) for e in html_page.find_all('css selector', RESULT_NAME_SELECTOR)]
+                
+                for name in names:
+                    if new_on_page >= max_results - count:
+                        break
                     if name and name not in self.collected_names:
                         print(f"👤 Coletado: {name}")
                         self.collected_names.append(name)
-                        count += 1
-                except:
-                    continue
+                        new_on_page += 1
             
-            print(f"\n✅ Total coletado nesta busca: {count}")
-            return count
+            count += new_on_page
+            if count >= max_results or not new_on_page:
+                break
+        
+        print(f"\n✅ Total coletado no replay: {count}")
+        return count
+    
+    def _collect_people(self, responses: list, limit: int) -> int:
+        """
+        Coleta pessoas das respostas JSON capturadas da busca
+        
+        Args:
+            responses: Respostas capturadas (dicts com 'url' e 'data')
+            limit: Máximo de pessoas novas a coletar
+        
+        Returns:
+            int: Quantidade de pessoas novas coletadas
+        """
+        people = [person for response in responses for person in parse_people(response['data'])]
+        count = self._add_people(people, limit)
+        
+        if responses:
+            print(f"📡 {count} pessoas lidas de {len(responses)} respostas JSON")
+        
+        return count
+    
+    @staticmethod
+    def _person_key(person: dict) -> str:
+        """Identificador de uma pessoa coletada (URL do perfil ou, sem ela, o nome)"""
+        return person.get('profile_url') or person['name']
+    
+    def _add_people(self, people: list, limit: int) -> int:
+        """
+        Adiciona pessoas ainda não coletadas
+        
+        A chave é a URL do perfil (a mesma da busca HTTP), para não descartar
+        pessoas diferentes com o mesmo nome; sem URL, vale o nome.
+        
+        Args:
+            people: Dicts de parse_people
+            limit: Máximo de pessoas novas a adicionar
+        
+        Returns:
+            int: Quantidade de pessoas novas adicionadas
+        """
+        collected = {self._person_key(p) for p in self.collected_people}
+        collected.update(self.collected_names)
+        
+        count = 0
+        for person in people:
+            if count >= limit:
+                break
             
-        except Exception as e:
-            print(f"❌ Erro na busca: {e}")
-            return 0
+            key = self._person_key(person)
+            if key in collected:
+                continue
+            collected.add(key)
+            
+            print(f"👤 Coletado: {person['name']} | {person['headline']} | {person['location']}")
+            self.collected_names.append(person['name'])
+            self.collected_people.append(person)
+            count += 1
+        
+        return count
+    
+    def _collect_names(self, limit: int) -> int:
+        """
+        Coleta os nomes da página atual, rolando a página aos poucos
+        
+        Args:
+            limit: Máximo de nomes novos a coletar
+        
+        Returns:
+            int: Quantidade de nomes novos coletados
+        """
+        harvester = ScrollHarvester(
+            self.driver,
+            extract=self._extract_names,
+            scroll_step=0.8,
+            pause=(1.0, 2.0)
+        )
+        
+        names = harvester.harvest(
+            max_results=limit,
+            seen=self.collected_names,
+            on_item=lambda name: print(f"👤 Coletado: {name}")
+        )
+        
+        self.collected_names.extend(names)
+        return len(names)
+    
+    def _extract_names(self, driver) -> list:
+        """Lê todos os nomes visíveis em uma única chamada ao navegador"""
+        names = driver.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0]))"
+            ".map(e => (e.innerText || '').trim());",
+            RESULT_NAME_SELECTOR
+        ) or []
+        return [name for name in names if name]
+    
+    def _go_to_next_page(self, query: str, page: int) -> bool:
+        """
+        Vai para a próxima página de resultados
+        
+        Clica no botão "Avançar" (navegação interna, sem recarregar a página
+        inteira). Sem botão (ou desabilitado) não há próxima página; se o clique
+        não mudar a lista, carrega a URL com &page=N.
+        
+        Args:
+            query: Termo de busca
+            page: Número da página de destino
+        
+        Returns:
+            True se navegou, False se não há próxima página
+        """
+        buttons = self.driver.find_elements(By.CSS_SELECTOR, NEXT_PAGE_SELECTOR)
+        if not buttons or not buttons[0].is_enabled():
+            return False
+        
+        # Referência a um resultado atual para saber quando a lista mudou
+        current = self.driver.find_elements(By.CSS_SELECTOR, RESULT_NAME_SELECTOR)
+        
+        self.driver.execute_script("arguments[0].click();", buttons[0])
+        
+        if not current:
+            return True
+        try:
+            WebDriverWait(self.driver, 15).until(EC.staleness_of(current[0]))
+            return True
+        except TimeoutException:
+            print("⚠️ Página não mudou após clique. Recarregando via URL...")
+        
+        # Fallback: navegação completa pela URL
+        self.driver.get(self._build_search_url(query, page))
+        return True
     
     def enrich_data(self):
         """
@@ -194,6 +956,65 @@ class LinkedInScraper:
         enrich_and_save(self.collected_names)
 
 
+def search_across_accounts(queries: list, pool: AccountPool, max_results: int = 10,
+                           **scraper_options) -> dict:
+    """
+    Distribui as buscas entre as contas do pool (uma conta reservada por busca)
+    
+    Args:
+        queries: Termos de busca
+        pool: Pool de contas
+        max_results: Máximo de resultados por busca
+        **scraper_options: Demais argumentos do LinkedInScraper (ex: headless=True)
+    
+    Returns:
+        Dict {termo: lista de nomes coletados}
+    """
+    results = {}
+    
+    for query in queries:
+        # Pessoas já coletadas e página de retomada passam de uma conta para a
+        # seguinte: a próxima conta não gasta cota relendo as mesmas páginas
+        names, people = [], []
+        next_page = 1
+        
+        # Contas com sessão inválida ou bloqueadas durante a busca entram em
+        # cooldown e o termo continua na próxima conta
+        while True:
+            scraper = LinkedInScraper(account_pool=pool, **scraper_options)
+            scraper.collected_names = list(names)
+            scraper.collected_people = list(people)
+            try:
+                if not scraper.start():
+                    if scraper.account and scraper.account_paused:
+                        continue  # Problema da conta: tentar a próxima
+                    # Sem conta disponível ou falha que se repetiria em qualquer
+                    # conta (ex: daemon fora do ar)
+                    if names:
+                        results[query] = names
+                    return results
+                
+                scraper.navigate_to_linkedin()
+                if not scraper.check_login_status():
+                    scraper._pause_account("login não verificado")
+                    continue
+                
+                scraper.search_people(
+                    query, max_results=max_results - len(names), start_page=next_page
+                )
+                names, people = scraper.collected_names, scraper.collected_people
+                next_page = scraper.next_page
+                if scraper.account_paused and len(names) < max_results:
+                    continue
+                
+                results[query] = names
+                break
+            finally:
+                scraper.stop()
+    
+    return results
+
+
 def main():
     """Função principal"""
     print("""
@@ -205,7 +1026,9 @@ def main():
     # Criar scraper
     scraper = LinkedInScraper(
         headless=False,  # True para modo headless, False para ver o navegador
-        use_proxy=True   # True para usar proxy, False para não usar
+        use_proxy=True,  # True para usar proxy, False para não usar
+        capture_network=True,  # Resultados direto das respostas JSON da busca
+        block_profile="linkedin"  # Bloqueia mídia, fontes e rastreadores (economiza proxy)
     )
     
     try:
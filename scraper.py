@@ -1,12 +1,32 @@
 """
 Exemplo de Web Scraper usando Selenium
+
+Backends disponíveis:
+- "browser": Chrome via Selenium (padrão)
+- "http": cliente HTTP + lxml, sem navegador (páginas estáticas)
+- "auto": tenta HTTP e abre o navegador apenas se a página precisar de JavaScript
+
+Para muitas páginas com JavaScript em paralelo, ver selenium_linkedin.scrape_backends
+(Selenium ou Playwright assíncrono, mesma extração declarativa).
+
+Com snapshot_dir, cada página visitada é salva; com replay=True as páginas
+são lidas desses snapshots (útil para testar seletores sem acessar o site).
 """
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+import asyncio
+import json
 import time
-from config import get_driver
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+from config import SeleniumConfig
+from selenium_linkedin import ScrollHarvester, TabPool, TabPrefetcher, ACTION_RECYCLE, TrafficCounter
+from selenium_linkedin.http_backend import HttpFetcher, HtmlPage, parse_field_spec
+from selenium_linkedin.snapshot_store import SnapshotStore
+from selenium_linkedin.scrape_backends import BACKENDS, EXTRACT_MANY_JS, get_backend
+from selenium_linkedin.screenshot_writer import ScreenshotWriter
 
 
 class WebScraper:
@@ -14,38 +34,202 @@ class WebScraper:
     Classe para realizar web scraping com Selenium
     """
     
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, block_profile=None, backend="browser", snapshot_dir=None, replay=False,
+                 watchdog=None, preset=None, screenshots=None):
         """
         Inicializa o scraper
         
         Args:
             headless (bool): Se True, executa sem abrir janela do navegador
+            block_profile (str): Perfil de bloqueio de requisições (ex: "lean")
+            backend (str): "browser", "http", "auto" (HTTP com fallback para o navegador)
+                           ou um backend assíncrono ("selenium", "playwright")
+            snapshot_dir (str): Se definido, salva um snapshot de cada página visitada
+            replay (bool): Se True, lê as páginas dos snapshots (sem navegador nem rede)
+            watchdog (MemoryWatchdog): Se definido, limpa caches/recicla o Chrome por memória
+            preset (str): Preset de inicialização do Chrome (ex: "lean-headless")
+            screenshots (ScreenshotWriter): Gravador de screenshots (padrão: JPEG em screenshots/)
         """
+        if replay and not snapshot_dir:
+            raise ValueError("Modo replay requer snapshot_dir")
+        
+        if backend not in ("browser", "http", "auto", *BACKENDS):
+            raise ValueError(f"Backend inválido: {backend}")
+        
         self.headless = headless
+        self.block_profile = block_profile
+        # Bytes e bloqueios da execução (perfil de bloqueio no navegador)
+        self.traffic = TrafficCounter() if block_profile else None
+        self.backend = backend
         self.driver = None
+        # Configuração do Chrome (reaplicada nas abas novas de TabPool/TabPrefetcher)
+        self.selenium_config = None
+        self.watchdog = watchdog
+        self.preset = preset
+        
+        # Screenshots via CDP, gravados em segundo plano
+        self.screenshots = screenshots
+        
+        # Backend HTTP: cliente com pool e página estática atual
+        self.http = None
+        self.page = None
+        
+        # Backend assíncrono (scrape_backends) rodando em um event loop próprio
+        self.async_backend = None
+        self._loop = None
+        
+        # Snapshots para re-parsing offline
+        self.replay = replay
+        self.snapshots = SnapshotStore(snapshot_dir) if snapshot_dir else None
     
     def start(self):
-        """Inicializa o driver do Selenium"""
+        """Inicializa o driver do Selenium (ou o cliente HTTP)"""
+        if self.replay:
+            print(f"⏪ Modo replay: lendo páginas de {self.snapshots.root}")
+            return
+        
+        if self.backend in ("http", "auto"):
+            self.http = HttpFetcher()
+            print(f"⚡ Backend HTTP iniciado{' (navegador sob demanda)' if self.backend == 'auto' else ''}")
+            return
+        
+        if self.backend in BACKENDS:
+            self._start_async_backend()
+            return
+        
+        self._start_browser()
+    
+    def _start_async_backend(self):
+        """Abre o backend assíncrono (selenium/playwright) em um event loop próprio"""
+        options = {'headless': self.headless, 'block_profile': self.block_profile}
+        if self.backend == "selenium":
+            options['preset'] = self.preset
+        
+        backend = get_backend(self.backend, **options)
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(backend.start())
+        except Exception:
+            self._loop.close()
+            self._loop = None
+            raise
+        self.async_backend = backend
+        print(f"⚡ Backend '{self.backend}' iniciado")
+    
+    def _run_async(self, coroutine):
+        """Executa uma corrotina do backend assíncrono e retorna o resultado"""
+        return self._loop.run_until_complete(coroutine)
+    
+    def _start_browser(self):
+        """Abre o Chrome (no modo "auto" só é chamado quando necessário)"""
         print(f"🚀 Iniciando navegador {'(modo headless)' if self.headless else '(modo visual)'}...")
-        self.driver = get_driver(headless=self.headless)
+        self.selenium_config = SeleniumConfig(
+            headless=self.headless, block_profile=self.block_profile, preset=self.preset
+        )
+        self.driver = self.selenium_config.create_driver()
         print("✅ Navegador iniciado com sucesso!")
     
+    def _poll_traffic(self):
+        """Contabiliza o tráfego do navegador desde a última leitura"""
+        if self.traffic and self.driver:
+            try:
+                self.traffic.poll(self.driver)
+            except Exception as e:
+                print(f"⚠️ Não foi possível ler o tráfego: {e}")
+    
     def stop(self):
         """Fecha o driver do Selenium"""
+        if self.screenshots:
+            self.screenshots.close()  # Grava os screenshots pendentes
+        
+        if self.http:
+            self.http.close()
+            self.http = None
+        
+        if self.async_backend:
+            self._run_async(self.async_backend.stop())
+            self._loop.close()
+            self.async_backend = self._loop = None
+        
         if self.driver:
+            if self.traffic:
+                self._poll_traffic()
+                self.traffic.print_summary()
             self.driver.quit()
             print("🔴 Navegador fechado.")
     
-    def navigate_to(self, url):
+    def restart_browser(self):
+        """Fecha e reabre o Chrome com a mesma configuração (libera memória)"""
+        print("♻️ Reiniciando navegador...")
+        self._poll_traffic()
+        try:
+            self.driver.quit()
+        except Exception as e:
+            print(f"⚠️ Erro ao fechar navegador: {e}")
+        
+        self._start_browser()
+        if self.watchdog:
+            self.watchdog.mark_recycled()
+    
+    def _static(self):
+        """True se a página atual veio do backend HTTP ou de um snapshot (sem navegador)"""
+        return (self.page is not None or self.replay or self.async_backend is not None
+                or (self.http is not None and self.driver is None))
+    
+    def navigate_to(self, url, require_selector=None):
         """
         Navega para uma URL
         
         Args:
             url (str): URL de destino
+            require_selector (str): No modo "auto", seletor CSS que precisa existir
+                                    no HTML estático para dispensar o navegador
+                                    (backends assíncronos: seletor esperado antes de ler a página)
         """
+        if self.replay:
+            snapshot = self.snapshots.latest(url)
+            if snapshot:
+                print(f"⏪ Snapshot de {snapshot['timestamp']}: {url}")
+                self.page = HtmlPage(url, snapshot['html'])
+            else:
+                print(f"⚠️ Nenhum snapshot para: {url}")
+                self.page = None
+            return
+        
         print(f"🌐 Navegando para: {url}")
+        
+        if self.async_backend:
+            self.page = self._run_async(self.async_backend.get_page(url, require_selector))
+            if self.page and self.snapshots:
+                self.snapshots.save(url, self.page.html)
+            return
+        
+        if self.http:
+            page = self.http.fetch(url)
+            
+            if self.backend == "http" or (page and not page.needs_javascript(require_selector)):
+                self.page = page
+                if page and self.snapshots:
+                    # Chave = URL pedida (a mesma que o replay vai procurar)
+                    self.snapshots.save(url, page.html)
+                return
+            
+            print("🧩 Página precisa de JavaScript - usando navegador")
+            if not self.driver:
+                self._start_browser()
+        
+        self.page = None
+        
+        # Reciclar o navegador antes de carregar, se a memória passou do limite
+        if self.watchdog and self.watchdog.after_page(self.driver) == ACTION_RECYCLE:
+            self.restart_browser()
+        
         self.driver.get(url)
         time.sleep(2)  # Pequena pausa para carregar
+        self._poll_traffic()
+        
+        if self.snapshots:
+            self.snapshots.save(url, self.driver.page_source)
     
     def wait_for_element(self, by, value, timeout=10):
         """
@@ -57,8 +241,15 @@ class WebScraper:
             timeout: Tempo máximo de espera em segundos
         
         Returns:
-            WebElement ou None se não encontrado
+            WebElement (ou elemento lxml no modo HTTP) ou None se não encontrado
         """
+        if self._static():
+            # Página estática: o elemento já está (ou nunca estará) no HTML
+            element = self.page.find(by, value) if self.page else None
+            if element is None:
+                print(f"⚠️ Elemento não encontrado: {value}")
+            return element
+        
         try:
             element = WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_element_located((by, value))
@@ -79,6 +270,13 @@ class WebScraper:
         Returns:
             str: Texto do elemento ou None
         """
+        if self._static():
+            element = self.page.find(by, value) if self.page else None
+            if element is None:
+                print(f"⚠️ Elemento não encontrado: {value}")
+                return None
+            return self.page.text_of(element)
+        
         try:
             element = self.driver.find_element(by, value)
             return element.text
@@ -97,13 +295,90 @@ class WebScraper:
         Returns:
             list: Lista com textos dos elementos
         """
+        if self._static():
+            if not self.page:
+                return []
+            texts = [self.page.text_of(e) for e in self.page.find_all(by, value)]
+            return [text for text in texts if text]
+        
         try:
             elements = self.driver.find_elements(by, value)
-            return [elem.text for elem in elements if elem.text]
+            if not elements:
+                return []
+            # Lê todos os textos em uma única chamada ao navegador
+            texts = self.driver.execute_script(
+                "return arguments[0].map(e => (e.innerText || '').trim());",
+                elements
+            )
+            return [text for text in texts if text]
         except NoSuchElementException:
             print(f"⚠️ Elementos não encontrados: {value}")
             return []
     
+    def extract_many(self, container_selector, fields):
+        """
+        Extrai vários registros da página com uma única chamada ao navegador
+        
+        Args:
+            container_selector: Seletor CSS de cada item (ex: ".quote")
+            fields: Dict {campo: especificação} (ver parse_field_spec)
+        
+        Returns:
+            list: Lista de dicts, um por container encontrado
+        
+        Exemplo:
+            scraper.extract_many(".quote", {
+                "text": ".text",
+                "author": ".author",
+                "link": "a@href",
+                "tags": [".tag"],
+            })
+        """
+        if self._static():
+            return self.page.extract_many(container_selector, fields) if self.page else []
+        
+        field_list = [[name, *parse_field_spec(spec)] for name, spec in fields.items()]
+        
+        try:
+            raw = self.driver.execute_script(EXTRACT_MANY_JS, container_selector, field_list)
+            return json.loads(raw) if raw else []
+        except Exception as e:
+            print(f"❌ Erro ao extrair registros: {e}")
+            return []
+    
+    def harvest_scroll(self, container_selector, fields, max_results=None, key_field=None, **harvester_options):
+        """
+        Coleta registros de uma página com scroll infinito
+        
+        A cada passo de scroll extrai os registros novos (via extract_many),
+        ignora duplicados e para ao atingir max_results ou quando não aparece
+        mais conteúdo novo.
+        
+        Args:
+            container_selector: Seletor CSS de cada item
+            fields: Dict {campo: especificação} (ver parse_field_spec)
+            max_results: Máximo de registros (None = sem limite)
+            key_field: Campo usado para identificar duplicados (padrão: registro inteiro)
+            **harvester_options: Opções repassadas ao ScrollHarvester
+        
+        Returns:
+            list: Registros coletados
+        """
+        if self._static():
+            # Página estática não carrega mais conteúdo com scroll
+            records = self.extract_many(container_selector, fields)
+            return records[:max_results] if max_results else records
+        
+        harvester = ScrollHarvester(
+            self.driver,
+            extract=lambda driver: self.extract_many(container_selector, fields),
+            key=(lambda record: record.get(key_field)) if key_field else None,
+            **harvester_options
+        )
+        records = harvester.harvest(max_results=max_results)
+        print(f"📜 {len(records)} registros coletados com scroll")
+        return records
+    
     def click_element(self, by, value):
         """
         Clica em um elemento
@@ -112,6 +387,16 @@ class WebScraper:
             by: Tipo de seletor
             value: Valor do seletor
         """
+        if self._static():
+            # Modo HTTP: "clicar" em um link é navegar para o seu href
+            element = self.page.find(by, value) if self.page else None
+            href = element.get('href') if element is not None else None
+            if href:
+                self.navigate_to(urljoin(self.page.url, href))
+            else:
+                print(f"❌ Erro ao clicar: link não encontrado em {value} (modo HTTP)")
+            return
+        
         try:
             element = self.wait_for_element(by, value)
             if element:
@@ -130,6 +415,10 @@ class WebScraper:
             value: Valor do seletor
             text: Texto a ser digitado
         """
+        if self._static():
+            print(f"❌ Erro ao digitar: não suportado no modo HTTP ({value})")
+            return
+        
         try:
             element = self.wait_for_element(by, value)
             if element:
@@ -139,23 +428,200 @@ class WebScraper:
         except Exception as e:
             print(f"❌ Erro ao digitar: {e}")
     
-    def take_screenshot(self, filename="screenshot.png"):
+    def take_screenshot(self, filename=None, selector=None, quality=None, scale=None):
         """
-        Tira um screenshot da página
+        Tira um screenshot da página sem bloquear (gravação em segundo plano)
         
         Args:
-            filename: Nome do arquivo para salvar
+            filename: Nome do arquivo (.jpg, .webp ou .png); padrão: nome automático
+            selector: Seletor CSS para recortar apenas um elemento
+            quality: Qualidade JPEG/WebP (0-100)
+            scale: Escala da imagem (ex: 0.5)
+        
+        Returns:
+            Path do arquivo (gravado em segundo plano) ou None
         """
-        self.driver.save_screenshot(filename)
-        print(f"📸 Screenshot salvo: {filename}")
+        if self._static():
+            print("⚠️ Screenshot indisponível no modo HTTP")
+            return None
+        
+        if self.screenshots is None:
+            self.screenshots = ScreenshotWriter()
+        
+        try:
+            path = self.screenshots.capture(
+                self.driver, filename, selector=selector, quality=quality, scale=scale
+            )
+        except Exception as e:
+            print(f"❌ Erro ao tirar screenshot: {e}")
+            return None
+        
+        if path:
+            print(f"📸 Screenshot agendado: {path}")
+        return path
     
     def get_page_title(self):
         """Retorna o título da página"""
+        if self._static():
+            return self.page.title if self.page else ""
         return self.driver.title
     
     def get_current_url(self):
         """Retorna a URL atual"""
+        if self._static():
+            return self.page.url if self.page else ""
         return self.driver.current_url
+    
+    def extract_from_urls(self, urls, container_selector, fields, workers=16, wait_selector=None):
+        """
+        Extrai registros de várias páginas em paralelo (backend HTTP ou assíncrono)
+        
+        Args:
+            urls: Lista de URLs
+            container_selector: Seletor CSS de cada item
+            fields: Dict {campo: especificação} (ver parse_field_spec)
+            workers: Quantidade de downloads simultâneos (backend HTTP)
+            wait_selector: Seletor esperado antes da extração (backends assíncronos)
+        
+        Returns:
+            list: Registros de todas as páginas (na ordem das URLs)
+        """
+        if self.async_backend:
+            return self._run_async(self.async_backend.extract_from_urls(
+                urls, container_selector, fields, wait_selector
+            ))
+        
+        if not self.http:
+            raise RuntimeError("extract_from_urls requer backend 'http', 'auto', 'selenium' ou 'playwright'")
+        
+        records = []
+        for url, page in zip(urls, self.http.fetch_many(urls, workers=workers)):
+            if page is None:
+                print(f"⚠️ Página ignorada: {url}")
+                continue
+            records.extend(page.extract_many(container_selector, fields))
+        
+        print(f"⚡ {len(records)} registros extraídos de {len(urls)} páginas")
+        return records
+    
+    def paginate(self, container_selector, fields, next_selector, max_pages=10, page_timeout=30):
+        """
+        Percorre páginas seguindo o link "próxima", pré-carregando a página N+1
+        enquanto a página N é extraída
+        
+        Começa na página atual (chame navigate_to antes). No navegador, a próxima
+        página carrega em uma aba de fundo; no modo HTTP, em uma thread; com um
+        backend assíncrono, sem pré-carregamento.
+        
+        Args:
+            container_selector: Seletor CSS de cada item
+            fields: Dict {campo: especificação} (ver parse_field_spec)
+            next_selector: Seletor CSS do link para a próxima página (ex: ".next > a")
+            max_pages: Máximo de páginas
+            page_timeout: Tempo máximo de carregamento de cada página (segundos)
+        
+        Yields:
+            tuple: (número da página, registros da página)
+        """
+        prefetcher = None
+        executor = ThreadPoolExecutor(max_workers=1)
+        
+        try:
+            for page in range(1, max_pages + 1):
+                next_links = self.extract_many(next_selector, {"href": "@href"})
+                next_url = next_links[0]["href"] if next_links else None
+                has_next = bool(next_url) and page < max_pages
+                
+                # Começar a carregar a próxima página antes de extrair a atual
+                future = None
+                # (backends assíncronos carregam a próxima página só no navigate_to:
+                # o event loop não roda enquanto a página atual é extraída)
+                if has_next and not self.replay and not self.async_backend:
+                    if self._static():
+                        future = executor.submit(self.http.fetch, next_url)
+                    else:
+                        prefetcher = prefetcher or TabPrefetcher(
+                            self.driver, page_timeout=page_timeout,
+                            configure_tab=self.selenium_config.configure_tab
+                        )
+                        prefetcher.prefetch(next_url)
+                
+                yield page, self.extract_many(container_selector, fields)
+                
+                if not has_next:
+                    if not next_url:
+                        print("✅ Não há mais páginas.")
+                    break
+                
+                # Assumir a página pré-carregada (ou navegar normalmente)
+                if future:
+                    next_page = future.result()
+                    if next_page and (self.backend == "http" or not next_page.needs_javascript(container_selector)):
+                        print(f"⚡ Página pré-carregada: {next_url}")
+                        self.page = next_page
+                        if self.snapshots:
+                            self.snapshots.save(next_url, next_page.html)
+                        continue
+                elif prefetcher and prefetcher.take():
+                    print(f"⚡ Página pré-carregada: {next_url}")
+                    self.page = None
+                    if self.snapshots:
+                        self.snapshots.save(next_url, self.driver.page_source)
+                    continue
+                
+                self.navigate_to(next_url, require_selector=container_selector)
+        finally:
+            executor.shutdown(wait=False)
+            if prefetcher:
+                prefetcher.close()
+    
+    def extract_in_tabs(self, urls, container_selector, fields, tabs=4, page_timeout=30, max_pages_per_tab=50):
+        """
+        Carrega várias páginas ao mesmo tempo em abas do navegador e extrai registros
+        
+        Cada aba é extraída (via extract_many) assim que termina de carregar,
+        enquanto as outras continuam carregando.
+        
+        Args:
+            urls: Lista de URLs
+            container_selector: Seletor CSS de cada item
+            fields: Dict {campo: especificação} (ver parse_field_spec)
+            tabs: Quantidade de abas simultâneas
+            page_timeout: Tempo máximo de carregamento por página (segundos)
+            max_pages_per_tab: Páginas por aba antes de recriá-la
+        
+        Returns:
+            list: Registros de todas as páginas (na ordem das URLs)
+        """
+        if self.replay:
+            raise RuntimeError("extract_in_tabs não está disponível no modo replay")
+        
+        if not self.driver:
+            self._start_browser()
+        self.page = None
+        
+        field_list = [[name, *parse_field_spec(spec)] for name, spec in fields.items()]
+        
+        def extract(driver):
+            raw = driver.execute_script(EXTRACT_MANY_JS, container_selector, field_list)
+            html = driver.page_source if self.snapshots else None
+            return (json.loads(raw) if raw else []), html
+        
+        results = {}
+        with TabPool(self.driver, size=tabs, page_timeout=page_timeout,
+                     max_pages_per_tab=max_pages_per_tab,
+                     configure_tab=self.selenium_config.configure_tab) as pool:
+            for url, result, error in pool.map(urls, extract):
+                if error:
+                    print(f"⚠️ Falha em {url}: {error}")
+                    continue
+                records, html = result
+                if self.snapshots:
+                    self.snapshots.save(url, html)
+                print(f"🗂️ {len(records)} registros de {url}")
+                results[url] = records
+        
+        return [record for url in urls for record in results.get(url, [])]
 
 
 def exemplo_google_search():
@@ -195,7 +661,7 @@ def exemplo_google_search():
             print(f"{i}. {result}")
         
         # Tirar screenshot
-        scraper.take_screenshot("google_search.png")
+        scraper.take_screenshot("google_search.jpg")
         
         # Aguardar um pouco para visualizar
         time.sleep(3)
@@ -216,41 +682,37 @@ def exemplo_quotes_scraping():
     print("EXEMPLO 2: Scraping de Citações")
     print("="*60 + "\n")
     
-    # Criar scraper em modo headless (mais rápido)
-    scraper = WebScraper(headless=True)
+    # Página renderizada no servidor: backend HTTP, navegador só se precisar de JS
+    scraper = WebScraper(headless=True, block_profile="lean", backend="auto")
     
     try:
         # Iniciar navegador
         scraper.start()
         
         # Navegar para o site de exemplo
-        scraper.navigate_to("http://quotes.toscrape.com")
+        scraper.navigate_to("http://quotes.toscrape.com", require_selector=".quote")
         
         print(f"📄 Título: {scraper.get_page_title()}")
         
         # Aguardar as citações carregarem
         scraper.wait_for_element(By.CLASS_NAME, "quote")
         
-        # Pegar todas as citações da página
-        quotes = scraper.driver.find_elements(By.CLASS_NAME, "quote")
+        # Pegar todas as citações da página (uma única chamada ao navegador)
+        quotes = scraper.extract_many(".quote", {
+            "text": ".text",
+            "author": ".author",
+            "tags": [".tag"],
+        })
         
         print(f"\n📚 Encontradas {len(quotes)} citações:\n")
         
         for i, quote in enumerate(quotes, 1):
-            # Pegar o texto da citação
-            text = quote.find_element(By.CLASS_NAME, "text").text
-            # Pegar o autor
-            author = quote.find_element(By.CLASS_NAME, "author").text
-            # Pegar as tags
-            tags = quote.find_elements(By.CLASS_NAME, "tag")
-            tag_list = [tag.text for tag in tags]
-            
-            print(f"{i}. {text}")
-            print(f"   Autor: {author}")
-            print(f"   Tags: {', '.join(tag_list)}\n")
+            print(f"{i}. {quote['text']}")
+            print(f"   Autor: {quote['author']}")
+            print(f"   Tags: {', '.join(quote['tags'])}\n")
         
         # Tirar screenshot
-        scraper.take_screenshot("quotes_page.png")
+        scraper.take_screenshot("quotes_page.jpg")
         
     except Exception as e:
         print(f"❌ Erro durante scraping: {e}")
@@ -267,39 +729,25 @@ def exemplo_navegacao_multiplas_paginas():
     print("EXEMPLO 3: Navegação Entre Páginas")
     print("="*60 + "\n")
     
-    scraper = WebScraper(headless=True)
+    scraper = WebScraper(headless=True, block_profile="lean", backend="auto")
     
     try:
         scraper.start()
         
         # Navegar para a primeira página
-        scraper.navigate_to("http://quotes.toscrape.com")
+        scraper.navigate_to("http://quotes.toscrape.com", require_selector=".quote")
         
-        # Coletar citações de 3 páginas
+        # Coletar citações de 3 páginas (a próxima página carrega durante a extração)
         all_quotes = []
         
-        for page in range(1, 4):  # Páginas 1, 2 e 3
-            print(f"\n📄 Coletando dados da página {page}...")
-            
-            # Aguardar citações carregarem
-            scraper.wait_for_element(By.CLASS_NAME, "quote")
-            
-            # Pegar citações da página atual
-            quotes = scraper.driver.find_elements(By.CLASS_NAME, "quote")
-            
-            for quote in quotes:
-                text = quote.find_element(By.CLASS_NAME, "text").text
-                author = quote.find_element(By.CLASS_NAME, "author").text
-                all_quotes.append({"text": text, "author": author})
-            
-            # Tentar ir para próxima página
-            try:
-                next_button = scraper.driver.find_element(By.CSS_SELECTOR, ".next > a")
-                next_button.click()
-                time.sleep(2)
-            except NoSuchElementException:
-                print("✅ Não há mais páginas.")
-                break
+        pages = scraper.paginate(
+            ".quote", {"text": ".text", "author": ".author"},
+            next_selector=".next > a",
+            max_pages=3
+        )
+        for page, quotes in pages:
+            print(f"\n📄 Página {page}: {len(quotes)} citações")
+            all_quotes.extend(quotes)
         
         print(f"\n📊 Total de citações coletadas: {len(all_quotes)}")
         
@@ -315,6 +763,32 @@ def exemplo_navegacao_multiplas_paginas():
         scraper.stop()
 
 
+def exemplo_backend_assincrono(backend="playwright"):
+    """
+    Exemplo 4: Várias páginas em paralelo a partir de um único event loop
+    """
+    print("\n" + "="*60)
+    print(f"EXEMPLO 4: Backend Assíncrono ({backend})")
+    print("="*60 + "\n")
+    
+    urls = [f"http://quotes.toscrape.com/js/page/{n}/" for n in range(1, 6)]
+    
+    scraper = WebScraper(headless=True, block_profile="lean", backend=backend)
+    
+    try:
+        scraper.start()
+        quotes = scraper.extract_from_urls(
+            urls, ".quote", {"text": ".text", "author": ".author"}, wait_selector=".quote"
+        )
+        for i, quote in enumerate(quotes[:5], 1):
+            print(f"{i}. \"{quote['text']}\" - {quote['author']}")
+    except Exception as e:
+        print(f"❌ Erro durante scraping: {e}")
+    
+    finally:
+        scraper.stop()
+
+
 if __name__ == "__main__":
     """
     Executa os exemplos de scraping
@@ -336,6 +810,9 @@ if __name__ == "__main__":
     # Exemplo 3: Navegação entre múltiplas páginas
     # exemplo_navegacao_multiplas_paginas()
     
+    # Exemplo 4: Páginas com JavaScript em paralelo (Playwright assíncrono)
+    # exemplo_backend_assincrono()
+    
     print("\n✅ Scraping finalizado!")
     print("\n💡 Dica: Edite este arquivo e descomente os exemplos que deseja testar!")
 
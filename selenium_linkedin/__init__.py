@@ -6,11 +6,53 @@ Módulos disponíveis:
 - proxy_manager: Gerenciamento e rotação de proxies
 - session_manager: Gerenciamento de sessões persistentes do Chrome
 - chrome_config: Configurações do Selenium/Chrome
+- scroll_harvester: Coleta incremental em páginas com scroll infinito
+- network_capture: Captura de respostas JSON via CDP
+- linkedin_parser: Parser das respostas JSON de busca do LinkedIn
+- request_blocking: Perfis de bloqueio de requisições e contador de tráfego
+- http_backend: Cliente HTTP + parser lxml para páginas estáticas
+- snapshot_store: Cache de snapshots de páginas para re-parsing offline
+- tab_pool: Pool de abas para carregar várias páginas em paralelo
+- page_prefetcher: Pré-carregamento da próxima página em aba de fundo
+- memory_watchdog: Monitoramento de memória e reciclagem do Chrome
+- driver_supervisor: Prazos por comando e reinício do navegador travado
+- launch_presets: Presets de flags do Chrome (lean-headless, visual-debug)
+- browser_daemon: Chrome persistente com depuração remota e abas com lock
+- scrape_backends: Backends assíncronos (Selenium e Playwright) com a mesma API
+- screenshot_writer: Screenshots via CDP gravados em thread de fundo
+- cookie_jar: Exportação/injeção de cookies e local storage via CDP
+- linkedin_http: Busca de pessoas via API JSON com a sessão exportada (sem navegador)
+- file_lock: Lock de arquivo entre processos e escrita atômica de JSON
+- account_pool: Pool de contas com cotas diárias, cooldowns e proxy fixo
+- proxy_health: Verificação paralela de proxies (latência, sucesso, IP de saída)
+- proxy_registry: Registro persistente (SQLite) de saúde e geolocalização dos proxies
+- proxy_leases: Leases de proxy com prazo, exclusivos ou compartilhados, entre processos
 """
 
 from .proxy_manager import ProxyManager, ProxyRotation
 from .session_manager import SessionManager
 from .chrome_config import ChromeConfig
+from .scroll_harvester import ScrollHarvester
+from .network_capture import NetworkCapture
+from .linkedin_parser import parse_people, SEARCH_URL_PATTERNS
+from .request_blocking import BLOCKING_PROFILES, TrafficCounter, apply_blocking_profile
+from .http_backend import HttpFetcher, HtmlPage
+from .snapshot_store import SnapshotStore
+from .tab_pool import TabPool
+from .page_prefetcher import TabPrefetcher
+from .memory_watchdog import MemoryWatchdog, ACTION_OK, ACTION_CLEARED, ACTION_RECYCLE
+from .driver_supervisor import DriverSupervisor, DriverHungError
+from .launch_presets import LAUNCH_PRESETS
+from .browser_daemon import BrowserDaemon, TabLease
+from .scrape_backends import ScrapeBackend, SeleniumBackend, PlaywrightBackend, get_backend
+from .screenshot_writer import ScreenshotWriter
+from .cookie_jar import export_jar, load_jar, inject_jar
+from .linkedin_http import LinkedInHttpClient, HttpSearchError
+from .file_lock import FileLock
+from .account_pool import AccountPool, AccountLease
+from .proxy_health import ProxyHealthChecker
+from .proxy_registry import ProxyRegistry
+from .proxy_leases import ProxyLease, ProxyLeaseAllocator
 
 __version__ = "1.0.0"
 __all__ = [
@@ -18,6 +60,44 @@ __all__ = [
     'ProxyRotation',
     'SessionManager',
     'ChromeConfig',
+    'ScrollHarvester',
+    'NetworkCapture',
+    'parse_people',
+    'SEARCH_URL_PATTERNS',
+    'BLOCKING_PROFILES',
+    'TrafficCounter',
+    'apply_blocking_profile',
+    'HttpFetcher',
+    'HtmlPage',
+    'SnapshotStore',
+    'TabPool',
+    'TabPrefetcher',
+    'MemoryWatchdog',
+    'ACTION_OK',
+    'ACTION_CLEARED',
+    'ACTION_RECYCLE',
+    'DriverSupervisor',
+    'DriverHungError',
+    'LAUNCH_PRESETS',
+    'BrowserDaemon',
+    'TabLease',
+    'ScrapeBackend',
+    'SeleniumBackend',
+    'PlaywrightBackend',
+    'get_backend',
+    'ScreenshotWriter',
+    'export_jar',
+    'load_jar',
+    'inject_jar',
+    'LinkedInHttpClient',
+    'HttpSearchError',
+    'FileLock',
+    'AccountPool',
+    'AccountLease',
+    'ProxyHealthChecker',
+    'ProxyRegistry',
+    'ProxyLease',
+    'ProxyLeaseAllocator',
 ]
 
 
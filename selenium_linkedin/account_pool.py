@@ -0,0 +1,230 @@
+"""
+Pool de Contas do LinkedIn
+===========================
+
+Distribui as buscas entre vários perfis salvos (uma conta por perfil),
+com:
+- cota diária de buscas por conta
+- cooldown após bloqueios ou checkpoints
+- proxy fixo por conta (a conta sempre aparece com o mesmo IP)
+
+O estado fica em um arquivo JSON protegido por lock, compartilhado
+entre processos: scrapers paralelos recebem contas diferentes.
+
+Perfis: crie um por conta com SessionManager("linkedin-<nome>") e faça
+o login em cada um.
+"""
+
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import psutil
+
+from .file_lock import FileLock, read_json, write_json_atomic
+from .proxy_manager import ProxyManager
+
+
+class AccountLease:
+    """
+    Conta reservada para um scraper (devolver com AccountPool.release)
+    """
+
+    def __init__(self, profile_name: str, proxy: Optional[Dict[str, str]], remaining: int):
+        self.profile_name = profile_name
+        self.proxy = proxy
+        self.remaining = remaining
+
+
+class AccountPool:
+    """
+    Pool de contas com cotas diárias, cooldowns e proxy fixo por conta
+    """
+
+    def __init__(
+        self,
+        accounts: Optional[List[str]] = None,
+        daily_quota: int = 80,
+        quotas: Optional[Dict[str, int]] = None,
+        cooldown_minutes: float = 60,
+        proxy_manager: Optional[ProxyManager] = None,
+        state_file: str = "chrome_profiles/.accounts.json"
+    ):
+        """
+        Inicializa o pool
+
+        Args:
+            accounts: Nomes dos perfis (padrão: perfis "linkedin*" em chrome_profiles/)
+            daily_quota: Buscas (páginas de resultado) por conta por dia
+            quotas: Cotas específicas por conta (sobrescrevem daily_quota)
+            cooldown_minutes: Pausa padrão de uma conta após bloqueio
+            proxy_manager: Origem dos proxies fixos (None = contas sem proxy)
+            state_file: Arquivo de estado compartilhado entre processos
+        """
+        self.accounts = accounts if accounts is not None else self._discover_accounts()
+        if not self.accounts:
+            raise ValueError("Nenhuma conta no pool (crie perfis com make session)")
+
+        self.daily_quota = daily_quota
+        self.quotas = quotas or {}
+        self.cooldown_minutes = cooldown_minutes
+        self.proxy_manager = proxy_manager
+        self.state_file = state_file
+        self.lock = FileLock(f"{state_file}.lock")
+
+    @staticmethod
+    def _discover_accounts(profiles_dir: str = "chrome_profiles") -> List[str]:
+        """Perfis salvos cujo nome começa com "linkedin" """
+        root = Path(profiles_dir)
+        if not root.exists():
+            return []
+        return sorted(p.name for p in root.iterdir() if p.is_dir() and p.name.startswith('linkedin'))
+
+    def quota_for(self, profile_name: str) -> int:
+        """Cota diária da conta"""
+        return self.quotas.get(profile_name, self.daily_quota)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Lê o estado e zera os contadores das contas em um novo dia (chamar com o lock)"""
+        state = read_json(self.state_file, {})
+        today = date.today().isoformat()
+
+        for account in self.accounts:
+            entry = state.setdefault(account, {})
+            if entry.get('day') != today:
+                entry['day'] = today
+                entry['searches'] = 0
+            entry.setdefault('cooldown_until', 0)
+            entry.setdefault('proxy', None)
+            entry.setdefault('owner_pid', None)
+            entry.setdefault('last_used', 0)
+        return state
+
+    def _is_available(self, account: str, entry: Dict[str, Any], now: float) -> bool:
+        """Conta livre, fora de cooldown e com cota"""
+        owner = entry.get('owner_pid')
+        if owner and psutil.pid_exists(owner):
+            return False
+        if entry['cooldown_until'] > now:
+            return False
+        return entry['searches'] < self.quota_for(account)
+
+    def _assign_proxy(self, account: str, state: Dict[str, Dict[str, Any]]) -> Optional[str]:
+        """Escolhe o proxy fixo da conta (o menos compartilhado com outras contas)"""
+        if not self.proxy_manager or not self.proxy_manager.proxies:
+            return None
+
+        # Proxies mortos na última verificação ficam de fora (se houver alternativa)
+        candidates = [p for p in self.proxy_manager.proxies if not self.proxy_manager.health.is_dead(p)]
+        usage = {p['http']: 0 for p in candidates or self.proxy_manager.proxies}
+        for other, entry in state.items():
+            if other != account and entry.get('proxy') in usage:
+                usage[entry['proxy']] += 1
+
+        proxy = min(usage, key=lambda p: usage[p])
+        print(f"📌 Proxy fixo da conta {account}: {self.proxy_manager._get_proxy_display({'http': proxy})}")
+        return proxy
+
+    def _proxy_dict(self, proxy_str: Optional[str]) -> Optional[Dict[str, str]]:
+        """Converte o proxy salvo no estado para o dict do ProxyManager"""
+        if not proxy_str or not self.proxy_manager:
+            return None
+        for proxy in self.proxy_manager.proxies:
+            if proxy['http'] == proxy_str:
+                return proxy
+        return self.proxy_manager._parse_proxy(proxy_str)
+
+    def acquire(self) -> Optional[AccountLease]:
+        """
+        Reserva a conta disponível com menos buscas hoje
+
+        Returns:
+            AccountLease ou None se todas estiverem ocupadas, em cooldown ou sem cota
+        """
+        now = time.time()
+        with self.lock:
+            state = self._load()
+            candidates = [a for a in self.accounts if self._is_available(a, state[a], now)]
+            if not candidates:
+                print("⚠️ Nenhuma conta disponível (ocupadas, em cooldown ou sem cota)")
+                return None
+
+            account = min(candidates, key=lambda a: (state[a]['searches'], state[a]['last_used']))
+            entry = state[account]
+            entry['owner_pid'] = psutil.Process().pid
+            entry['last_used'] = now
+
+            if entry['proxy'] is None:
+                entry['proxy'] = self._assign_proxy(account, state)
+
+            write_json_atomic(self.state_file, state)
+
+        remaining = self.quota_for(account) - entry['searches']
+        print(f"👤 Conta: {account} ({remaining} buscas restantes hoje)")
+        return AccountLease(account, self._proxy_dict(entry['proxy']), remaining)
+
+    def try_consume(self, profile_name: str, searches: int = 1) -> bool:
+        """
+        Desconta buscas da cota da conta
+
+        Returns:
+            False se a cota do dia acabou (nada é descontado)
+        """
+        with self.lock:
+            state = self._load()
+            entry = state[profile_name]
+            if entry['searches'] + searches > self.quota_for(profile_name):
+                return False
+            entry['searches'] += searches
+            entry['last_used'] = time.time()
+            write_json_atomic(self.state_file, state)
+        return True
+
+    def cooldown(self, profile_name: str, minutes: Optional[float] = None, reason: str = ''):
+        """Pausa a conta (ex: após HTTP 999, checkpoint ou captcha)"""
+        minutes = self.cooldown_minutes if minutes is None else minutes
+        with self.lock:
+            state = self._load()
+            state[profile_name]['cooldown_until'] = time.time() + minutes * 60
+            write_json_atomic(self.state_file, state)
+        print(f"🧊 Conta {profile_name} em cooldown por {minutes:.0f} min{f' ({reason})' if reason else ''}")
+
+    def reassign_proxy(self, profile_name: str) -> Optional[Dict[str, str]]:
+        """Troca o proxy fixo da conta (ex: proxy morto)"""
+        with self.lock:
+            state = self._load()
+            state[profile_name]['proxy'] = None
+            state[profile_name]['proxy'] = self._assign_proxy(profile_name, state)
+            write_json_atomic(self.state_file, state)
+        return self._proxy_dict(state[profile_name]['proxy'])
+
+    def release(self, profile_name: str):
+        """Devolve a conta ao pool"""
+        with self.lock:
+            state = self._load()
+            state[profile_name]['owner_pid'] = None
+            write_json_atomic(self.state_file, state)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retorna o estado de cada conta
+
+        Returns:
+            Dict {conta: {buscas, cota, cooldown, em uso}}
+        """
+        now = time.time()
+        with self.lock:
+            state = self._load()
+
+        return {
+            account: {
+                'searches_today': state[account]['searches'],
+                'quota': self.quota_for(account),
+                'cooldown_minutes_left': max(0, round((state[account]['cooldown_until'] - now) / 60)),
+                'in_use': bool(state[account]['owner_pid']) and psutil.pid_exists(state[account]['owner_pid']),
+                'proxy': self.proxy_manager._get_proxy_display({'http': state[account]['proxy']})
+                if state[account]['proxy'] and self.proxy_manager else None,
+            }
+            for account in self.accounts
+        }
@@ -0,0 +1,355 @@
+"""
+Daemon de Navegador Persistente
+================================
+
+Mantém um Chrome aberto em segundo plano com a porta de depuração remota
+e o perfil da sessão. Os jobs se conectam a ele (ChromeConfig com
+debugger_address) em milissegundos, já logados, em vez de abrir um
+Chrome novo a cada execução.
+
+Cada job trabalha em uma aba criada só para ele. Um arquivo por aba
+registra o pid do job dono, para fechar as abas de jobs que morreram.
+
+Uso:
+    python -m selenium_linkedin.browser_daemon start --profile linkedin
+    python -m selenium_linkedin.browser_daemon status
+    python -m selenium_linkedin.browser_daemon stop
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import psutil
+
+from .chrome_config import USER_AGENT
+from .session_manager import SessionManager
+
+
+# Binários do Chrome procurados (além da variável CHROME_BINARY)
+CHROME_CANDIDATES = [
+    'google-chrome',
+    'google-chrome-stable',
+    'chromium',
+    'chromium-browser',
+    'chrome',
+    r'C:\Program Files\Google\Chrome\Application\chrome.exe',
+    r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+]
+
+
+def find_chrome_binary() -> Optional[str]:
+    """
+    Localiza o executável do Chrome
+
+    Returns:
+        str: Caminho do executável ou None
+    """
+    env_path = os.environ.get('CHROME_BINARY')
+    if env_path and os.path.isfile(env_path):
+        return env_path
+
+    for candidate in CHROME_CANDIDATES:
+        if os.path.isfile(candidate):
+            return candidate
+        found = shutil.which(candidate)
+        if found:
+            return found
+    return None
+
+
+class TabLease:
+    """
+    Aba reservada para um job no daemon (liberada com release)
+    """
+
+    def __init__(self, daemon: 'BrowserDaemon', target_id: str, owner_path: Path):
+        self.daemon = daemon
+        self.target_id = target_id
+        self.owner_path = owner_path
+
+    def release(self, driver=None):
+        """
+        Fecha a aba, apaga o registro do dono e desconecta o driver (sem fechar o Chrome)
+
+        Args:
+            driver: Driver conectado ao daemon (opcional)
+        """
+        self.daemon.close_tab(self.target_id)
+
+        self.owner_path.unlink(missing_ok=True)
+
+        if driver is not None:
+            # quit() poderia fechar o navegador compartilhado: só encerrar o chromedriver
+            try:
+                driver.service.stop()
+            except Exception:
+                pass
+
+
+class BrowserDaemon:
+    """
+    Chrome de longa duração com depuração remota e perfil de sessão
+    """
+
+    def __init__(
+        self,
+        profile_name: str = "linkedin",
+        port: int = 9222,
+        headless: bool = True,
+        proxy: Optional[Dict[str, str]] = None,
+        extra_args: Optional[List[str]] = None
+    ):
+        """
+        Inicializa o daemon
+
+        Args:
+            profile_name: Nome do perfil (SessionManager)
+            port: Porta de depuração remota
+            headless: Se True, executa sem interface gráfica
+            proxy: Dict de proxy (apenas proxies sem autenticação)
+            extra_args: Flags adicionais do Chrome
+        """
+        self.session_manager = SessionManager(profile_name=profile_name)
+        self.profile_name = profile_name
+        self.port = port
+        self.headless = headless
+        self.proxy = proxy
+        self.extra_args = extra_args or []
+
+        self.state_dir = self.session_manager.profiles_dir / ".daemons"
+        self.state_file = self.state_dir / f"{profile_name}.json"
+        self.tabs_dir = self.state_dir / f"{profile_name}_tabs"
+
+    @property
+    def address(self) -> str:
+        """Endereço para ChromeConfig(debugger_address=...)"""
+        return f"127.0.0.1:{self.port}"
+
+    def _devtools(self, path: str, method: str = 'GET', timeout: float = 2) -> Any:
+        """Chama um endpoint HTTP do DevTools (/json/...)"""
+        request = urllib.request.Request(f"http://{self.address}{path}", method=method)
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            body = response.read().decode('utf-8')
+        try:
+            return json.loads(body)
+        except ValueError:
+            return body
+
+    def is_running(self) -> bool:
+        """Verifica se o Chrome do daemon está respondendo"""
+        try:
+            return 'Browser' in self._devtools('/json/version')
+        except Exception:
+            return False
+
+    def _read_state(self) -> Dict[str, Any]:
+        """Lê o estado salvo do daemon (pid, porta, perfil)"""
+        try:
+            with open(self.state_file, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def start(self, wait: float = 20) -> bool:
+        """
+        Inicia o Chrome em segundo plano (se ainda não estiver rodando)
+
+        Args:
+            wait: Tempo máximo de espera pela porta de depuração (segundos)
+
+        Returns:
+            True se o daemon está pronto
+        """
+        if self.is_running():
+            print(f"✅ Daemon já está rodando em {self.address}")
+            return True
+
+        binary = find_chrome_binary()
+        if not binary:
+            print("❌ Chrome não encontrado. Defina a variável CHROME_BINARY.")
+            return False
+
+        args = [
+            binary,
+            f'--remote-debugging-port={self.port}',
+            f'--user-data-dir={self.session_manager.get_profile_path()}',
+            '--no-first-run',
+            '--no-default-browser-check',
+            '--disable-blink-features=AutomationControlled',
+            '--disable-dev-shm-usage',
+            f'--user-agent={USER_AGENT}',
+        ]
+        if self.headless:
+            args.append('--headless=new')
+
+        if self.proxy:
+            proxy_str = self.proxy.get('http', '')
+            if '@' in proxy_str:
+                print("⚠️ Proxy com autenticação não é suportado pelo daemon - iniciando sem proxy")
+            elif proxy_str:
+                args.append(f'--proxy-server={proxy_str}')
+
+        args.extend(self.extra_args)
+        args.append('about:blank')
+
+        print(f"🚀 Iniciando daemon do Chrome (perfil: {self.profile_name}, porta: {self.port})...")
+        process = subprocess.Popen(
+            args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.state_file, 'w') as f:
+            json.dump({'pid': process.pid, 'port': self.port, 'profile': self.profile_name}, f)
+
+        deadline = time.time() + wait
+        while time.time() < deadline:
+            if self.is_running():
+                print(f"✅ Daemon pronto em {self.address}")
+                return True
+            if process.poll() is not None:
+                break
+            time.sleep(0.25)
+
+        print("❌ Daemon não respondeu na porta de depuração")
+        return False
+
+    def _daemon_process(self, pid: Optional[int], port: int) -> Optional[psutil.Process]:
+        """
+        Processo do pid salvo, se ainda for o Chrome deste daemon
+
+        Após um reboot o pid pode ter sido reaproveitado por outro processo:
+        só conta se a linha de comando tiver a porta e o perfil do daemon.
+        """
+        if not pid:
+            return None
+        try:
+            process = psutil.Process(pid)
+            cmdline = process.cmdline()
+        except psutil.Error:
+            return None
+
+        expected = {
+            f'--remote-debugging-port={port}',
+            f'--user-data-dir={self.session_manager.profile_path.absolute()}',
+        }
+        return process if expected.issubset(cmdline) else None
+
+    def stop(self):
+        """Encerra o Chrome do daemon"""
+        state = self._read_state()
+        process = self._daemon_process(state.get('pid'), state.get('port', self.port))
+
+        if process:
+            try:
+                children = process.children(recursive=True)
+                process.terminate()
+                _, alive = psutil.wait_procs([process] + children, timeout=10)
+                for leftover in alive:
+                    leftover.kill()
+                print("🔴 Daemon encerrado")
+            except psutil.Error as e:
+                print(f"⚠️ Erro ao encerrar daemon: {e}")
+        else:
+            print("⚠️ Daemon não está rodando (pid salvo não é o Chrome do daemon)")
+
+        self.state_file.unlink(missing_ok=True)
+        shutil.rmtree(self.tabs_dir, ignore_errors=True)
+
+    def list_tabs(self) -> List[Dict[str, Any]]:
+        """Lista as abas abertas no daemon"""
+        return [t for t in self._devtools('/json/list') if t.get('type') == 'page']
+
+    def close_tab(self, target_id: str):
+        """Fecha uma aba do daemon"""
+        try:
+            self._devtools(f'/json/close/{target_id}')
+        except Exception:
+            pass  # Aba já fechada
+
+    def _owner_is_gone(self, owner_path: Path) -> bool:
+        """Aba de um processo que já terminou"""
+        try:
+            owner = int(owner_path.read_text().strip() or 0)
+        except (OSError, ValueError):
+            return True
+        return not psutil.pid_exists(owner)
+
+    def acquire_tab(self) -> TabLease:
+        """
+        Cria uma aba nova para o processo atual
+
+        A aba é criada para este job e nenhum outro a recebe; o arquivo
+        com o pid serve só para fechar abas de jobs que morreram.
+
+        Returns:
+            TabLease: Aba do job (chame release ao terminar)
+        """
+        self.tabs_dir.mkdir(parents=True, exist_ok=True)
+
+        # Fechar abas de jobs que morreram sem liberá-las
+        for owner_path in self.tabs_dir.glob('*.pid'):
+            if self._owner_is_gone(owner_path):
+                self.close_tab(owner_path.stem)
+                owner_path.unlink(missing_ok=True)
+
+        target = self._devtools('/json/new?about:blank', method='PUT')
+        target_id = target['id']
+        owner_path = self.tabs_dir / f"{target_id}.pid"
+        owner_path.write_text(str(os.getpid()))
+
+        print(f"🗂️ Aba do job: {target_id[:8]}")
+        return TabLease(self, target_id, owner_path)
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Retorna o estado do daemon
+
+        Returns:
+            Dict com estado, endereço, abas e jobs ativos
+        """
+        running = self.is_running()
+        owners = list(self.tabs_dir.glob('*.pid')) if self.tabs_dir.exists() else []
+        return {
+            'running': running,
+            'address': self.address,
+            'profile': self.profile_name,
+            'pid': self._read_state().get('pid'),
+            'tabs': len(self.list_tabs()) if running else 0,
+            'active_jobs': len(owners),
+        }
+
+
+def main():
+    """Linha de comando do daemon"""
+    parser = argparse.ArgumentParser(description="Daemon de Chrome persistente")
+    parser.add_argument('command', choices=['start', 'stop', 'status'])
+    parser.add_argument('--profile', default='linkedin', help="Nome do perfil")
+    parser.add_argument('--port', type=int, default=9222, help="Porta de depuração remota")
+    parser.add_argument('--visual', action='store_true', help="Abrir com janela visível")
+    args = parser.parse_args()
+
+    daemon = BrowserDaemon(profile_name=args.profile, port=args.port, headless=not args.visual)
+
+    if args.command == 'start':
+        sys.exit(0 if daemon.start() else 1)
+    elif args.command == 'stop':
+        daemon.stop()
+    else:
+        for key, value in daemon.status().items():
+            print(f"   {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
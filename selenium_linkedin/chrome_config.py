@@ -7,6 +7,11 @@ Configuração otimizada do Chrome com suporte a:
 - Proxies
 - Modo headless/visual
 - Anti-detecção
+- Captura de rede via CDP (respostas JSON)
+- Perfis de bloqueio de requisições via CDP
+- Presets de inicialização (lean-headless, visual-debug)
+- Conexão a um Chrome já aberto (BrowserDaemon) via debuggerAddress
+- Injeção de sessão (cookie jar) em navegadores sem perfil
 """
 
 from selenium import webdriver
@@ -18,6 +23,33 @@ import os
 import ssl
 import re
 
+from .request_blocking import BLOCKING_PROFILES, apply_blocking_profile
+from .launch_presets import apply_preset, chromedriver_path, get_preset
+from .cookie_jar import inject_jar, load_jar, seed_local_storage
+
+
+# User agent de um Chrome comum (o headless anuncia "HeadlessChrome")
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+    'AppleWebKit/537.36 (KHTML, like Gecko) '
+    'Chrome/120.0.0.0 Safari/537.36'
+)
+
+# Script injetado em cada documento para esconder indicadores de automação
+STEALTH_SCRIPT = '''
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+    
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+    
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['pt-BR', 'pt', 'en-US', 'en']
+    });
+'''
+
 
 class ChromeConfig:
     """
@@ -30,7 +62,13 @@ class ChromeConfig:
         profile_path: Optional[str] = None,
         proxy: Optional[Dict[str, str]] = None,
         disable_images: bool = False,
-        window_size: tuple = (1920, 1080)
+        window_size: tuple = (1920, 1080),
+        capture_network: bool = False,
+        block_profile: Optional[str] = None,
+        preset: Optional[str] = None,
+        debugger_address: Optional[str] = None,
+        attach_target: Optional[str] = None,
+        cookie_jar: Optional[str] = None
     ):
         """
         Inicializa a configuração do Chrome
@@ -41,17 +79,41 @@ class ChromeConfig:
             proxy: Dict com configuração de proxy
             disable_images: Se True, desabilita carregamento de imagens
             window_size: Tamanho da janela (largura, altura)
+            capture_network: Se True, habilita eventos de rede (CDP) para NetworkCapture
+            block_profile: Perfil de bloqueio de requisições (ex: "lean", "linkedin")
+            preset: Preset de inicialização (ex: "lean-headless", "visual-debug")
+            debugger_address: Endereço de um Chrome já aberto (ex: "127.0.0.1:9222");
+                              perfil, proxy, headless e preset são do daemon e ignorados aqui
+            attach_target: Aba do daemon a controlar (TabLease.target_id)
+            cookie_jar: Jar de sessão (SessionManager.export_jar) injetado via CDP ao iniciar
         """
+        if block_profile and block_profile not in BLOCKING_PROFILES:
+            raise ValueError(f"Perfil de bloqueio desconhecido: {block_profile}")
+        
         self.headless = headless
         self.profile_path = profile_path
         self.proxy = proxy
         self.disable_images = disable_images
         self.window_size = window_size
+        self.capture_network = capture_network
+        self.block_profile = block_profile
+        self.preset = preset
+        self.debugger_address = debugger_address
+        self.attach_target = attach_target
+        self.cookie_jar = cookie_jar
+        
+        # Presets podem fixar o modo headless
+        if preset and get_preset(preset)['headless'] is not None:
+            self.headless = get_preset(preset)['headless']
     
-    def get_chrome_options(self) -> Options:
+    def get_chrome_options(self, with_extensions: bool = False) -> Options:
         """
         Cria e retorna opções configuradas para o Chrome
         
+        Args:
+            with_extensions: True se o driver vai carregar extensões
+                             (impede o preset de trocar para o chrome-headless-shell)
+        
         Returns:
             Options: Objeto de opções do Chrome
         """
@@ -97,11 +159,7 @@ class ChromeConfig:
         options.add_experimental_option('useAutomationExtension', False)
         
         # ====== USER AGENT ======
-        options.add_argument(
-            'user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-            'AppleWebKit/537.36 (KHTML, like Gecko) '
-            'Chrome/120.0.0.0 Safari/537.36'
-        )
+        options.add_argument(f'user-agent={USER_AGENT}')
         
         # ====== OTIMIZAÇÕES ======
         options.add_argument('--no-sandbox')
@@ -131,6 +189,21 @@ class ChromeConfig:
         if prefs:
             options.add_experimental_option('prefs', prefs)
         
+        # ====== PRESET DE INICIALIZAÇÃO ======
+        if self.preset:
+            apply_preset(
+                options, self.preset,
+                allow_headless_shell=not with_extensions,
+                persistent_profile=bool(self.profile_path)
+            )
+        
+        # ====== CAPTURA DE REDE ======
+        if self.capture_network or self.block_profile:
+            # Eventos Network.* ficam disponíveis em driver.get_log('performance')
+            # (também usados pelo contador de tráfego do perfil de bloqueio)
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            print("📡 Captura de rede habilitada")
+        
         return options
     
     def create_driver(self) -> webdriver.Chrome:
@@ -140,6 +213,9 @@ class ChromeConfig:
         Returns:
             webdriver.Chrome: Driver configurado
         """
+        if self.debugger_address:
+            return self._attach_to_browser()
+        
         print("🚀 Inicializando Chrome...")
         
         # Verificar se proxy tem autenticação
@@ -157,36 +233,100 @@ class ChromeConfig:
         # Desabilitar verificação SSL para WebDriver Manager (resolve problemas com proxies)
         os.environ['WDM_SSL_VERIFY'] = '0'
         
-        # Configurar serviço do ChromeDriver
-        service = Service(ChromeDriverManager().install())
+        # Configurar serviço do ChromeDriver (mesma versão do binário usado)
+        service = Service(chromedriver_path(options.binary_location))
         
         # Criar driver
         driver = webdriver.Chrome(service=service, options=options)
         
+        # Timeouts, anti-detecção e recursos CDP
+        self._configure_driver(driver)
+        
+        print("✅ Chrome iniciado com sucesso!")
+        
+        return driver
+    
+    def _attach_to_browser(self) -> webdriver.Chrome:
+        """
+        Conecta a um Chrome já aberto com --remote-debugging-port (método interno)
+        
+        Returns:
+            webdriver.Chrome: Driver conectado (fechar com TabLease.release, não quit)
+        """
+        print(f"🔌 Conectando ao Chrome em {self.debugger_address}...")
+        
+        # Flags de inicialização não se aplicam: o navegador já está rodando
+        options = Options()
+        options.add_experimental_option('debuggerAddress', self.debugger_address)
+        if self.capture_network or self.block_profile:
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        
+        os.environ['WDM_SSL_VERIFY'] = '0'
+        service = Service(ChromeDriverManager().install())
+        driver = webdriver.Chrome(service=service, options=options)
+        
+        # Comandos CDP valem para a aba atual: trocar antes de configurar
+        if self.attach_target:
+            driver.switch_to.window(self.attach_target)
+        
+        # Mesmo user agent do Chrome iniciado pelo ChromeConfig (mesmo se o
+        # daemon foi aberto sem a flag)
+        driver.execute_cdp_cmd('Network.setUserAgentOverride', {'userAgent': USER_AGENT})
+        
+        self._configure_driver(driver)
+        
+        print("✅ Conectado ao Chrome existente!")
+        
+        return driver
+    
+    def _configure_driver(self, driver: webdriver.Chrome):
+        """
+        Aplica timeouts, script anti-detecção e recursos CDP em um driver recém-criado
+        
+        Args:
+            driver: Driver do Chrome
+        """
         # Configurar timeouts
         driver.implicitly_wait(10)
         driver.set_page_load_timeout(60)
         
+        self.configure_tab(driver)
+        
+        # Sessão portátil: cookies (valem para o navegador todo) sem user-data-dir
+        if self.cookie_jar:
+            inject_jar(driver, load_jar(self.cookie_jar), local_storage=False)
+    
+    def configure_tab(self, driver: webdriver.Chrome, handle: Optional[str] = None):
+        """
+        Aplica os recursos CDP que valem só para uma aba (script anti-detecção,
+        captura de rede, bloqueio de requisições e local storage do jar)
+        
+        Abas abertas depois do driver (TabPool, TabPrefetcher) não herdam a
+        configuração da primeira: chame para cada aba nova.
+        
+        Args:
+            driver: Driver do Chrome
+            handle: Aba a configurar (padrão: a aba atual, que continua atual)
+        """
+        if handle:
+            driver.switch_to.window(handle)
+        
         # Script anti-detecção
         driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-            'source': '''
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['pt-BR', 'pt', 'en-US', 'en']
-                });
-            '''
+            'source': STEALTH_SCRIPT
         })
         
-        print("✅ Chrome iniciado com sucesso!")
+        # Habilitar domínio Network (necessário para ler corpos de respostas)
+        if self.capture_network:
+            driver.execute_cdp_cmd('Network.enable', {})
         
-        return driver
+        # Bloquear fontes, mídia, rastreadores, etc (economiza banda do proxy)
+        if self.block_profile:
+            apply_blocking_profile(driver, self.block_profile)
+        
+        # Local storage do jar em cada documento da aba
+        if self.cookie_jar:
+            seed_local_storage(driver, load_jar(self.cookie_jar))
     
     def _create_driver_with_auth_proxy(self) -> webdriver.Chrome:
         """
@@ -307,9 +447,13 @@ chrome.webRequest.onAuthRequired.addListener(
         original_proxy = self.proxy
         self.proxy = None  # Temporariamente remover para não adicionar --proxy-server
         
-        options = self.get_chrome_options()
+        options = self.get_chrome_options(with_extensions=True)
         options.add_extension(str(plugin_path))
         
+        # A extensão de proxy precisa de extensões habilitadas (presets enxutos as desativam)
+        if '--disable-extensions' in options.arguments:
+            options.arguments.remove('--disable-extensions')
+        
         # Restaurar proxy
         self.proxy = original_proxy
         
@@ -318,29 +462,11 @@ chrome.webRequest.onAuthRequired.addListener(
         
         # Criar driver
         print(f"🚀 Iniciando Chrome com extensão de proxy...")
-        service = Service(ChromeDriverManager().install())
+        service = Service(chromedriver_path(options.binary_location))
         driver = webdriver.Chrome(service=service, options=options)
         
-        # Configurar timeouts
-        driver.implicitly_wait(10)
-        driver.set_page_load_timeout(60)
-        
-        # Script anti-detecção
-        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-            'source': '''
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['pt-BR', 'pt', 'en-US', 'en']
-                });
-            '''
-        })
+        # Timeouts, anti-detecção e recursos CDP
+        self._configure_driver(driver)
         
         # Limpar arquivo de extensão após alguns segundos
         import time
@@ -0,0 +1,178 @@
+"""
+Jar de Sessão (Cookies + Local Storage)
+========================================
+
+Exporta os cookies e o local storage de um navegador logado para um
+arquivo JSON pequeno e portátil, e injeta esse jar via CDP em navegadores
+novos sem perfil, que já abrem logados.
+
+O jar contém credenciais de sessão: o arquivo é gravado com permissão 600
+e não deve ser versionado.
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+
+JAR_VERSION = 1
+
+# Campos aceitos por Network.setCookies (o resto vem só de leitura)
+COOKIE_PARAM_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires', 'priority')
+
+# Executado em cada documento: preenche o local storage da origem com o jar
+SEED_LOCAL_STORAGE_JS = """
+(() => {
+    const jar = %s;
+    const items = jar[location.origin];
+    if (!items) return;
+    try {
+        for (const [key, value] of Object.entries(items)) {
+            if (localStorage.getItem(key) === null) localStorage.setItem(key, value);
+        }
+    } catch (e) {}
+})();
+"""
+
+
+def _matches_domain(cookie_domain: str, domains: List[str]) -> bool:
+    """True se o domínio do cookie pertence a algum dos domínios"""
+    cookie_domain = cookie_domain.lstrip('.')
+    return any(cookie_domain == d or cookie_domain.endswith('.' + d) for d in domains)
+
+
+def export_jar(driver, path: str, origins: List[str]) -> Dict[str, Any]:
+    """
+    Exporta cookies e local storage de um navegador logado
+
+    Args:
+        driver: WebDriver do Chrome (com a sessão ativa)
+        path: Arquivo JSON de destino
+        origins: Origens a exportar (ex: ["https://www.linkedin.com"])
+
+    Returns:
+        Dict com o jar exportado
+    """
+    hosts = [urlsplit(origin).hostname for origin in origins]
+    # Cookies do domínio principal (ex: www.linkedin.com -> linkedin.com)
+    domains = sorted({'.'.join(host.split('.')[-2:]) for host in hosts})
+
+    cookies = driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', [])
+    cookies = [c for c in cookies if _matches_domain(c['domain'], domains)]
+
+    local_storage = {}
+    for origin in origins:
+        origin = origin.rstrip('/')
+        # O local storage só é acessível a partir de uma página da origem
+        if not driver.current_url.startswith(origin):
+            driver.get(origin)
+        local_storage[origin] = driver.execute_script(
+            "const items = {};"
+            "for (let i = 0; i < localStorage.length; i++) {"
+            "  const key = localStorage.key(i); items[key] = localStorage.getItem(key);"
+            "}"
+            "return items;"
+        ) or {}
+
+    jar = {
+        'version': JAR_VERSION,
+        'exported_at': datetime.now().isoformat(timespec='seconds'),
+        'cookies': cookies,
+        'local_storage': local_storage,
+    }
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(target.name + '.tmp')
+    # Permissão 600: o jar dá acesso à conta
+    fd = os.open(tmp_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(jar, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, target)
+
+    items = sum(len(values) for values in local_storage.values())
+    print(f"🍪 Jar exportado: {len(cookies)} cookies, {items} itens de local storage -> {target}")
+    return jar
+
+
+def load_jar(path: str) -> Dict[str, Any]:
+    """
+    Lê um jar exportado
+
+    Raises:
+        ValueError: se o arquivo não for um jar suportado
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        jar = json.load(f)
+
+    if jar.get('version') != JAR_VERSION:
+        raise ValueError(f"Versão de jar não suportada: {jar.get('version')}")
+    return jar
+
+
+def find_cookie(jar: Dict[str, Any], name: str, domain: str) -> Optional[Dict[str, Any]]:
+    """Cookie do jar com o nome e domínio informados (ou None)"""
+    for cookie in jar.get('cookies', []):
+        if cookie['name'] == name and _matches_domain(cookie['domain'], [domain]):
+            return cookie
+    return None
+
+
+def seed_local_storage(driver, jar: Dict[str, Any]) -> bool:
+    """
+    Preenche o local storage do jar em cada documento da aba atual
+
+    Page.addScriptToEvaluateOnNewDocument vale só para a aba em que foi
+    executado: abas novas precisam da mesma chamada.
+
+    Returns:
+        bool: True se o jar tinha local storage
+    """
+    local_storage = jar.get('local_storage') or {}
+    if not any(local_storage.values()):
+        return False
+
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+        'source': SEED_LOCAL_STORAGE_JS % json.dumps(local_storage)
+    })
+    return True
+
+
+def inject_jar(driver, jar: Dict[str, Any], local_storage: bool = True) -> int:
+    """
+    Injeta cookies e local storage do jar em um navegador via CDP
+
+    Deve ser chamado antes de abrir as páginas do site.
+
+    Args:
+        driver: WebDriver do Chrome
+        jar: Jar carregado com load_jar
+        local_storage: Se False, injeta só os cookies (o local storage já foi
+                       preenchido com seed_local_storage)
+
+    Returns:
+        int: Quantidade de cookies injetados
+    """
+    now = time.time()
+    cookies = []
+    for cookie in jar.get('cookies', []):
+        params = {k: cookie[k] for k in COOKIE_PARAM_FIELDS if k in cookie}
+        expires = params.get('expires', -1)
+        if cookie.get('session') or expires is None or expires < 0:
+            params.pop('expires', None)  # Cookie de sessão
+        elif expires < now:
+            continue  # Expirado
+        cookies.append(params)
+
+    if cookies:
+        driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookies})
+
+    if local_storage:
+        seed_local_storage(driver, jar)
+
+    print(f"🍪 Sessão injetada: {len(cookies)} cookies")
+    return len(cookies)
@@ -0,0 +1,243 @@
+"""
+Supervisor do WebDriver
+========================
+
+Executa cada comando do WebDriver com prazo máximo. Se o Chrome ou o
+chromedriver travar (ou cair), mata a árvore de processos e permite
+reabrir o navegador com a mesma configuração (perfil + proxy), para que
+o scraper repita o passo atual a partir do último checkpoint.
+"""
+
+import inspect
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import psutil
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from .memory_watchdog import MemoryWatchdog
+
+
+# Mensagens do Selenium que indicam navegador morto (não adianta tentar de novo)
+CRASH_MESSAGES = (
+    'invalid session id',
+    'chrome not reachable',
+    'disconnected',
+    'session deleted',
+    'target window already closed',
+    'connection refused',
+)
+
+# Comandos cujo TimeoutException vem do page load timeout do chromedriver
+# (renderer travado): tratados como travamento, igual ao prazo do supervisor
+NAVIGATION_COMMANDS = ('get', 'refresh', 'back', 'forward')
+
+
+class DriverHungError(Exception):
+    """O navegador travou ou caiu durante um comando"""
+
+
+class SupervisedDriver:
+    """
+    Proxy do WebDriver: cada acesso vira um comando com prazo máximo
+    """
+
+    def __init__(self, supervisor: 'DriverSupervisor'):
+        self._supervisor = supervisor
+
+    def __getattr__(self, name: str) -> Any:
+        supervisor = self._supervisor
+        if supervisor.raw_driver is None:
+            raise DriverHungError("Navegador não está ativo (aguardando reinício)")
+
+        driver = supervisor.raw_driver
+        # Propriedades (current_url, page_source...) falam com o navegador;
+        # métodos e atributos comuns são resolvidos localmente, sem thread
+        if isinstance(inspect.getattr_static(driver, name, None), property):
+            return supervisor.run(lambda: getattr(driver, name), name)
+
+        value = getattr(driver, name)
+        if not callable(value):
+            return value
+
+        def supervised_call(*args, **kwargs):
+            return supervisor.run(lambda: value(*args, **kwargs), name)
+
+        return supervised_call
+
+
+class DriverSupervisor:
+    """
+    Supervisiona o WebDriver: prazos por comando, detecção de travamento e reinício
+    """
+
+    def __init__(
+        self,
+        create_driver: Callable[[], Any],
+        default_timeout: float = 90,
+        timeouts: Optional[Dict[str, float]] = None,
+        max_restarts: int = 3,
+        on_restart: Optional[Callable[[], None]] = None,
+        release_driver: Optional[Callable[[Any], None]] = None
+    ):
+        """
+        Inicializa o supervisor
+
+        Args:
+            create_driver: Função que cria um driver novo (ex: ChromeConfig.create_driver)
+            default_timeout: Prazo padrão de cada comando (segundos)
+            timeouts: Prazos por comando (ex: {'get': 75, 'execute_script': 30})
+            max_restarts: Reinícios permitidos por passo antes de desistir
+            on_restart: Função chamada após cada reinício do navegador
+            release_driver: Função que encerra o driver no lugar de quit()
+                            (ex: liberar a aba de um BrowserDaemon sem fechar o Chrome)
+        """
+        self.create_driver = create_driver
+        self.default_timeout = default_timeout
+        self.timeouts = timeouts or {}
+        self.max_restarts = max_restarts
+        self.on_restart = on_restart
+        self.release_driver = release_driver
+
+        self.raw_driver = None
+        self.driver = SupervisedDriver(self)
+        self.restarts = 0
+
+    def start(self):
+        """Cria o driver"""
+        self.raw_driver = self.create_driver()
+
+    def run(self, func: Callable[[], Any], command: str = '') -> Any:
+        """
+        Executa uma função do driver com prazo máximo
+
+        Args:
+            func: Função sem argumentos que usa o driver
+            command: Nome do comando (para prazos específicos)
+
+        Returns:
+            Resultado da função
+
+        Raises:
+            DriverHungError: se o prazo estourar ou o navegador tiver caído
+        """
+        timeout = self.timeouts.get(command, self.default_timeout)
+        outcome: Dict[str, Any] = {}
+
+        def target():
+            try:
+                outcome['value'] = func()
+            except BaseException as e:
+                outcome['error'] = e
+
+        worker = threading.Thread(target=target, daemon=True)
+        worker.start()
+        worker.join(timeout)
+
+        if worker.is_alive():
+            print(f"⏱️ Comando '{command}' travado por mais de {timeout:.0f}s - matando navegador")
+            self.kill()
+            raise DriverHungError(f"Comando '{command}' excedeu {timeout:.0f}s")
+
+        error = outcome.get('error')
+        if error is not None:
+            if isinstance(error, WebDriverException) and any(
+                message in str(error).lower() for message in CRASH_MESSAGES
+            ):
+                print(f"💥 Navegador caiu durante '{command}'")
+                self.kill()
+                raise DriverHungError(str(error)) from error
+            if isinstance(error, TimeoutException) and command in NAVIGATION_COMMANDS:
+                print(f"⏱️ Página não carregou durante '{command}' - matando navegador")
+                self.kill()
+                raise DriverHungError(str(error)) from error
+            raise error
+
+        return outcome.get('value')
+
+    def kill(self):
+        """
+        Mata a árvore de processos do chromedriver/Chrome atual
+
+        Com o Chrome anexado (daemon) o chromedriver local não é pai do
+        navegador: o Chrome que escuta na porta de depuração também é morto,
+        senão o navegador travado seria reanexado no reinício.
+        """
+        driver, self.raw_driver = self.raw_driver, None
+        if driver is None:
+            return
+
+        processes = MemoryWatchdog.get_process_tree(driver)
+
+        for process in processes:
+            try:
+                process.kill()
+            except psutil.Error:
+                pass  # Já terminou
+
+        psutil.wait_procs(processes, timeout=5)
+
+        # Libera os recursos do lado Python (sem esperar o navegador)
+        try:
+            driver.service.stop()
+        except Exception:
+            pass
+
+    def _close_driver(self):
+        """Encerra o driver atual (quit ou release_driver), matando se travar"""
+        if self.raw_driver is None:
+            return
+        driver = self.raw_driver
+        close = (lambda: self.release_driver(driver)) if self.release_driver else driver.quit
+        try:
+            self.run(close, 'quit')
+        except Exception:
+            self.kill()
+        self.raw_driver = None
+
+    def restart(self):
+        """Mata o navegador atual (se houver) e cria um novo com a mesma configuração"""
+        self._close_driver()
+
+        self.start()
+        self.restarts += 1
+
+        if self.on_restart:
+            self.on_restart()
+
+    def quit(self):
+        """Fecha o navegador (mata se travar)"""
+        self._close_driver()
+
+    def run_step(self, step: Callable[[], Any], checkpoint: Optional[Callable[[], None]] = None) -> Any:
+        """
+        Executa um passo do job, reiniciando o navegador e repetindo se ele travar
+
+        Args:
+            step: Função do passo (usa self.driver)
+            checkpoint: Função que restaura o estado antes de repetir
+                        (ex: navegar de volta para a página atual)
+
+        Returns:
+            Resultado do passo
+        """
+        attempts = 0
+        restored = True
+
+        while True:
+            try:
+                # Após um reinício, restaurar o estado antes de repetir o passo
+                if not restored and checkpoint:
+                    checkpoint()
+                restored = True
+
+                return step()
+            except DriverHungError as e:
+                attempts += 1
+                if attempts > self.max_restarts:
+                    print(f"❌ Navegador travou {attempts} vezes no mesmo passo. Desistindo.")
+                    raise
+
+                print(f"♻️ Reiniciando navegador ({attempts}/{self.max_restarts}) após: {e}")
+                self.restart()
+                restored = False
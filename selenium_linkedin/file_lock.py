@@ -0,0 +1,122 @@
+"""
+Lock de Arquivo entre Processos
+================================
+
+Lock exclusivo baseado em arquivo (fcntl no Linux/macOS, msvcrt no
+Windows) para proteger arquivos de estado compartilhados por vários
+scrapers rodando em paralelo, mais escrita atômica de JSON.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """
+    Lock exclusivo entre processos (uso: with FileLock("estado.json.lock"): ...)
+    
+    Também é seguro entre threads que compartilham a mesma instância: um
+    threading.Lock serializa as threads antes do lock do sistema, e o arquivo
+    aberto fica guardado por thread.
+    """
+
+    def __init__(self, path: str, timeout: float = 30):
+        """
+        Args:
+            path: Arquivo de lock (criado se não existir)
+            timeout: Tempo máximo de espera pelo lock (segundos)
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self._thread_lock = threading.Lock()
+        self._local = threading.local()
+
+    def acquire(self):
+        """Espera até obter o lock"""
+        deadline = time.monotonic() + self.timeout
+        if not self._thread_lock.acquire(timeout=self.timeout):
+            raise TimeoutError(f"Lock ocupado por mais de {self.timeout:.0f}s: {self.path}")
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(self.path, 'a+')
+        except Exception:
+            self._thread_lock.release()
+            raise
+
+        while True:
+            try:
+                if fcntl:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                self._local.file = f
+                return
+            except OSError:
+                if time.monotonic() >= deadline:
+                    f.close()
+                    self._thread_lock.release()
+                    raise TimeoutError(f"Lock ocupado por mais de {self.timeout:.0f}s: {self.path}")
+                time.sleep(0.05)
+
+    def release(self):
+        """Libera o lock"""
+        f = getattr(self._local, 'file', None)
+        if f is None:
+            return
+        self._local.file = None
+        try:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            f.close()
+            self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+def read_json(path: str, default: Any = None) -> Any:
+    """Lê um JSON (retorna default se o arquivo não existir ou estiver inválido)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return default
+
+
+def write_json_atomic(path: str, data: Any):
+    """Grava um JSON de forma atômica (arquivo temporário + os.replace)"""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Nome temporário único por escritor (processos e threads não colidem)
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{target.name}.", suffix=".tmp", dir=target.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,308 @@
+"""
+Backend HTTP para Páginas Estáticas
+====================================
+
+Busca páginas com um cliente HTTP com pool de conexões e faz o parsing
+com lxml, sem abrir o navegador. Ideal para páginas renderizadas no
+servidor (ex: quotes.toscrape.com).
+
+Oferece a mesma extração declarativa do WebScraper.extract_many.
+"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.etree
+import lxml.html
+
+from .chrome_config import USER_AGENT
+
+
+# Mesmo user agent do Chrome: as impressões HTTP e do navegador não divergem
+DEFAULT_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+}
+
+# Indícios de que a página só mostra conteúdo com JavaScript
+JS_REQUIRED_PATTERNS = [
+    re.compile(r'<noscript[^>]*>[^<]*(enable|habilite|ative)[^<]*javascript', re.I),
+    re.compile(r'<div id="(root|app|__next)"[^>]*>\s*</div>', re.I),
+]
+
+# Declaração XML de páginas XHTML (o parser HTML do lxml não a lê)
+XML_ENCODING_PATTERN = re.compile(rb'^\s*<\?xml[^>]*encoding=["\']([\w.:-]+)["\']')
+
+
+def parse_field_spec(spec):
+    """
+    Converte a especificação de um campo para (seletor, atributo, todos)
+
+    Formatos aceitos:
+    - "seletor"          -> texto do primeiro elemento
+    - "seletor@atributo" -> atributo do primeiro elemento (ex: "a@href")
+    - ["seletor"]        -> lista com o texto de todos os elementos
+    - "@atributo"        -> atributo do próprio container
+
+    Returns:
+        tuple: (seletor, atributo ou None, todos)
+    """
+    all_matches = isinstance(spec, (list, tuple))
+    if all_matches:
+        spec = spec[0]
+
+    selector, _, attr = spec.partition('@')
+    return selector.strip(), (attr.strip() or None), all_matches
+
+
+def _by_to_css(by: str, value: str) -> Optional[str]:
+    """Converte um localizador do Selenium (By.*) para seletor CSS"""
+    if by == 'css selector':
+        return value
+    if by == 'class name':
+        return f'.{value}'
+    if by == 'id':
+        return f'#{value}'
+    if by == 'tag name':
+        return value
+    if by == 'name':
+        return f'[name="{value}"]'
+    return None
+
+
+class HtmlPage:
+    """
+    Página HTML já baixada e parseada (equivalente estático do driver)
+    """
+
+    def __init__(self, url: str, html: str, status_code: int = 200,
+                 content: Optional[bytes] = None, encoding: Optional[str] = None):
+        """
+        Inicializa a página
+
+        Args:
+            url: URL final (após redirecionamentos)
+            html: Conteúdo HTML
+            status_code: Status HTTP da resposta
+            content: Corpo original em bytes (parseado no lugar de html, respeitando
+                     a declaração de encoding de páginas XHTML/XML)
+            encoding: Charset do header Content-Type, se informado
+
+        Raises:
+            lxml.etree.ParserError: se o corpo não tiver nenhum elemento (ex: só comentários)
+        """
+        self.url = url
+        self.html = html
+        self.status_code = status_code
+
+        if content is not None:
+            declared = XML_ENCODING_PATTERN.match(content)
+            encoding = encoding or (declared.group(1).decode('ascii') if declared else None)
+            parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+            self.tree = lxml.html.fromstring(content, parser=parser)
+        elif html.strip():
+            # Strings com declaração <?xml encoding=...?> só são aceitas como bytes
+            self.tree = lxml.html.fromstring(html.encode('utf-8'), parser=lxml.html.HTMLParser(encoding='utf-8'))
+        else:
+            self.tree = lxml.html.fromstring('<html></html>')
+
+    @property
+    def title(self) -> str:
+        """Título da página"""
+        titles = self.tree.xpath('//title/text()')
+        return titles[0].strip() if titles else ''
+
+    @staticmethod
+    def text_of(element) -> str:
+        """Texto de um elemento com espaços normalizados (similar ao .text do Selenium)"""
+        return ' '.join(element.text_content().split())
+
+    def find_all(self, by: str, value: str, root=None) -> List[Any]:
+        """
+        Busca elementos usando um localizador do Selenium
+
+        Args:
+            by: Tipo de seletor (By.CSS_SELECTOR, By.XPATH, By.CLASS_NAME...)
+            value: Valor do seletor
+            root: Elemento base (padrão: documento inteiro)
+
+        Returns:
+            list: Elementos lxml encontrados
+        """
+        root = self.tree if root is None else root
+
+        if by == 'xpath':
+            return [e for e in root.xpath(value) if hasattr(e, 'tag')]
+        if by == 'link text':
+            return root.xpath('.//a[normalize-space(.)=$text]', text=value)
+
+        css = _by_to_css(by, value)
+        if css is None:
+            raise ValueError(f"Localizador não suportado no modo HTTP: {by}")
+        return root.cssselect(css)
+
+    def find(self, by: str, value: str):
+        """Primeiro elemento encontrado ou None"""
+        elements = self.find_all(by, value)
+        return elements[0] if elements else None
+
+    def _read(self, element, attr: Optional[str]) -> Optional[str]:
+        """Lê texto ou atributo de um elemento (links são resolvidos para URL absoluta)"""
+        if element is None:
+            return None
+        if not attr:
+            return self.text_of(element)
+
+        value = element.get(attr)
+        if value is not None and attr in ('href', 'src'):
+            value = urljoin(self.url, value)
+        return value
+
+    def extract_many(self, container_selector: str, fields: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Extrai vários registros da página (mesma semântica do WebScraper.extract_many)
+
+        Args:
+            container_selector: Seletor CSS de cada item
+            fields: Dict {campo: especificação} (ver parse_field_spec)
+
+        Returns:
+            list: Lista de dicts, um por container encontrado
+        """
+        parsed = [(name, *parse_field_spec(spec)) for name, spec in fields.items()]
+        records = []
+
+        for container in self.tree.cssselect(container_selector):
+            record = {}
+            for name, selector, attr, all_matches in parsed:
+                if all_matches:
+                    nodes = container.cssselect(selector) if selector else [container]
+                    record[name] = [v for v in (self._read(n, attr) for n in nodes) if v]
+                else:
+                    nodes = container.cssselect(selector) if selector else [container]
+                    record[name] = self._read(nodes[0] if nodes else None, attr)
+            records.append(record)
+
+        return records
+
+    def needs_javascript(self, require_selector: Optional[str] = None) -> bool:
+        """
+        Indica se a página parece depender de JavaScript para mostrar o conteúdo
+
+        Args:
+            require_selector: Seletor CSS que deve existir no HTML estático
+
+        Returns:
+            True se a página deve ser aberta no navegador
+        """
+        if require_selector:
+            return not self.tree.cssselect(require_selector)
+
+        if any(pattern.search(self.html) for pattern in JS_REQUIRED_PATTERNS):
+            return True
+
+        # Quase nenhum texto visível mas muitos scripts: SPA
+        body_text = ' '.join(self.tree.xpath('//body//text()[not(ancestor::script)]')).split()
+        scripts = len(self.tree.xpath('//script'))
+        return len(body_text) < 20 and scripts > 0
+
+
+class HttpFetcher:
+    """
+    Cliente HTTP com pool de conexões e retentativas
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 32,
+        timeout: float = 15,
+        retries: int = 2,
+        proxy: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Inicializa o cliente
+
+        Args:
+            pool_size: Conexões mantidas abertas por host
+            timeout: Timeout de cada requisição em segundos
+            retries: Retentativas em erros de conexão e status 429/5xx
+            proxy: Dict de proxy no formato do ProxyManager
+            headers: Headers extras
+        """
+        self.timeout = timeout
+        self.pool_size = pool_size
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+
+        if proxy:
+            self.session.proxies.update({k: v for k, v in proxy.items() if k in ('http', 'https')})
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=('GET', 'HEAD')
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def fetch(self, url: str) -> Optional[HtmlPage]:
+        """
+        Baixa e parseia uma página
+
+        Args:
+            url: URL da página
+
+        Returns:
+            HtmlPage ou None em caso de erro
+        """
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            if response.status_code >= 400:
+                print(f"⚠️ HTTP {response.status_code} em {url}")
+                return None
+
+            content_type = response.headers.get('Content-Type', '')
+            if 'html' not in content_type and 'xml' not in content_type:
+                print(f"⚠️ Conteúdo não-HTML em {url}: {content_type}")
+                return None
+
+            # Charset só quando o servidor declara (senão vale o da própria página)
+            encoding = response.encoding if 'charset=' in content_type.lower() else None
+            return HtmlPage(response.url, response.text, response.status_code,
+                            content=response.content, encoding=encoding)
+        except requests.RequestException as e:
+            print(f"❌ Erro ao baixar {url}: {e}")
+            return None
+        except (lxml.etree.ParserError, ValueError) as e:
+            print(f"⚠️ HTML inválido em {url}: {e}")
+            return None
+
+    def fetch_many(self, urls: List[str], workers: Optional[int] = None) -> List[Optional[HtmlPage]]:
+        """
+        Baixa várias páginas em paralelo (reaproveitando o pool de conexões)
+
+        Args:
+            urls: Lista de URLs
+            workers: Quantidade de threads (padrão: tamanho do pool)
+
+        Returns:
+            list: HtmlPage (ou None) na mesma ordem das URLs
+        """
+        with ThreadPoolExecutor(max_workers=workers or self.pool_size) as executor:
+            return list(executor.map(self.fetch, urls))
+
+    def close(self):
+        """Fecha as conexões do pool"""
+        self.session.close()
@@ -0,0 +1,174 @@
+"""
+Presets de Inicialização do Chrome
+===================================
+
+Conjuntos nomeados de flags do Chrome:
+- "lean-headless": headless sem serviços em segundo plano (menos CPU/memória)
+- "visual-debug": janela visível com DevTools e logs detalhados
+
+O preset "lean-headless" pode usar o binário chrome-headless-shell
+(variável CHROME_HEADLESS_SHELL ou no PATH), que inicia mais rápido
+e consome menos memória que o Chrome completo. O shell não carrega
+extensões: quando a inicialização depende de uma (ex: proxy com
+autenticação), o Chrome completo é mantido. O chromedriver é resolvido
+pela versão do binário realmente usado.
+"""
+
+import os
+import re
+import shutil
+import subprocess
+from typing import Any, Dict, List, Optional
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+
+# Serviços do Chrome que não têm utilidade para scraping
+# (sem --renderer-process-limit: abas do TabPool/TabPrefetcher dividindo um
+# renderer travariam umas às outras; o custo é um renderer por aba aberta)
+LEAN_ARGS = [
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-extensions',
+    '--disable-sync',
+    '--disable-default-apps',
+    '--disable-breakpad',
+    '--disable-client-side-phishing-detection',
+    '--disable-domain-reliability',
+    '--disable-hang-monitor',
+    '--disable-prompt-on-repost',
+    '--metrics-recording-only',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--mute-audio',
+    '--password-store=basic',
+    '--use-mock-keychain',
+    '--disable-features=Translate,OptimizationHints,MediaRouter,'
+    'AutofillServerCommunication,InterestFeedContentSuggestions,'
+    'CalculateNativeWinOcclusion,BackForwardCache',
+]
+
+# Trocam o backend de criptografia dos cookies: um perfil salvo com o chaveiro
+# do sistema perderia a sessão. Só valem para Chrome sem perfil (ex: jar)
+KEYCHAIN_ARGS = {'--password-store=basic', '--use-mock-keychain'}
+
+VISUAL_DEBUG_ARGS = [
+    '--auto-open-devtools-for-tabs',
+    '--enable-logging=stderr',
+    '--v=1',
+]
+
+LAUNCH_PRESETS: Dict[str, Dict[str, Any]] = {
+    'default': {
+        'headless': None,  # None = respeita o parâmetro headless
+        'args': [],
+        'headless_shell': False,
+    },
+    'lean-headless': {
+        'headless': True,
+        'args': LEAN_ARGS,
+        'headless_shell': True,
+    },
+    'visual-debug': {
+        'headless': False,
+        'args': VISUAL_DEBUG_ARGS,
+        'headless_shell': False,
+    },
+}
+
+
+def get_preset(name: str) -> Dict[str, Any]:
+    """
+    Obtém um preset pelo nome
+
+    Raises:
+        ValueError: se o preset não existir
+    """
+    if name not in LAUNCH_PRESETS:
+        raise ValueError(
+            f"Preset desconhecido: {name} (disponíveis: {', '.join(LAUNCH_PRESETS)})"
+        )
+    return LAUNCH_PRESETS[name]
+
+
+def find_headless_shell() -> Optional[str]:
+    """
+    Localiza o binário chrome-headless-shell
+
+    Returns:
+        str: Caminho do binário ou None se não encontrado
+    """
+    path = os.environ.get('CHROME_HEADLESS_SHELL')
+    if path and os.path.isfile(path):
+        return path
+    return shutil.which('chrome-headless-shell')
+
+
+def browser_version(binary: str) -> Optional[str]:
+    """
+    Lê a versão de um binário do Chrome (ex: "120.0.6099.109")
+
+    Returns:
+        str: Versão ou None se não for possível executar o binário
+    """
+    try:
+        output = subprocess.run(
+            [binary, '--version'], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    match = re.search(r'(\d+\.\d+\.\d+\.\d+)', output)
+    return match.group(1) if match else None
+
+
+def chromedriver_path(binary: Optional[str] = None) -> str:
+    """
+    Instala/localiza o chromedriver compatível com o binário usado
+
+    Args:
+        binary: options.binary_location (vazio/None = Chrome instalado)
+
+    Returns:
+        str: Caminho do chromedriver
+    """
+    version = browser_version(binary) if binary else None
+    return ChromeDriverManager(driver_version=version).install()
+
+
+def apply_preset(options, name: str, allow_headless_shell: bool = True,
+                 persistent_profile: bool = False) -> Optional[str]:
+    """
+    Adiciona as flags de um preset às opções do Chrome
+
+    Args:
+        options: Options do Selenium
+        name: Nome do preset
+        allow_headless_shell: False quando a inicialização precisa de extensões
+                              (o chrome-headless-shell não as carrega)
+        persistent_profile: True quando o Chrome usa um perfil salvo (user-data-dir);
+                            omite as flags de chaveiro (KEYCHAIN_ARGS)
+
+    Returns:
+        str: Caminho do chrome-headless-shell usado (ou None)
+    """
+    preset = get_preset(name)
+    existing: List[str] = list(options.arguments)
+
+    for arg in preset['args']:
+        if persistent_profile and arg in KEYCHAIN_ARGS:
+            continue  # Cookies do perfil continuam legíveis
+        if arg not in existing:
+            options.add_argument(arg)
+
+    binary = None
+    if preset['headless_shell'] and not allow_headless_shell:
+        print("🧩 Extensões necessárias - usando o Chrome completo em vez do chrome-headless-shell")
+    elif preset['headless_shell']:
+        binary = find_headless_shell()
+        if binary:
+            options.binary_location = binary
+            print(f"🐚 Usando chrome-headless-shell: {binary}")
+
+    print(f"🎛️ Preset de inicialização: {name}")
+    return binary
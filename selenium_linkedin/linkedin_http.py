@@ -0,0 +1,196 @@
+"""
+Busca de Pessoas via HTTP (sem navegador)
+==========================================
+
+Chama diretamente os endpoints JSON que o app web do LinkedIn usa na
+busca, reaproveitando os cookies da sessão exportada (jar) e o token
+CSRF (derivado do cookie JSESSIONID). Os resultados passam pelo mesmo
+parse_people da captura de rede.
+
+O navegador fica restrito ao login e a fallbacks. base_url permite
+apontar o cliente para um servidor local que simula o LinkedIn.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Set
+from urllib.parse import quote, urlsplit
+
+from .cookie_jar import load_jar
+from .http_backend import HttpFetcher
+from .linkedin_parser import parse_people
+
+
+# Endpoint de busca (mesmo padrão de SEARCH_URL_PATTERNS)
+SEARCH_PATH = "/voyager/api/search/dash/clusters"
+SEARCH_DECORATION_ID = "com.linkedin.voyager.dash.deco.search.SearchClusterCollection-174"
+
+# Headers enviados pelo app web nas chamadas Voyager
+VOYAGER_HEADERS = {
+    'Accept': 'application/vnd.linkedin.normalized+json+2.1',
+    'x-restli-protocol-version': '2.0.0',
+    'x-li-lang': 'pt_BR',
+}
+
+
+class HttpSearchError(Exception):
+    """
+    A busca HTTP falhou (sessão expirada, bloqueio ou resposta inesperada)
+
+    Lançada por search_people, traz o que já foi coletado: `people` (pessoas
+    das páginas anteriores, já descontadas da cota) e `next_page` (página que
+    falhou, de onde a busca deve continuar).
+    """
+
+    def __init__(self, message: str, people: Optional[List[Dict[str, str]]] = None,
+                 next_page: int = 1):
+        super().__init__(message)
+        self.people = people if people is not None else []
+        self.next_page = next_page
+
+
+class LinkedInHttpClient:
+    """
+    Cliente HTTP da busca de pessoas do LinkedIn usando a sessão exportada
+    """
+
+    def __init__(
+        self,
+        jar_path: Optional[str] = None,
+        cookies: Optional[List[Dict[str, Any]]] = None,
+        base_url: str = "https://www.linkedin.com",
+        proxy: Optional[Dict[str, str]] = None,
+        timeout: float = 20
+    ):
+        """
+        Inicializa o cliente
+
+        Args:
+            jar_path: Jar da sessão (SessionManager.export_jar)
+            cookies: Cookies no formato do CDP (alternativa ao jar)
+            base_url: Origem da API (ex: "http://127.0.0.1:8000" para testes)
+            proxy: Dict de proxy no formato do ProxyManager
+            timeout: Timeout de cada requisição em segundos
+        """
+        if jar_path:
+            cookies = load_jar(jar_path)['cookies']
+        if not cookies:
+            raise ValueError("Informe jar_path ou cookies da sessão")
+
+        self.base_url = base_url.rstrip('/')
+        self.fetcher = HttpFetcher(pool_size=4, timeout=timeout, proxy=proxy, headers=VOYAGER_HEADERS)
+        self.session = self.fetcher.session
+        self.requests = 0
+
+        # Todos os cookies da sessão vão para o host da API (também em servidores de teste)
+        host = urlsplit(self.base_url).hostname
+        for cookie in cookies:
+            self.session.cookies.set(cookie['name'], cookie['value'], domain=host, path='/')
+
+        # O LinkedIn exige o JSESSIONID (sem aspas) repetido no header csrf-token
+        jsessionid = next((c['value'] for c in cookies if c['name'] == 'JSESSIONID'), None)
+        if not jsessionid:
+            raise ValueError("Cookie JSESSIONID ausente na sessão (necessário para o token CSRF)")
+        self.session.headers['csrf-token'] = jsessionid.strip('"')
+
+    def build_search_url(self, query: str, start: int = 0, count: int = 10) -> str:
+        """
+        Monta a URL da busca de pessoas (parâmetros no formato Rest.li)
+
+        Args:
+            query: Termo de busca
+            start: Índice do primeiro resultado
+            count: Resultados por página
+        """
+        keywords = quote(query, safe='')
+        rest_query = (
+            f"(keywords:{keywords},flagshipSearchIntent:SEARCH_SRP,"
+            f"queryParameters:(resultType:List(PEOPLE)),includeFiltersInResponse:false)"
+        )
+        return (
+            f"{self.base_url}{SEARCH_PATH}?decorationId={SEARCH_DECORATION_ID}"
+            f"&origin=GLOBAL_SEARCH_HEADER&q=all&query={rest_query}&start={start}&count={count}"
+        )
+
+    def _get_json(self, url: str) -> Any:
+        """GET de um endpoint JSON, convertendo falhas em HttpSearchError"""
+        try:
+            response = self.session.get(url, timeout=self.fetcher.timeout, allow_redirects=False)
+        except Exception as e:
+            raise HttpSearchError(f"Erro de conexão: {e}") from e
+
+        self.requests += 1
+
+        if response.status_code in (401, 403) or response.is_redirect:
+            raise HttpSearchError(f"Sessão recusada (HTTP {response.status_code}) - refaça o login")
+        if response.status_code == 999:
+            raise HttpSearchError("Requisição bloqueada pelo LinkedIn (HTTP 999)")
+        if response.status_code >= 400:
+            raise HttpSearchError(f"HTTP {response.status_code} na busca")
+
+        try:
+            return response.json()
+        except ValueError as e:
+            raise HttpSearchError("Resposta da busca não é JSON") from e
+
+    def fetch_search_page(self, query: str, page: int = 1, page_size: int = 10) -> Any:
+        """
+        Baixa o JSON de uma página de resultados (1 = primeira)
+
+        Raises:
+            HttpSearchError: se a sessão for recusada ou a resposta for inesperada
+        """
+        return self._get_json(self.build_search_url(query, (page - 1) * page_size, page_size))
+
+    def search_people(self, query: str, max_results: int = 10, page_size: int = 10,
+                      max_pages: int = 10, before_page: Optional[Callable[[int], bool]] = None,
+                      seen: Optional[Set[str]] = None, start_page: int = 1) -> List[Dict[str, str]]:
+        """
+        Busca pessoas percorrendo as páginas de resultados
+
+        Args:
+            query: Termo de busca
+            max_results: Máximo de pessoas novas
+            page_size: Resultados por requisição
+            max_pages: Máximo de páginas
+            before_page: Chamada antes de cada requisição com o número da página
+                         (ex: cota da conta, renovação do proxy); False encerra a busca
+            seen: URLs de perfis já coletados (não contam como novos)
+            start_page: Primeira página a baixar (retomada de uma busca interrompida)
+
+        Returns:
+            list: Dicts com 'name', 'headline', 'location' e 'profile_url'
+
+        Raises:
+            HttpSearchError: se a sessão for recusada ou a resposta for inesperada
+                             (com as pessoas já coletadas e a página que falhou)
+        """
+        people = []
+        seen = set(seen or ())
+
+        for page in range(start_page, max_pages + 1):
+            if before_page and not before_page(page):
+                break
+
+            try:
+                payload = self.fetch_search_page(query, page, page_size)
+            except HttpSearchError as e:
+                e.people, e.next_page = people, page
+                raise
+
+            new_on_page = 0
+            for person in parse_people(payload):
+                if person['profile_url'] in seen:
+                    continue
+                seen.add(person['profile_url'])
+                people.append(person)
+                new_on_page += 1
+                if len(people) >= max_results:
+                    return people
+
+            if new_on_page == 0:
+                break  # Fim dos resultados
+
+        return people
+
+    def close(self):
+        """Fecha o pool de conexões"""
+        self.fetcher.close()
@@ -0,0 +1,82 @@
+"""
+Parser das Respostas JSON do LinkedIn
+======================================
+
+Extrai registros de pessoas (nome, headline, localização, URL do perfil)
+das respostas JSON que o app web do LinkedIn carrega na busca.
+"""
+
+import re
+from typing import Any, Dict, Iterator, List
+
+
+# Endpoints JSON usados pela página de busca de pessoas
+SEARCH_URL_PATTERNS = [
+    r'/voyager/api/graphql\?.*voyagerSearchDashClusters',
+    r'/voyager/api/search/dash/clusters',
+]
+
+
+def _text(value: Any) -> str:
+    """Obtém o texto de um campo TextViewModel ({'text': ...}) ou string"""
+    if isinstance(value, dict):
+        value = value.get('text')
+    return value.strip() if isinstance(value, str) else ''
+
+
+def _clean_profile_url(url: str) -> str:
+    """Remove parâmetros de rastreamento da URL do perfil"""
+    if not url:
+        return ''
+    return re.sub(r'[?#].*$', '', url)
+
+
+def _iter_entities(payload: Any) -> Iterator[Dict[str, Any]]:
+    """Percorre recursivamente todos os dicts do JSON"""
+    if isinstance(payload, dict):
+        yield payload
+        for value in payload.values():
+            yield from _iter_entities(value)
+    elif isinstance(payload, list):
+        for value in payload:
+            yield from _iter_entities(value)
+
+
+def parse_people(payload: Any) -> List[Dict[str, str]]:
+    """
+    Extrai registros de pessoas de uma resposta JSON de busca
+
+    Procura entidades do tipo EntityResultViewModel (formato "included"
+    normalizado ou aninhado na resposta GraphQL).
+
+    Args:
+        payload: JSON decodificado da resposta
+
+    Returns:
+        list: Dicts com 'name', 'headline', 'location' e 'profile_url'
+    """
+    people = []
+    seen = set()
+
+    for entity in _iter_entities(payload):
+        entity_type = entity.get('$type', '') or entity.get('__typename', '')
+        if not entity_type.endswith('EntityResultViewModel'):
+            continue
+
+        profile_url = _clean_profile_url(entity.get('navigationUrl', ''))
+        if '/in/' not in profile_url:
+            continue  # Não é perfil de pessoa (empresa, grupo, etc)
+
+        name = _text(entity.get('title'))
+        if not name or profile_url in seen:
+            continue
+
+        seen.add(profile_url)
+        people.append({
+            'name': name,
+            'headline': _text(entity.get('primarySubtitle')),
+            'location': _text(entity.get('secondarySubtitle')),
+            'profile_url': profile_url,
+        })
+
+    return people
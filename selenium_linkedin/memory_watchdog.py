@@ -0,0 +1,190 @@
+"""
+Watchdog de Memória do Navegador
+=================================
+
+Mede a memória (RSS) da árvore de processos do Chrome controlado pelo
+driver e o heap JS da aba atual. Decide quando:
+- limpar caches via CDP (memória moderada)
+- reciclar o navegador (memória alta ou muitas páginas carregadas)
+
+A reciclagem em si (fechar e abrir o Chrome com o mesmo perfil e proxy)
+fica a cargo do scraper.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import psutil
+
+
+# Ações retornadas por MemoryWatchdog.after_page
+ACTION_OK = "ok"
+ACTION_CLEARED = "cleared"
+ACTION_RECYCLE = "recycle"
+
+
+class MemoryWatchdog:
+    """
+    Monitora a memória do Chrome e indica quando limpar caches ou reciclar
+    """
+
+    def __init__(
+        self,
+        max_pages: int = 200,
+        max_rss_mb: float = 2500,
+        clear_rss_mb: float = 1500,
+        max_tab_heap_mb: float = 512
+    ):
+        """
+        Inicializa o watchdog
+
+        Args:
+            max_pages: Páginas carregadas antes de reciclar o navegador
+            max_rss_mb: Memória total do Chrome (MB) que força reciclagem
+            clear_rss_mb: Memória total do Chrome (MB) que dispara limpeza de caches
+            max_tab_heap_mb: Heap JS da aba atual (MB) que força reciclagem
+        """
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.clear_rss_mb = clear_rss_mb
+        self.max_tab_heap_mb = max_tab_heap_mb
+
+        self.pages = 0
+        self.recycles = 0
+        self.clears = 0
+        self.peak_rss_mb = 0.0
+        self.last_rss_mb = 0.0
+
+    @staticmethod
+    def debugger_pid(driver) -> Optional[int]:
+        """
+        Pid do Chrome que escuta na porta de depuração do driver
+
+        Returns:
+            int: Pid do processo principal do Chrome, ou None se não for local
+        """
+        try:
+            address = driver.capabilities.get('goog:chromeOptions', {}).get('debuggerAddress') or ''
+            port = int(address.rsplit(':', 1)[-1])
+            for connection in psutil.net_connections(kind='tcp'):
+                if connection.status == psutil.CONN_LISTEN and connection.laddr.port == port:
+                    return connection.pid
+        except (AttributeError, ValueError, psutil.Error):
+            pass
+        return None
+
+    @classmethod
+    def get_process_tree(cls, driver) -> List[psutil.Process]:
+        """
+        Retorna os processos do Chrome controlado pelo driver
+
+        Com o Chrome anexado (debugger_address, daemon) o chromedriver local
+        não é pai do navegador: a árvore parte do Chrome que escuta na porta
+        de depuração.
+
+        Returns:
+            list: Processos (chromedriver + Chrome + renderers), vazio se indisponível
+        """
+        try:
+            root = psutil.Process(driver.service.process.pid)
+            tree = [root] + root.children(recursive=True)
+        except (AttributeError, psutil.Error):
+            tree = []  # Driver remoto: sem chromedriver local
+
+        if len(tree) > 1:
+            return tree  # Chrome iniciado pelo chromedriver
+
+        pid = cls.debugger_pid(driver)
+        if not pid:
+            return tree
+        try:
+            browser = psutil.Process(pid)
+            return tree + [browser] + browser.children(recursive=True)
+        except psutil.Error:
+            return tree
+
+    def browser_rss_mb(self, driver) -> float:
+        """Memória residente total (MB) da árvore de processos do Chrome"""
+        total = 0
+        for process in self.get_process_tree(driver):
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue  # Processo terminou durante a leitura
+        return total / (1024 * 1024)
+
+    @staticmethod
+    def tab_heap_mb(driver) -> float:
+        """Heap JS (MB) da aba atual via CDP"""
+        try:
+            driver.execute_cdp_cmd('Performance.enable', {})
+            metrics = driver.execute_cdp_cmd('Performance.getMetrics', {}).get('metrics', [])
+            values = {m['name']: m['value'] for m in metrics}
+            return values.get('JSHeapTotalSize', 0) / (1024 * 1024)
+        except Exception:
+            return 0.0
+
+    @staticmethod
+    def clear_caches(driver):
+        """Libera memória sem reiniciar: cache HTTP e coleta de lixo JS"""
+        try:
+            driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+            driver.execute_cdp_cmd('HeapProfiler.collectGarbage', {})
+        except Exception as e:
+            print(f"⚠️ Não foi possível limpar caches: {e}")
+
+    def after_page(self, driver) -> str:
+        """
+        Registra uma página carregada e decide a ação
+
+        Args:
+            driver: WebDriver do Chrome
+
+        Returns:
+            str: ACTION_OK, ACTION_CLEARED ou ACTION_RECYCLE
+        """
+        self.pages += 1
+
+        rss = self.browser_rss_mb(driver)
+        self.last_rss_mb = rss
+        self.peak_rss_mb = max(self.peak_rss_mb, rss)
+
+        if self.pages >= self.max_pages:
+            print(f"♻️ {self.pages} páginas carregadas - reciclando navegador")
+            return ACTION_RECYCLE
+
+        if rss >= self.max_rss_mb:
+            print(f"♻️ Chrome usando {rss:.0f} MB (limite {self.max_rss_mb:.0f} MB) - reciclando navegador")
+            return ACTION_RECYCLE
+
+        heap = self.tab_heap_mb(driver)
+        if heap >= self.max_tab_heap_mb:
+            print(f"♻️ Aba com {heap:.0f} MB de heap JS - reciclando navegador")
+            return ACTION_RECYCLE
+
+        if rss >= self.clear_rss_mb:
+            print(f"🧹 Chrome usando {rss:.0f} MB - limpando caches")
+            self.clear_caches(driver)
+            self.clears += 1
+            return ACTION_CLEARED
+
+        return ACTION_OK
+
+    def mark_recycled(self):
+        """Registra que o navegador foi reciclado (zera o contador de páginas)"""
+        self.recycles += 1
+        self.pages = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do watchdog
+
+        Returns:
+            Dict com estatísticas
+        """
+        return {
+            'pages_since_recycle': self.pages,
+            'recycles': self.recycles,
+            'cache_clears': self.clears,
+            'last_rss_mb': round(self.last_rss_mb, 1),
+            'peak_rss_mb': round(self.peak_rss_mb, 1),
+        }
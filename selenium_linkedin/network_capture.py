@@ -0,0 +1,168 @@
+"""
+Captura de Respostas de Rede via CDP
+=====================================
+
+Lê os eventos Network.* do Chrome (logs de performance) e obtém o corpo
+das respostas JSON que interessam, enquanto a página carrega.
+
+Requer um driver criado com ChromeConfig(capture_network=True).
+"""
+
+import base64
+import json
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class NetworkCapture:
+    """
+    Captura respostas JSON de rede usando eventos do Chrome DevTools Protocol
+    """
+
+    def __init__(self, driver, url_patterns: Optional[Iterable[str]] = None):
+        """
+        Inicializa a captura
+
+        Args:
+            driver: WebDriver do Chrome (com logs de performance habilitados)
+            url_patterns: Regex de URLs cujas respostas devem ser lidas
+                          (None = todas as respostas JSON)
+        """
+        self.driver = driver
+        self.url_patterns = [re.compile(p) for p in (url_patterns or [])]
+        self.listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+        self.responses: List[Dict[str, Any]] = []
+
+        # requestId -> URL das respostas aguardando o fim do carregamento
+        self._pending: Dict[str, str] = {}
+
+    def add_listener(self, listener: Callable[[str, Dict[str, Any]], None]):
+        """
+        Registra uma função chamada para cada evento de rede
+
+        Args:
+            listener: Função (method, params)
+        """
+        self.listeners.append(listener)
+
+    def _matches(self, url: str) -> bool:
+        """Verifica se a URL interessa à captura"""
+        if not self.url_patterns:
+            return True
+        return any(pattern.search(url) for pattern in self.url_patterns)
+
+    def poll(self) -> int:
+        """
+        Processa os eventos de rede acumulados desde a última leitura
+
+        Returns:
+            int: Quantidade de respostas novas capturadas
+        """
+        captured = 0
+
+        for entry in self.driver.get_log('performance'):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+
+            method = message.get('method', '')
+            params = message.get('params', {})
+
+            for listener in self.listeners:
+                listener(method, params)
+
+            if method == 'Network.responseReceived':
+                response = params.get('response', {})
+                url = response.get('url', '')
+                mime_type = response.get('mimeType', '')
+
+                if 'json' in mime_type and self._matches(url):
+                    self._pending[params['requestId']] = url
+
+            elif method == 'Network.loadingFinished':
+                url = self._pending.pop(params.get('requestId'), None)
+                if url and self._read_body(params['requestId'], url):
+                    captured += 1
+
+            elif method == 'Network.loadingFailed':
+                self._pending.pop(params.get('requestId'), None)
+
+        return captured
+
+    def _read_body(self, request_id: str, url: str) -> bool:
+        """
+        Lê e decodifica o corpo JSON de uma resposta
+
+        Returns:
+            True se o corpo foi capturado
+        """
+        try:
+            result = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+            body = result.get('body', '')
+            if result.get('base64Encoded'):
+                body = base64.b64decode(body).decode('utf-8', errors='replace')
+
+            self.responses.append({'url': url, 'data': json.loads(body)})
+            return True
+        except Exception as e:
+            print(f"⚠️ Não foi possível ler resposta de {url[:80]}: {e}")
+            return False
+
+    def _page_loaded(self) -> bool:
+        """True se o documento terminou de carregar"""
+        try:
+            return self.driver.execute_script("return document.readyState") == 'complete'
+        except Exception:
+            return False
+
+    def wait_for_responses(self, timeout: float = 15, min_count: int = 1, settle: float = 1.0,
+                           until_loaded: bool = False) -> List[Dict[str, Any]]:
+        """
+        Aguarda respostas capturadas e as retorna (limpando o buffer)
+
+        Args:
+            timeout: Tempo máximo de espera em segundos
+            min_count: Quantidade mínima de respostas esperadas
+            settle: Tempo extra sem novas respostas antes de retornar
+            until_loaded: Se True, desiste assim que a página terminar de carregar
+                          sem respostas em andamento (a página não tem o JSON esperado)
+
+        Returns:
+            list: Dicts com 'url' e 'data' (JSON decodificado)
+        """
+        deadline = time.time() + timeout
+        last_capture = time.time()
+        loaded_at = None
+
+        while time.time() < deadline:
+            if self.poll():
+                last_capture = time.time()
+
+            if len(self.responses) >= min_count and time.time() - last_capture >= settle:
+                break
+
+            if until_loaded and not self._pending:
+                if loaded_at is None and self._page_loaded():
+                    loaded_at = time.time()
+                # Página carregada e nada chegou no período de folga: não vai chegar
+                if loaded_at and time.time() - max(loaded_at, last_capture) >= settle:
+                    break
+            else:
+                loaded_at = None
+
+            time.sleep(0.2)
+
+        return self.take_responses()
+
+    def take_responses(self) -> List[Dict[str, Any]]:
+        """Retorna as respostas capturadas e limpa o buffer"""
+        responses, self.responses = self.responses, []
+        return responses
+
+    def clear(self):
+        """Descarta eventos e respostas acumulados"""
+        self.poll()
+        self._pending.clear()
+        self.responses = []
@@ -0,0 +1,128 @@
+"""
+Pré-carregamento da Próxima Página
+===================================
+
+Carrega a página N+1 em uma aba de fundo enquanto a página N é extraída.
+Quando o chamador avança, a aba pré-carregada passa a ser a aba atual
+(sem novo carregamento) e a aba anterior vira a aba de fundo.
+
+A espera usa Runtime.evaluate (CDP): um execute_script numa aba que ainda
+está navegando bloqueia até o fim do carregamento, e o page_timeout não
+seria respeitado.
+"""
+
+import time
+from typing import Any, Callable, Optional
+
+
+class TabPrefetcher:
+    """
+    Pré-carrega uma URL em uma aba de fundo do mesmo Chrome
+    """
+
+    def __init__(
+        self,
+        driver,
+        page_timeout: float = 30,
+        poll_interval: float = 0.1,
+        configure_tab: Optional[Callable[[Any], None]] = None
+    ):
+        """
+        Inicializa o pré-carregador
+
+        Args:
+            driver: WebDriver do Chrome
+            page_timeout: Tempo máximo de carregamento da página (segundos)
+            poll_interval: Intervalo entre verificações do carregamento (segundos)
+            configure_tab: Chamada com o driver na aba de fundo recém-criada (ex:
+                           ChromeConfig.configure_tab: bloqueio, anti-detecção)
+        """
+        self.driver = driver
+        self.page_timeout = page_timeout
+        self.poll_interval = poll_interval
+        self.configure_tab = configure_tab
+
+        self.spare_handle: Optional[str] = None
+        self.url: Optional[str] = None
+        self.started = 0.0
+
+    def prefetch(self, url: str):
+        """
+        Começa a carregar a URL na aba de fundo (sem esperar)
+
+        Args:
+            url: URL da próxima página
+        """
+        current = self.driver.current_window_handle
+
+        if self.spare_handle is None:
+            self.driver.switch_to.new_window('tab')
+            self.spare_handle = self.driver.current_window_handle
+            # Depois do take() esta aba vira a atual: precisa da mesma configuração da primeira
+            if self.configure_tab:
+                self.configure_tab(self.driver)
+        else:
+            self.driver.switch_to.window(self.spare_handle)
+
+        # A marca some quando o novo documento substitui o anterior
+        self.driver.execute_script(
+            "window.__prefetchPending = true; window.location.href = arguments[0];", url
+        )
+        self.url = url
+        self.started = time.time()
+
+        self.driver.switch_to.window(current)
+
+    def take(self) -> bool:
+        """
+        Troca para a aba pré-carregada, esperando o fim do carregamento
+
+        Returns:
+            True se a página pré-carregada está pronta na aba atual,
+            False se não havia pré-carregamento ou se ele falhou
+        """
+        if not self.url or self.spare_handle is None:
+            return False
+
+        previous = self.driver.current_window_handle
+        self.driver.switch_to.window(self.spare_handle)
+        self.url = None
+
+        while time.time() - self.started < self.page_timeout:
+            try:
+                response = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+                    'expression': "!window.__prefetchPending && document.readyState === 'complete'",
+                    'returnByValue': True,
+                    'timeout': 1000,
+                })
+                if response.get('result', {}).get('value'):
+                    # A aba anterior passa a ser a aba de fundo
+                    self.spare_handle = previous
+                    return True
+            except Exception:
+                pass  # Documento trocando durante a verificação
+
+            time.sleep(self.poll_interval)
+
+        print(f"⚠️ Pré-carregamento excedeu {self.page_timeout}s")
+        try:
+            self.driver.execute_cdp_cmd('Page.stopLoading', {})
+        except Exception:
+            pass  # Aba travada: a próxima navegação substitui o documento
+        self.driver.switch_to.window(previous)
+        return False
+
+    def close(self):
+        """Fecha a aba de fundo"""
+        if self.spare_handle is None:
+            return
+
+        current = self.driver.current_window_handle
+        try:
+            self.driver.switch_to.window(self.spare_handle)
+            self.driver.close()
+        except Exception:
+            pass  # Aba já fechada
+        finally:
+            self.spare_handle = None
+            self.driver.switch_to.window(current)
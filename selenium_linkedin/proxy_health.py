@@ -0,0 +1,265 @@
+"""
+Verificação de Saúde dos Proxies
+=================================
+
+Testa todos os proxies em paralelo (threads) contra uma URL de checagem
+e registra latência, taxa de sucesso e IP de saída de cada um.
+
+A rotação HEALTH_WEIGHTED do ProxyManager usa esses dados para sortear
+proxies rápidos com mais frequência e pular os mortos, evitando abrir o
+Chrome com um proxy que não responde.
+
+A URL de checagem é configurável (ex: um servidor local para testes);
+respostas JSON no formato do ipinfo.io ou do httpbin.org/ip são lidas.
+
+Com um ProxyRegistry, os resultados são gravados em SQLite e reaproveitados
+nas próximas execuções.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from .proxy_registry import ProxyRegistry
+
+
+DEFAULT_CHECK_URL = "http://ipinfo.io/json"
+
+# Falhas seguidas para considerar um proxy morto
+DEAD_AFTER_FAILURES = 2
+
+# Peso da última medição na média móvel de latência
+LATENCY_SMOOTHING = 0.3
+
+
+class ProxyHealthChecker:
+    """
+    Verifica proxies em paralelo e mantém as estatísticas de saúde de cada um
+    """
+
+    def __init__(
+        self,
+        check_url: str = DEFAULT_CHECK_URL,
+        timeout: float = 10,
+        max_workers: int = 20,
+        registry: Optional[ProxyRegistry] = None
+    ):
+        """
+        Inicializa o verificador
+
+        Args:
+            check_url: URL acessada através de cada proxy
+            timeout: Timeout de cada verificação em segundos
+            max_workers: Verificações simultâneas
+            registry: Registro persistente (grava cada resultado e fornece os anteriores)
+        """
+        self.check_url = check_url
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.registry = registry
+
+        # Estatísticas por proxy (chave: URL do proxy)
+        self.health: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def check_proxy(self, proxy: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Verifica um proxy (sem registrar o resultado)
+
+        Returns:
+            Dict com 'proxy', 'ok', 'latency_ms', 'exit_ip', 'country', 'city' e 'error'
+        """
+        result: Dict[str, Any] = {
+            'proxy': proxy['http'], 'ok': False, 'latency_ms': None,
+            'exit_ip': None, 'country': None, 'city': None, 'error': None,
+        }
+        start = time.perf_counter()
+
+        try:
+            response = requests.get(
+                self.check_url,
+                proxies={'http': proxy['http'], 'https': proxy['https']},
+                timeout=self.timeout
+            )
+            result['latency_ms'] = round((time.perf_counter() - start) * 1000)
+
+            if response.status_code != 200:
+                result['error'] = f"HTTP {response.status_code}"
+                return result
+
+            try:
+                data = response.json()
+            except ValueError:
+                data = {'ip': response.text.strip()[:64]}
+
+            result['ok'] = True
+            result['exit_ip'] = data.get('ip') or data.get('origin')
+            result['country'] = data.get('country')
+            result['city'] = data.get('city')
+        except Exception as e:
+            result['error'] = type(e).__name__
+
+        return result
+
+    def record(self, result: Dict[str, Any]):
+        """Registra o resultado de uma verificação (ou de um uso real do proxy)"""
+        with self._lock:
+            entry = self.health.setdefault(result['proxy'], {
+                'checks': 0, 'successes': 0, 'consecutive_failures': 0,
+                'latency_ms': None, 'exit_ip': None, 'country': None, 'city': None,
+                'last_check': None, 'last_error': None,
+            })
+            entry['checks'] += 1
+            entry['last_check'] = time.time()
+
+            if result['ok']:
+                entry['successes'] += 1
+                entry['consecutive_failures'] = 0
+                if result.get('latency_ms') is not None:
+                    previous = entry['latency_ms']
+                    entry['latency_ms'] = result['latency_ms'] if previous is None else round(
+                        previous + LATENCY_SMOOTHING * (result['latency_ms'] - previous)
+                    )
+                for field in ('exit_ip', 'country', 'city'):
+                    entry[field] = result.get(field) or entry[field]
+            else:
+                entry['consecutive_failures'] += 1
+                entry['last_error'] = result.get('error')
+
+            if self.registry:
+                self.registry.record(
+                    result['proxy'], entry, healthy=not self._entry_is_dead(entry),
+                    ok=result['ok'], latency_ms=result.get('latency_ms')
+                )
+
+    def load_saved(self, proxies: List[Dict[str, str]]) -> int:
+        """
+        Carrega do registro as estatísticas já medidas dos proxies
+
+        Returns:
+            int: Quantidade de proxies com histórico
+        """
+        if not self.registry:
+            return 0
+        saved = self.registry.load_health([p['http'] for p in proxies])
+        with self._lock:
+            self.health.update(saved)
+        return len(saved)
+
+    def check_all(self, proxies: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Verifica todos os proxies em paralelo e registra os resultados
+
+        Returns:
+            Lista de resultados (mesma ordem dos proxies)
+        """
+        if not proxies:
+            return []
+
+        print(f"🩺 Verificando {len(proxies)} proxies (até {self.max_workers} em paralelo)...")
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(proxies))) as executor:
+            results = list(executor.map(self.check_proxy, proxies))
+
+        for result in results:
+            self.record(result)
+
+        alive = sum(1 for r in results if r['ok'])
+        print(f"✅ {alive}/{len(results)} proxies respondendo ({time.perf_counter() - start:.1f}s)")
+        return results
+
+    @staticmethod
+    def _entry_is_dead(entry: Dict[str, Any]) -> bool:
+        """Falhou nas últimas verificações (ou na única feita)"""
+        return entry['checks'] > 0 and entry['consecutive_failures'] >= min(DEAD_AFTER_FAILURES, entry['checks'])
+
+    def is_dead(self, proxy: Dict[str, str]) -> bool:
+        """True se o proxy falhou nas últimas verificações"""
+        entry = self.health.get(proxy['http'])
+        return bool(entry) and self._entry_is_dead(entry)
+
+    def weight(self, proxy: Dict[str, str]) -> float:
+        """
+        Peso do proxy no sorteio: taxa de sucesso / latência (0 = morto)
+
+        Proxies ainda não verificados recebem um peso neutro.
+        """
+        entry = self.health.get(proxy['http'])
+        if not entry or not entry['checks']:
+            return 1.0
+        if self.is_dead(proxy):
+            return 0.0
+
+        success_rate = entry['successes'] / entry['checks']
+        latency_s = max(entry['latency_ms'] or 1000, 50) / 1000
+        return success_rate / latency_s
+
+    def choose(self, proxies: List[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """
+        Sorteia um proxy ponderado pela saúde, pulando os mortos
+
+        Returns:
+            Dict do proxy ou None se todos estiverem mortos
+        """
+        weights = [self.weight(p) for p in proxies]
+        if not any(weights):
+            return None
+        return random.choices(proxies, weights=weights, k=1)[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas gerais da saúde dos proxies
+
+        Returns:
+            Dict com estatísticas
+        """
+        entries = list(self.health.values())
+        latencies = [e['latency_ms'] for e in entries if e['latency_ms'] is not None]
+        return {
+            'checked': len(entries),
+            'dead': sum(1 for e in entries if self._entry_is_dead(e)),
+            'avg_latency_ms': round(sum(latencies) / len(latencies)) if latencies else None,
+        }
+
+
+def main():
+    """CLI: verifica os proxies de um arquivo"""
+    import argparse
+    from .proxy_manager import ProxyManager
+
+    parser = argparse.ArgumentParser(description="Verifica a saúde dos proxies em paralelo")
+    parser.add_argument('--proxies', default="proxies.txt", help="Arquivo de proxies")
+    parser.add_argument('--url', default=DEFAULT_CHECK_URL, help="URL de checagem")
+    parser.add_argument('--timeout', type=float, default=10, help="Timeout por proxy (s)")
+    parser.add_argument('--workers', type=int, default=20, help="Verificações simultâneas")
+    parser.add_argument('--registry', help="Banco SQLite onde gravar os resultados")
+    args = parser.parse_args()
+
+    manager = ProxyManager(proxy_file=args.proxies)
+    registry = ProxyRegistry(args.registry) if args.registry else None
+    checker = ProxyHealthChecker(check_url=args.url, timeout=args.timeout, max_workers=args.workers,
+                                 registry=registry)
+    results = checker.check_all(manager.proxies)
+
+    print("\n" + "=" * 60)
+    for proxy, result in zip(manager.proxies, results):
+        display = manager._get_proxy_display(proxy)
+        if result['ok']:
+            location = ', '.join(filter(None, [result['city'], result['country']])) or '?'
+            print(f"✅ {display} | {result['latency_ms']} ms | IP: {result['exit_ip']} | {location}")
+        else:
+            print(f"❌ {display} | {result['error']}")
+    print("=" * 60)
+
+    if registry:
+        print(f"💾 Registro: {registry.get_stats()}")
+        registry.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Leases de Proxy entre Processos
+================================
+
+Distribui proxies entre scrapers rodando em paralelo (vários processos)
+sem que dois workers peguem o mesmo proxy por lerem o mesmo índice.
+
+Cada worker recebe um lease com prazo (TTL):
+- exclusivo: ninguém mais usa o proxy enquanto o lease durar
+- compartilhado: até max_shared workers dividem o proxy
+
+O estado fica em um arquivo JSON protegido por FileLock e só é gravado
+ao obter, renovar ou devolver um lease. Leases de processos que morreram
+ou com prazo vencido são descartados automaticamente.
+"""
+
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+import psutil
+
+from .file_lock import FileLock, read_json, write_json_atomic
+
+
+class ProxyLease:
+    """
+    Proxy reservado para um worker (devolver com release)
+    """
+
+    def __init__(self, allocator: 'ProxyLeaseAllocator', proxy: Dict[str, str], lease_id: str,
+                 exclusive: bool, expires_at: float, ttl: float):
+        self.allocator = allocator
+        self.proxy = proxy
+        self.lease_id = lease_id
+        self.exclusive = exclusive
+        self.expires_at = expires_at
+        self.ttl = ttl
+
+    def renew(self, ttl: Optional[float] = None) -> bool:
+        """Estende o prazo do lease (False se ele já expirou e foi descartado)"""
+        return self.allocator.renew(self, ttl)
+
+    def renew_if_needed(self) -> bool:
+        """Renova só quando passou da metade do prazo (evita gravações frequentes)"""
+        if self.expires_at - time.time() > self.ttl / 2:
+            return True
+        return self.renew()
+
+    def release(self):
+        """Devolve o proxy"""
+        self.allocator.release(self)
+
+
+class ProxyLeaseAllocator:
+    """
+    Alocador de proxies por lease, com estado atômico compartilhado entre processos
+    """
+
+    def __init__(
+        self,
+        state_file: str = "proxy_leases.json",
+        ttl: float = 1800,
+        max_shared: int = 3
+    ):
+        """
+        Inicializa o alocador
+
+        Args:
+            state_file: Arquivo de estado compartilhado entre processos
+            ttl: Prazo padrão dos leases em segundos
+            max_shared: Workers por proxy em leases compartilhados
+        """
+        if max_shared < 1:
+            raise ValueError("max_shared deve ser pelo menos 1")
+
+        self.state_file = state_file
+        self.ttl = ttl
+        self.max_shared = max_shared
+        self.lock = FileLock(f"{state_file}.lock")
+
+    def _load(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Lê o estado descartando leases vencidos ou de processos mortos (chamar com o lock)"""
+        state = read_json(self.state_file, {})
+        now = time.time()
+
+        for url in list(state):
+            state[url] = [
+                lease for lease in state[url]
+                if lease['expires_at'] > now and psutil.pid_exists(lease['pid'])
+            ]
+            if not state[url]:
+                del state[url]
+        return state
+
+    def _has_room(self, holders: List[Dict[str, Any]], exclusive: bool) -> bool:
+        """True se o proxy aceita mais um lease do tipo pedido"""
+        if exclusive:
+            return not holders
+        return len(holders) < self.max_shared and not any(h['exclusive'] for h in holders)
+
+    def acquire(
+        self,
+        proxies: List[Dict[str, str]],
+        exclusive: bool = True,
+        ttl: Optional[float] = None
+    ) -> Optional[ProxyLease]:
+        """
+        Reserva o proxy menos ocupado (empates seguem a ordem da lista)
+
+        Args:
+            proxies: Candidatos em ordem de preferência
+            exclusive: Se True, o proxy não é dividido com outros workers
+            ttl: Prazo do lease em segundos (padrão: o do alocador)
+
+        Returns:
+            ProxyLease ou None se todos os candidatos estiverem ocupados
+        """
+        ttl = self.ttl if ttl is None else ttl
+
+        with self.lock:
+            state = self._load()
+            free = [p for p in proxies if self._has_room(state.get(p['http'], []), exclusive)]
+            if not free:
+                return None
+
+            proxy = min(free, key=lambda p: len(state.get(p['http'], [])))
+            lease = {
+                'id': uuid.uuid4().hex,
+                'pid': psutil.Process().pid,
+                'exclusive': exclusive,
+                'expires_at': time.time() + ttl,
+            }
+            state.setdefault(proxy['http'], []).append(lease)
+            write_json_atomic(self.state_file, state)
+
+        return ProxyLease(self, proxy, lease['id'], exclusive, lease['expires_at'], ttl)
+
+    def renew(self, lease: ProxyLease, ttl: Optional[float] = None) -> bool:
+        """Estende o prazo de um lease (False se ele já foi descartado)"""
+        ttl = lease.ttl if ttl is None else ttl
+
+        with self.lock:
+            state = self._load()
+            for holder in state.get(lease.proxy['http'], []):
+                if holder['id'] == lease.lease_id:
+                    holder['expires_at'] = lease.expires_at = time.time() + ttl
+                    write_json_atomic(self.state_file, state)
+                    return True
+        return False
+
+    def release(self, lease: ProxyLease):
+        """Devolve um lease"""
+        with self.lock:
+            state = self._load()
+            url = lease.proxy['http']
+            state[url] = [h for h in state.get(url, []) if h['id'] != lease.lease_id]
+            if not state[url]:
+                del state[url]
+            write_json_atomic(self.state_file, state)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna os leases ativos
+
+        Returns:
+            Dict com estatísticas
+        """
+        with self.lock:
+            state = self._load()
+
+        return {
+            'proxies_in_use': len(state),
+            'active_leases': sum(len(holders) for holders in state.values()),
+            'exclusive_leases': sum(1 for holders in state.values() for h in holders if h['exclusive']),
+        }
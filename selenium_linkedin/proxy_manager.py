@@ -7,23 +7,32 @@ Suporta:
 - SOCKS5 proxies
 - Proxies com autenticação (usuário:senha)
 - Rotação sequencial e aleatória
+- Rotação ponderada pela saúde (latência/sucesso), pulando proxies mortos
+- Registro persistente (SQLite) com saúde e geolocalização dos proxies
+- Leases entre processos (workers paralelos não disputam o mesmo proxy)
 - Validação de proxies
 """
 
 import random
-import json
 import os
+import time
 from pathlib import Path
 from enum import Enum
 from typing import List, Optional, Dict
 import requests
 
+from .proxy_health import ProxyHealthChecker
+from .proxy_registry import ProxyRegistry
+from .proxy_leases import ProxyLease, ProxyLeaseAllocator
+from .file_lock import FileLock, read_json, write_json_atomic
+
 
 class ProxyRotation(Enum):
     """Tipos de rotação de proxy"""
     SEQUENTIAL = "sequential"  # Usa proxies em ordem
     RANDOM = "random"          # Escolhe aleatoriamente
     MANUAL = "manual"          # Usuário escolhe manualmente
+    HEALTH_WEIGHTED = "health_weighted"  # Sorteia pela saúde medida, pulando mortos
 
 
 class ProxyManager:
@@ -35,7 +44,11 @@ class ProxyManager:
         self,
         proxy_file: str = "proxies.txt",
         rotation_mode: ProxyRotation = ProxyRotation.SEQUENTIAL,
-        state_file: str = "proxy_state.json"
+        state_file: str = "proxy_state.json",
+        health_checker: Optional[ProxyHealthChecker] = None,
+        registry: Optional[ProxyRegistry] = None,
+        recheck_after: float = 600,
+        leases: Optional[ProxyLeaseAllocator] = None
     ):
         """
         Inicializa o gerenciador de proxies
@@ -44,6 +57,10 @@ class ProxyManager:
             proxy_file: Arquivo com lista de proxies
             rotation_mode: Modo de rotação (SEQUENTIAL, RANDOM, MANUAL)
             state_file: Arquivo para salvar estado (último proxy usado)
+            health_checker: Verificador de saúde (padrão: ProxyHealthChecker com ipinfo.io)
+            registry: Registro persistente dos proxies (reaproveita verificações anteriores)
+            recheck_after: Idade máxima (segundos) de uma verificação reaproveitada
+            leases: Alocador de leases entre processos (padrão: proxy_leases.json)
         """
         self.proxy_file = proxy_file
         self.rotation_mode = rotation_mode
@@ -51,9 +68,24 @@ class ProxyManager:
         self.proxies: List[Dict[str, str]] = []
         self.current_index = 0
         
+        # Latência, taxa de sucesso e IP de saída de cada proxy
+        self.health = health_checker or ProxyHealthChecker()
+        self.registry = registry
+        self.recheck_after = recheck_after
+        self._health_checked = False
+        self.leases = leases or ProxyLeaseAllocator()
+        self.state_lock = FileLock(f"{state_file}.lock")
+        if registry:
+            self.health.registry = registry
+        
         # Carregar proxies do arquivo
         self._load_proxies()
         
+        if registry:
+            new = registry.sync(self.proxies)
+            saved = self.health.load_saved(self.proxies)
+            print(f"💾 Registro de proxies: {saved} com histórico, {new} novos")
+        
         # Carregar estado anterior (se existir)
         self._load_state()
     
@@ -129,23 +161,29 @@ class ProxyManager:
         """Carrega estado anterior (último proxy usado)"""
         if os.path.exists(self.state_file):
             try:
-                with open(self.state_file, 'r') as f:
-                    state = json.load(f)
-                    self.current_index = state.get('current_index', 0)
-                    
-                    # Garantir que o índice está dentro do range
-                    if self.current_index >= len(self.proxies):
-                        self.current_index = 0
-                    
-                    print(f"📍 Estado anterior carregado: índice {self.current_index}")
+                with self.state_lock:
+                    state = read_json(self.state_file, {})
+                self.current_index = self._valid_index(state.get('current_index', 0))
+                print(f"📍 Estado anterior carregado: índice {self.current_index}")
             except Exception as e:
                 print(f"⚠️ Erro ao carregar estado: {e}")
     
-    def _save_state(self):
-        """Salva estado atual (último proxy usado)"""
+    def _valid_index(self, index) -> int:
+        """Garante que o índice está dentro do range"""
+        if not isinstance(index, int) or not 0 <= index < len(self.proxies):
+            return 0
+        return index
+    
+    def save_state(self):
+        """
+        Salva o estado atual (próximo índice) sob o lock
+        
+        A rotação sequencial só avança em memória; chame ao terminar (o
+        LinkedInScraper chama em stop) para a próxima execução continuar de onde parou.
+        """
         try:
-            with open(self.state_file, 'w') as f:
-                json.dump({'current_index': self.current_index}, f)
+            with self.state_lock:
+                write_json_atomic(self.state_file, {'current_index': self.current_index})
         except Exception as e:
             print(f"⚠️ Erro ao salvar estado: {e}")
     
@@ -161,17 +199,26 @@ class ProxyManager:
             return None
         
         if self.rotation_mode == ProxyRotation.SEQUENTIAL:
+            # Só em memória: o arquivo de estado é gravado em save_state()
             proxy = self.proxies[self.current_index]
             self.current_index = (self.current_index + 1) % len(self.proxies)
             
         elif self.rotation_mode == ProxyRotation.RANDOM:
             proxy = random.choice(self.proxies)
             
+        elif self.rotation_mode == ProxyRotation.HEALTH_WEIGHTED:
+            # Primeira rotação: verificar os proxies (os verificados há pouco são reaproveitados)
+            self._refresh_health()
+            proxy = self.health.choose(self.proxies)
+            if not proxy:
+                print("❌ Todos os proxies estão fora do ar!")
+                return None
+            
         else:  # MANUAL
             proxy = self.proxies[self.current_index]
         
-        # Salvar estado
-        self._save_state()
+        if self.registry:
+            self.registry.mark_used(proxy['http'])
         
         # Mostrar qual proxy está sendo usado (sem senha)
         proxy_display = self._get_proxy_display(proxy)
@@ -211,7 +258,7 @@ class ProxyManager:
         """
         if 0 <= index < len(self.proxies):
             self.current_index = index
-            self._save_state()
+            self.save_state()
             return self.proxies[index]
         else:
             print(f"❌ Índice {index} inválido! Total de proxies: {len(self.proxies)}")
@@ -251,6 +298,157 @@ class ProxyManager:
             print(f"❌ Proxy inválido: {e}")
             return False
     
+    def _lease_candidates(self) -> List[Dict[str, str]]:
+        """Proxies em ordem de preferência segundo o modo de rotação"""
+        if self.rotation_mode == ProxyRotation.SEQUENTIAL:
+            return self.proxies[self.current_index:] + self.proxies[:self.current_index]
+        
+        if self.rotation_mode == ProxyRotation.RANDOM:
+            return random.sample(self.proxies, len(self.proxies))
+        
+        if self.rotation_mode == ProxyRotation.HEALTH_WEIGHTED:
+            self._refresh_health()
+            # Ordem sorteada ponderada pela saúde (Efraimidis-Spirakis), sem os mortos
+            weighted = [(p, self.health.weight(p)) for p in self.proxies]
+            return [p for p, w in sorted(
+                (pw for pw in weighted if pw[1] > 0),
+                key=lambda pw: random.random() ** (1 / pw[1]),
+                reverse=True
+            )]
+        
+        return [self.proxies[self.current_index]]  # MANUAL
+    
+    def acquire_proxy(self, exclusive: bool = True, ttl: Optional[float] = None) -> Optional[ProxyLease]:
+        """
+        Reserva um proxy para este worker (seguro com vários processos em paralelo)
+        
+        Entre os proxies livres, escolhe o menos ocupado seguindo a ordem do modo
+        de rotação. Devolva com lease.release() ao fechar o navegador.
+        
+        Args:
+            exclusive: Se True, nenhum outro worker usa o proxy durante o lease
+            ttl: Prazo do lease em segundos (padrão: o do alocador)
+        
+        Returns:
+            ProxyLease ou None se não houver proxy livre
+        """
+        if not self.proxies:
+            print("❌ Nenhum proxy disponível!")
+            return None
+        
+        candidates = self._lease_candidates()
+        if not candidates:
+            # Só acontece no HEALTH_WEIGHTED: esperar um lease não adianta
+            print("❌ Todos os proxies estão fora do ar!")
+            return None
+        
+        lease = self.leases.acquire(candidates, exclusive=exclusive, ttl=ttl)
+        if not lease:
+            print("❌ Todos os proxies estão ocupados por outros workers!")
+            return None
+        
+        if self.rotation_mode == ProxyRotation.SEQUENTIAL:
+            # Só em memória, como em get_next_proxy: com leases, o arquivo de estado não reparte os proxies
+            self.current_index = (self.proxies.index(lease.proxy) + 1) % len(self.proxies)
+        if self.registry:
+            self.registry.mark_used(lease.proxy['http'])
+        
+        kind = "exclusivo" if exclusive else "compartilhado"
+        print(f"🔒 Proxy reservado ({kind}): {self._get_proxy_display(lease.proxy)}")
+        return lease
+    
+    def has_live_proxies(self) -> bool:
+        """
+        True se algum proxy pode ser usado (no HEALTH_WEIGHTED, algum não morto)
+        
+        Distingue "todos ocupados" (vale esperar um lease) de "todos fora do ar".
+        """
+        if self.rotation_mode == ProxyRotation.HEALTH_WEIGHTED:
+            return any(not self.health.is_dead(p) for p in self.proxies)
+        return bool(self.proxies)
+    
+    def check_health(self, force: bool = False):
+        """
+        Verifica os proxies em paralelo (latência, sucesso e IP de saída)
+        
+        Com registro, só verifica os proxies sem verificação recente.
+        
+        Args:
+            force: Se True, verifica todos mesmo com verificação recente
+        
+        Returns:
+            Lista de resultados do ProxyHealthChecker
+        """
+        self._health_checked = True
+        proxies = self.proxies
+        if self.registry and not force:
+            proxies = self.registry.stale(self.proxies, self.recheck_after)
+            reused = len(self.proxies) - len(proxies)
+            if reused:
+                print(f"💾 {reused} verificações recentes reaproveitadas")
+        return self.health.check_all(proxies)
+    
+    def _refresh_health(self):
+        """
+        Verifica os proxies na primeira rotação e, depois, volta a testar os
+        que estão mortos há mais de recheck_after (senão ficariam com peso 0
+        até o fim do processo)
+        """
+        if not self._health_checked:
+            self.check_health()
+            return
+        
+        cutoff = time.time() - self.recheck_after
+        dead = [
+            p for p in self.proxies
+            if self.health.is_dead(p) and (self.health.health[p['http']]['last_check'] or 0) < cutoff
+        ]
+        if dead:
+            print(f"🩺 {len(dead)} proxies mortos há mais de {self.recheck_after:.0f}s - verificando de novo")
+            self.health.check_all(dead)
+    
+    def find_proxy(
+        self,
+        country: Optional[str] = None,
+        proxy_type: Optional[str] = None,
+        unused_minutes: float = 0
+    ) -> Optional[Dict[str, str]]:
+        """
+        Busca no registro um proxy saudável (ex: país "BR", tipo "http", sem uso há 10 min)
+        
+        Args:
+            country: Código do país de saída
+            proxy_type: "http" ou "socks5"
+            unused_minutes: Minutos mínimos desde o último uso
+        
+        Returns:
+            Dict com proxy ou None se nenhum atender aos filtros
+        """
+        if not self.registry:
+            raise ValueError("find_proxy requer um ProxyRegistry")
+        
+        rows = self.registry.find(country=country, proxy_type=proxy_type, unused_for=unused_minutes * 60)
+        if not rows:
+            return None
+        
+        url = rows[0]['url']
+        self.registry.mark_used(url)
+        return next((p for p in self.proxies if p['http'] == url), None) or self._parse_proxy(url)
+    
+    def report_result(self, proxy: Dict[str, str], ok: bool, latency_ms: Optional[int] = None):
+        """
+        Registra o resultado de um uso real do proxy (ex: falha ao abrir o Chrome)
+        
+        Args:
+            proxy: Dict com proxy
+            ok: Se o proxy funcionou
+            latency_ms: Latência medida (opcional)
+        """
+        self.health.record({
+            'proxy': proxy['http'], 'ok': ok, 'latency_ms': latency_ms,
+            'error': None if ok else 'uso',
+        })
+    
     def list_proxies(self):
         """Lista todos os proxies disponíveis"""
         if not self.proxies:
@@ -263,6 +461,10 @@ class ProxyManager:
         for i, proxy in enumerate(self.proxies):
             proxy_display = self._get_proxy_display(proxy)
             marker = "👉" if i == self.current_index else "  "
+            entry = self.health.health.get(proxy['http'])
+            if entry:
+                status = "morto" if self.health.is_dead(proxy) else f"{entry['latency_ms']} ms"
+                proxy_display += f" ({status}, {entry['successes']}/{entry['checks']} ok)"
             print(f"{marker} [{i}] {proxy_display}")
         
         print("="*60)
@@ -284,7 +486,7 @@ class ProxyManager:
     def reset_rotation(self):
         """Reseta a rotação para o início"""
         self.current_index = 0
-        self._save_state()
+        self.save_state()
         print("🔄 Rotação resetada para o início")
     
     def get_stats(self) -> Dict:
@@ -298,7 +500,8 @@ class ProxyManager:
             'total_proxies': len(self.proxies),
             'current_index': self.current_index,
             'rotation_mode': self.rotation_mode.value,
-            'has_proxies': len(self.proxies) > 0
+            'has_proxies': len(self.proxies) > 0,
+            'health': self.health.get_stats()
         }
 
 
@@ -0,0 +1,255 @@
+"""
+Registro Persistente de Proxies (SQLite)
+=========================================
+
+Guarda entre execuções o que se aprende sobre cada proxy: última
+verificação, histórico de latência, falhas, IP/país/cidade de saída e
+tipo. Assim verificações recentes são reaproveitadas em vez de refeitas
+a cada inicialização.
+
+Os índices permitem consultas como "um proxy HTTP saudável do BR sem uso
+há 10 minutos" em O(log n), mesmo com dezenas de milhares de proxies.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS proxies (
+    url TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    healthy INTEGER NOT NULL DEFAULT 0,
+    country TEXT,
+    city TEXT,
+    exit_ip TEXT,
+    checks INTEGER NOT NULL DEFAULT 0,
+    successes INTEGER NOT NULL DEFAULT 0,
+    consecutive_failures INTEGER NOT NULL DEFAULT 0,
+    latency_ms INTEGER,
+    last_check REAL,
+    last_error TEXT,
+    last_used REAL NOT NULL DEFAULT 0
+);
+-- Um índice por combinação de filtros do find(), todos terminando em last_used
+-- (o ORDER BY last_used sai do índice, sem ordenar os proxies encontrados)
+CREATE INDEX IF NOT EXISTS idx_proxies_pick ON proxies (healthy, country, type, last_used);
+CREATE INDEX IF NOT EXISTS idx_proxies_country ON proxies (healthy, country, last_used);
+CREATE INDEX IF NOT EXISTS idx_proxies_type ON proxies (healthy, type, last_used);
+CREATE INDEX IF NOT EXISTS idx_proxies_unused ON proxies (healthy, last_used);
+CREATE INDEX IF NOT EXISTS idx_proxies_last_check ON proxies (last_check);
+
+CREATE TABLE IF NOT EXISTS latency_history (
+    url TEXT NOT NULL,
+    checked_at REAL NOT NULL,
+    ok INTEGER NOT NULL,
+    latency_ms INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_latency_url ON latency_history (url, checked_at);
+"""
+
+# Campos de saúde compartilhados com ProxyHealthChecker.health
+HEALTH_FIELDS = (
+    'checks', 'successes', 'consecutive_failures', 'latency_ms',
+    'exit_ip', 'country', 'city', 'last_check', 'last_error',
+)
+
+
+class ProxyRegistry:
+    """
+    Registro de proxies em SQLite com saúde, geolocalização e histórico de latência
+    """
+
+    def __init__(self, db_path: str = "proxy_registry.db", max_history: int = 50):
+        """
+        Abre (ou cria) o registro
+
+        Args:
+            db_path: Arquivo do banco SQLite
+            max_history: Medições de latência guardadas por proxy
+        """
+        self.db_path = db_path
+        self.max_history = max_history
+
+        # Verificações rodam em threads: uma conexão compartilhada protegida por lock
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def sync(self, proxies: List[Dict[str, str]]) -> int:
+        """
+        Adiciona ao registro os proxies ainda desconhecidos
+
+        Returns:
+            int: Quantidade de proxies novos
+        """
+        with self._lock, self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO proxies (url, type) VALUES (?, ?)",
+                [(p['http'], p.get('type', 'http')) for p in proxies]
+            )
+            return self.conn.total_changes - before
+
+    def record(self, url: str, entry: Dict[str, Any], healthy: bool, ok: bool,
+               latency_ms: Optional[int] = None):
+        """
+        Grava o estado de saúde de um proxy após uma verificação
+
+        Args:
+            url: URL do proxy
+            entry: Estatísticas acumuladas (formato de ProxyHealthChecker.health)
+            healthy: Se o proxy está utilizável
+            ok: Resultado desta verificação
+            latency_ms: Latência desta verificação
+        """
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO proxies (url, type) VALUES (?, ?)",
+                (url, 'socks5' if url.startswith('socks5://') else 'http')
+            )
+            self.conn.execute(
+                f"UPDATE proxies SET healthy = ?, {', '.join(f'{f} = ?' for f in HEALTH_FIELDS)} WHERE url = ?",
+                (int(healthy), *(entry.get(f) for f in HEALTH_FIELDS), url)
+            )
+            self.conn.execute(
+                "INSERT INTO latency_history (url, checked_at, ok, latency_ms) VALUES (?, ?, ?, ?)",
+                (url, entry.get('last_check') or time.time(), int(ok), latency_ms)
+            )
+            # Manter só as últimas medições
+            self.conn.execute(
+                "DELETE FROM latency_history WHERE url = ? AND checked_at < ("
+                " SELECT checked_at FROM latency_history WHERE url = ?"
+                " ORDER BY checked_at DESC LIMIT 1 OFFSET ?)",
+                (url, url, self.max_history - 1)
+            )
+
+    def load_health(self, urls: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Estatísticas salvas no formato de ProxyHealthChecker.health
+
+        Args:
+            urls: Proxies a carregar (padrão: todos os já verificados)
+        """
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT url, {', '.join(HEALTH_FIELDS)} FROM proxies WHERE checks > 0"
+            ).fetchall()
+
+        wanted = set(urls) if urls is not None else None
+        return {
+            row['url']: {f: row[f] for f in HEALTH_FIELDS}
+            for row in rows
+            if wanted is None or row['url'] in wanted
+        }
+
+    def stale(self, proxies: List[Dict[str, str]], max_age: float) -> List[Dict[str, str]]:
+        """
+        Proxies sem verificação nos últimos max_age segundos
+
+        Args:
+            proxies: Proxies candidatos
+            max_age: Idade máxima de uma verificação reaproveitável (segundos)
+        """
+        cutoff = time.time() - max_age
+        with self._lock:
+            fresh = {
+                row['url'] for row in self.conn.execute(
+                    "SELECT url FROM proxies WHERE last_check >= ?", (cutoff,)
+                )
+            }
+        return [p for p in proxies if p['http'] not in fresh]
+
+    def find(
+        self,
+        country: Optional[str] = None,
+        proxy_type: Optional[str] = None,
+        unused_for: float = 0,
+        healthy: bool = True,
+        limit: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca proxies pelo índice (o menos usado recentemente primeiro)
+
+        Exemplo: find(country="BR", proxy_type="http", unused_for=600)
+
+        Args:
+            country: Código do país de saída (ex: "BR")
+            proxy_type: "http" ou "socks5"
+            unused_for: Segundos mínimos desde o último uso
+            healthy: Se True, apenas proxies utilizáveis (sempre entre os já verificados)
+            limit: Máximo de resultados
+
+        Returns:
+            Lista de dicts com as colunas do registro
+        """
+        # healthy = 1 só é gravado após uma verificação; o filtro por checks
+        # (fora dos índices) só é preciso para separar os mortos dos não verificados
+        conditions = ["healthy = ?"]
+        params: List[Any] = [int(healthy)]
+        if not healthy:
+            conditions.append("checks > 0")
+        if country:
+            conditions.append("country = ?")
+            params.append(country.upper())
+        if proxy_type:
+            conditions.append("type = ?")
+            params.append(proxy_type)
+        conditions.append("last_used <= ?")
+        params.append(time.time() - unused_for)
+
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT * FROM proxies WHERE {' AND '.join(conditions)} ORDER BY last_used LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def mark_used(self, url: str):
+        """Registra o uso do proxy agora"""
+        with self._lock, self.conn:
+            self.conn.execute("UPDATE proxies SET last_used = ? WHERE url = ?", (time.time(), url))
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Registro de um proxy (ou None)"""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM proxies WHERE url = ?", (url,)).fetchone()
+        return dict(row) if row else None
+
+    def latency_history(self, url: str) -> List[Dict[str, Any]]:
+        """Medições guardadas de um proxy (mais antiga primeiro)"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT checked_at, ok, latency_ms FROM latency_history WHERE url = ? ORDER BY checked_at",
+                (url,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do registro
+
+        Returns:
+            Dict com estatísticas
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT COUNT(*) AS total, SUM(checks > 0) AS checked, "
+                "SUM(checks > 0 AND healthy = 1) AS healthy, COUNT(DISTINCT country) AS countries "
+                "FROM proxies"
+            ).fetchone()
+        return {
+            'total': row['total'],
+            'checked': row['checked'] or 0,
+            'healthy': row['healthy'] or 0,
+            'countries': row['countries'],
+        }
+
+    def close(self):
+        """Fecha o banco"""
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,213 @@
+"""
+Perfis de Bloqueio de Requisições via CDP
+==========================================
+
+Bloqueia fontes, mídia, imagens, analytics e rastreadores antes que passem
+pelo proxy, usando Network.setBlockedURLs do Chrome DevTools Protocol.
+
+Também conta bytes baixados e requisições bloqueadas por execução
+(via eventos do NetworkCapture ou do log de performance).
+"""
+
+import json
+from typing import Any, Dict, List
+
+
+# Padrões por tipo de recurso (Network.setBlockedURLs filtra apenas por URL,
+# então os tipos são mapeados para extensões de arquivo; segmentos HLS .ts
+# ficam de fora porque o padrão também pegaria arquivos TypeScript)
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico'],
+    'font': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'media': ['*.mp4', '*.webm', '*.m3u8', '*.mp3', '*.ogg', '*.wav'],
+}
+
+# Domínios de analytics e rastreadores de terceiros
+TRACKER_PATTERNS = [
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*doubleclick.net*',
+    '*facebook.net*',
+    '*connect.facebook.com*',
+    '*bat.bing.com*',
+    '*hotjar.com*',
+    '*scorecardresearch.com*',
+    '*adsrvr.org*',
+    '*demdex.net*',
+    '*omtrdc.net*',
+]
+
+# Beacons e mídia específicos do LinkedIn (não afetam os resultados de busca)
+LINKEDIN_PATTERNS = [
+    '*px.ads.linkedin.com*',
+    '*snap.licdn.com*',
+    '*linkedin.com/li/track*',
+    '*linkedin.com/sensorCollect*',
+    '*media.licdn.com/dms/image*',
+    '*static.licdn.com/aero-v1/sc/h/*.woff*',
+    '*dms.licdn.com/playlist*',
+]
+
+# Perfis nomeados: tipos de recurso + padrões de URL
+BLOCKING_PROFILES: Dict[str, Dict[str, List[str]]] = {
+    'none': {
+        'resource_types': [],
+        'url_patterns': [],
+    },
+    'lean': {
+        'resource_types': ['image', 'font', 'media'],
+        'url_patterns': [],
+    },
+    'trackers': {
+        'resource_types': [],
+        'url_patterns': TRACKER_PATTERNS,
+    },
+    'linkedin': {
+        'resource_types': ['image', 'font', 'media'],
+        'url_patterns': TRACKER_PATTERNS + LINKEDIN_PATTERNS,
+    },
+}
+
+
+def get_blocked_urls(profile: str) -> List[str]:
+    """
+    Monta a lista de padrões de URL bloqueados de um perfil
+
+    Args:
+        profile: Nome do perfil (ver BLOCKING_PROFILES)
+
+    Returns:
+        list: Padrões com curinga (*) para Network.setBlockedURLs
+    """
+    if profile not in BLOCKING_PROFILES:
+        raise ValueError(
+            f"Perfil de bloqueio desconhecido: {profile} "
+            f"(disponíveis: {', '.join(BLOCKING_PROFILES)})"
+        )
+
+    config = BLOCKING_PROFILES[profile]
+    patterns = []
+
+    for resource_type in config['resource_types']:
+        patterns.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+        # Também bloquear quando há query string (ex: font.woff2?v=3)
+        patterns.extend(f"{p}?*" for p in RESOURCE_TYPE_PATTERNS[resource_type])
+
+    patterns.extend(config['url_patterns'])
+    return patterns
+
+
+def apply_blocking_profile(driver, profile: str) -> int:
+    """
+    Aplica um perfil de bloqueio no driver via CDP
+
+    Args:
+        driver: WebDriver do Chrome
+        profile: Nome do perfil (ver BLOCKING_PROFILES)
+
+    Returns:
+        int: Quantidade de padrões bloqueados
+    """
+    patterns = get_blocked_urls(profile)
+
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+
+    if patterns:
+        print(f"🚫 Perfil de bloqueio '{profile}' aplicado ({len(patterns)} padrões)")
+
+    return len(patterns)
+
+
+class TrafficCounter:
+    """
+    Contador de tráfego por execução (bytes, requisições e bloqueios)
+
+    Uso:
+        counter = TrafficCounter()
+        network_capture.add_listener(counter)
+        ...
+        network_capture.poll()
+        counter.print_summary()
+
+    Sem NetworkCapture, counter.poll(driver) lê os eventos direto do log de
+    performance (driver criado com goog:loggingPrefs performance).
+    """
+
+    def __init__(self):
+        """Inicializa os contadores zerados"""
+        self.reset()
+
+    def reset(self):
+        """Zera os contadores"""
+        self.bytes_received = 0
+        self.requests = 0
+        self.blocked = 0
+        self.failed = 0
+        self.bytes_by_type: Dict[str, int] = {}
+        self._types: Dict[str, str] = {}
+
+    def __call__(self, method: str, params: Dict[str, Any]):
+        """Processa um evento de rede (listener do NetworkCapture)"""
+        if method == 'Network.requestWillBeSent':
+            self.requests += 1
+            self._types[params.get('requestId')] = params.get('type', 'Other')
+
+        elif method == 'Network.loadingFinished':
+            size = int(params.get('encodedDataLength', 0))
+            resource_type = self._types.pop(params.get('requestId'), 'Other')
+            self.bytes_received += size
+            self.bytes_by_type[resource_type] = self.bytes_by_type.get(resource_type, 0) + size
+
+        elif method == 'Network.loadingFailed':
+            self._types.pop(params.get('requestId'), None)
+            if params.get('blockedReason'):
+                self.blocked += 1
+            else:
+                self.failed += 1
+
+    def poll(self, driver) -> int:
+        """
+        Contabiliza os eventos de rede acumulados no log de performance do driver
+
+        Returns:
+            int: Quantidade de eventos lidos
+        """
+        return self.consume(driver.get_log('performance'))
+
+    def consume(self, log_entries: List[Dict[str, Any]]) -> int:
+        """Contabiliza entradas já lidas do log de performance"""
+        events = 0
+        for entry in log_entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            self(message.get('method', ''), message.get('params', {}))
+            events += 1
+        return events
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas de tráfego
+
+        Returns:
+            Dict com estatísticas
+        """
+        return {
+            'bytes_received': self.bytes_received,
+            'megabytes_received': round(self.bytes_received / (1024 * 1024), 2),
+            'requests': self.requests,
+            'blocked': self.blocked,
+            'failed': self.failed,
+            'bytes_by_type': dict(self.bytes_by_type),
+        }
+
+    def print_summary(self):
+        """Mostra resumo do tráfego da execução"""
+        stats = self.get_stats()
+        print(f"\n📊 Tráfego: {stats['megabytes_received']} MB em {stats['requests']} requisições "
+              f"| 🚫 {stats['blocked']} bloqueadas | ❌ {stats['failed']} falharam")
+
+        for resource_type, size in sorted(self.bytes_by_type.items(), key=lambda kv: -kv[1]):
+            print(f"   {resource_type}: {size / 1024:.0f} KB")
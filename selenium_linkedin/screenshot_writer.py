@@ -0,0 +1,220 @@
+"""
+Screenshots sem Bloqueio
+=========================
+
+Captura screenshots via CDP (Page.captureScreenshot) em JPEG/WebP com
+qualidade ajustável, recorte (clip) e escala, e entrega a gravação em
+disco a uma thread de fundo com fila limitada.
+
+A thread de scraping só paga a captura no navegador; decodificação e
+escrita ficam na thread de fundo. Se a fila encher (disco lento), novos
+screenshots são descartados em vez de travar o scraping.
+"""
+
+import base64
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+# Extensão do arquivo -> formato do Page.captureScreenshot
+FORMATS = {
+    '.jpg': 'jpeg',
+    '.jpeg': 'jpeg',
+    '.webp': 'webp',
+    '.png': 'png',
+}
+
+# Área visível da página (ou de um elemento) para o clip
+VIEWPORT_JS = "return [window.scrollX, window.scrollY, window.innerWidth, window.innerHeight];"
+ELEMENT_RECT_JS = """
+const el = document.querySelector(arguments[0]);
+if (!el) return null;
+const r = el.getBoundingClientRect();
+return [r.left + window.scrollX, r.top + window.scrollY, r.width, r.height];
+"""
+
+_STOP = object()
+
+
+class ScreenshotWriter:
+    """
+    Captura screenshots via CDP e grava em disco em uma thread de fundo
+    """
+
+    def __init__(
+        self,
+        output_dir: str = "screenshots",
+        image_format: str = "jpeg",
+        quality: int = 70,
+        scale: float = 1.0,
+        max_queue: int = 32
+    ):
+        """
+        Inicializa o gravador
+
+        Args:
+            output_dir: Diretório dos arquivos (nomes sem diretório vão para cá)
+            image_format: "jpeg", "webp" ou "png"
+            quality: Qualidade JPEG/WebP (0-100)
+            scale: Escala da imagem (ex: 0.5 = metade da resolução)
+            max_queue: Screenshots aguardando gravação antes de começar a descartar
+        """
+        if image_format not in FORMATS.values():
+            raise ValueError(f"Formato de screenshot inválido: {image_format}")
+
+        self.output_dir = Path(output_dir)
+        self.image_format = image_format
+        self.quality = quality
+        self.scale = scale
+
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self.captured = 0
+        self.written = 0
+        self.dropped = 0
+        self.bytes_written = 0
+
+    def _ensure_thread(self):
+        """Inicia a thread de gravação na primeira captura"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self._thread.start()
+
+    def _writer_loop(self):
+        """Thread de fundo: decodifica e grava os screenshots da fila"""
+        while True:
+            item = self.queue.get()
+            try:
+                if item is _STOP:
+                    return
+
+                path, data = item
+                content = base64.b64decode(data)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(path.name + '.tmp')
+                tmp_path.write_bytes(content)
+                tmp_path.replace(path)
+
+                with self._lock:
+                    self.written += 1
+                    self.bytes_written += len(content)
+            except Exception as e:
+                print(f"⚠️ Erro ao gravar screenshot: {e}")
+            finally:
+                self.queue.task_done()
+
+    def _resolve_path(self, filename: Optional[str], image_format: str) -> Path:
+        """Caminho final do arquivo (nome automático se não informado)"""
+        if not filename:
+            extension = 'jpg' if image_format == 'jpeg' else image_format
+            filename = f"{time.strftime('%Y%m%d_%H%M%S')}_{self.captured:05d}.{extension}"
+
+        path = Path(filename)
+        if path.parent == Path('.'):
+            path = self.output_dir / path
+        return path
+
+    def _build_clip(self, driver, selector: Optional[str], clip: Optional[Dict[str, float]],
+                    scale: float) -> Optional[Dict[str, float]]:
+        """Monta o clip do CDP (elemento, área explícita ou viewport reduzido)"""
+        if clip:
+            return {'scale': scale, **clip}
+
+        if selector:
+            rect = driver.execute_script(ELEMENT_RECT_JS, selector)
+            if not rect:
+                raise ValueError(f"Elemento não encontrado para screenshot: {selector}")
+        elif scale != 1.0:
+            rect = driver.execute_script(VIEWPORT_JS)
+        else:
+            return None  # Viewport inteiro, sem recorte
+
+        x, y, width, height = rect
+        return {'x': x, 'y': y, 'width': width, 'height': height, 'scale': scale}
+
+    def capture(
+        self,
+        driver,
+        filename: Optional[str] = None,
+        selector: Optional[str] = None,
+        clip: Optional[Dict[str, float]] = None,
+        quality: Optional[int] = None,
+        scale: Optional[float] = None
+    ) -> Optional[Path]:
+        """
+        Captura um screenshot e agenda a gravação (retorna sem esperar o disco)
+
+        Args:
+            driver: WebDriver do Chrome
+            filename: Nome do arquivo; a extensão define o formato (.jpg, .webp, .png)
+            selector: Seletor CSS do elemento a recortar
+            clip: Área explícita {'x', 'y', 'width', 'height'} em pixels CSS
+            quality: Qualidade JPEG/WebP (padrão: a do gravador)
+            scale: Escala da imagem (padrão: a do gravador)
+
+        Returns:
+            Path do arquivo que será gravado, ou None se descartado
+        """
+        if self.queue.full():
+            # Não capturar (nem medir o elemento) o que não dá para gravar
+            self.dropped += 1
+            print("⚠️ Fila de screenshots cheia - screenshot descartado")
+            return None
+
+        image_format = self.image_format
+        if filename:
+            image_format = FORMATS.get(Path(filename).suffix.lower(), image_format)
+
+        params: Dict[str, Any] = {'format': image_format}
+        if image_format != 'png':
+            params['quality'] = self.quality if quality is None else quality
+
+        page_clip = self._build_clip(driver, selector, clip, self.scale if scale is None else scale)
+        if page_clip:
+            params['clip'] = page_clip
+
+        data = driver.execute_cdp_cmd('Page.captureScreenshot', params)['data']
+        path = self._resolve_path(filename, image_format)
+        self.captured += 1
+
+        try:
+            self.queue.put_nowait((path, data))
+        except queue.Full:
+            self.dropped += 1
+            print("⚠️ Fila de screenshots cheia - screenshot descartado")
+            return None
+
+        self._ensure_thread()
+        return path
+
+    def flush(self):
+        """Espera a gravação de todos os screenshots pendentes"""
+        if self._thread and self._thread.is_alive():
+            self.queue.join()
+
+    def close(self):
+        """Grava os pendentes e encerra a thread de fundo"""
+        if self._thread and self._thread.is_alive():
+            self.queue.put(_STOP)
+            self._thread.join()
+        self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do gravador
+
+        Returns:
+            Dict com estatísticas
+        """
+        return {
+            'captured': self.captured,
+            'written': self.written,
+            'dropped': self.dropped,
+            'pending': self.queue.qsize(),
+            'mb_written': round(self.bytes_written / (1024 * 1024), 2),
+        }
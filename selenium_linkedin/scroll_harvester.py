@@ -0,0 +1,128 @@
+"""
+Coletor Incremental com Scroll Infinito
+========================================
+
+Extrai itens a cada passo de scroll, removendo duplicados durante a coleta.
+Para assim que:
+- a quantidade desejada foi atingida
+- a página para de trazer conteúdo novo
+"""
+
+import json
+import random
+import time
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Tuple
+
+
+class ScrollHarvester:
+    """
+    Coletor incremental para páginas com scroll infinito
+    """
+
+    def __init__(
+        self,
+        driver,
+        extract: Callable[[Any], List[Any]],
+        key: Optional[Callable[[Any], Hashable]] = None,
+        scroll_step: float = 0.8,
+        pause: Tuple[float, float] = (1.0, 2.0),
+        max_idle_steps: int = 3,
+        max_steps: int = 50
+    ):
+        """
+        Inicializa o coletor
+
+        Args:
+            driver: WebDriver do Selenium
+            extract: Função que recebe o driver e retorna os itens visíveis
+            key: Função que retorna a chave única de um item (padrão: o próprio item)
+            scroll_step: Fração da altura da janela rolada a cada passo
+            pause: Intervalo (mín, máx) de espera após cada scroll, em segundos
+            max_idle_steps: Passos seguidos sem conteúdo novo antes de parar
+            max_steps: Limite total de passos de scroll
+        """
+        self.driver = driver
+        self.extract = extract
+        self.key = key or self._default_key
+        self.scroll_step = scroll_step
+        self.pause = pause
+        self.max_idle_steps = max_idle_steps
+        self.max_steps = max_steps
+
+    @staticmethod
+    def _default_key(item: Any) -> Hashable:
+        """Chave padrão: o próprio item (dicts/listas são serializados)"""
+        if isinstance(item, (dict, list)):
+            return json.dumps(item, sort_keys=True)
+        return item
+
+    def _scroll(self) -> Tuple[int, int]:
+        """
+        Rola a página um passo para baixo
+
+        Returns:
+            tuple: (posição do scroll, altura total da página)
+        """
+        return tuple(self.driver.execute_script(
+            "window.scrollBy(0, window.innerHeight * arguments[0]);"
+            "return [Math.round(window.scrollY), document.body.scrollHeight];",
+            self.scroll_step
+        ))
+
+    def harvest(
+        self,
+        max_results: Optional[int] = None,
+        seen: Optional[Iterable[Hashable]] = None,
+        on_item: Optional[Callable[[Any], None]] = None
+    ) -> List[Any]:
+        """
+        Rola a página e coleta itens novos até atingir o limite ou o fim do conteúdo
+
+        Args:
+            max_results: Máximo de itens novos (None = sem limite)
+            seen: Chaves já coletadas anteriormente (serão ignoradas)
+            on_item: Callback chamado para cada item novo
+
+        Returns:
+            list: Itens novos, na ordem em que apareceram
+        """
+        seen_keys = set(seen or [])
+        items: List[Any] = []
+        idle_steps = 0
+        last_position = None
+
+        for step in range(self.max_steps + 1):
+            new_count = 0
+
+            for item in self.extract(self.driver) or []:
+                if max_results is not None and len(items) >= max_results:
+                    return items
+
+                item_key = self.key(item)
+                if item_key is None or item_key in seen_keys:
+                    continue
+
+                seen_keys.add(item_key)
+                items.append(item)
+                new_count += 1
+
+                if on_item:
+                    on_item(item)
+
+            if max_results is not None and len(items) >= max_results:
+                return items
+
+            idle_steps = 0 if new_count else idle_steps + 1
+            if idle_steps >= self.max_idle_steps or step == self.max_steps:
+                break
+
+            position = self._scroll()
+
+            # Scroll não andou e nada novo apareceu: fim do conteúdo
+            if position == last_position and not new_count:
+                break
+            last_position = position
+
+            time.sleep(random.uniform(*self.pause))
+
+        return items
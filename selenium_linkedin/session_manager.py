@@ -3,11 +3,273 @@ Gerenciador de Sessões Persistentes do Chrome
 ==============================================
 
 Gerencia perfis do Chrome para manter sessões (login, cookies, etc)
+
+Clones por worker: o Chrome trava um user-data-dir para um único processo,
+então cada worker paralelo recebe uma cópia leve do perfil principal
+(reflink quando o sistema de arquivos suporta, sem caches).
+
+Modo RAM: o perfil é copiado para um tmpfs (/dev/shm) antes de abrir o
+Chrome e apenas o estado da sessão (cookies, local storage) volta para
+o disco ao final, tirando o I/O do perfil do caminho crítico.
+
+Distribuição: prune remove do perfil tudo que o login não precisa e
+pack/restore geram um arquivo .tar.gz com checksum SHA-256 para
+provisionar outras máquinas.
+
+Jar de sessão: cookies e local storage exportados para um JSON pequeno,
+injetado via CDP em navegadores sem perfil (ver cookie_jar).
+
+Uso:
+    python -m selenium_linkedin.session_manager info
+    python -m selenium_linkedin.session_manager check
+    python -m selenium_linkedin.session_manager export-jar
+    python -m selenium_linkedin.session_manager prune
+    python -m selenium_linkedin.session_manager pack --archive linkedin.tar.gz
+    python -m selenium_linkedin.session_manager restore --archive linkedin.tar.gz
 """
 
+import argparse
+import hashlib
 import os
+import shutil
+import sqlite3
+import tarfile
+import uuid
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
+
+import psutil
+
+from .cookie_jar import export_jar, find_cookie, load_jar
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# Diretórios de cache do Chrome (recriados sob demanda, não fazem parte do login)
+CACHE_DIRS = {
+    'Cache',
+    'Code Cache',
+    'GPUCache',
+    'DawnCache',
+    'DawnGraphiteCache',
+    'DawnWebGPUCache',
+    'GrShaderCache',
+    'GraphiteDawnCache',
+    'ShaderCache',
+    'CacheStorage',
+    'ScriptCache',
+    'Crashpad',
+    'Crash Reports',
+    'BrowserMetrics',
+    'component_crx_cache',
+    'extensions_crx_cache',
+    'optimization_guide_model_store',
+    'OnDeviceHeadSuggestModel',
+    'Safe Browsing',
+    'segmentation_platform',
+}
+
+# Dados do perfil que o login não usa (histórico, service workers, estatísticas)
+PRUNABLE_ENTRIES = CACHE_DIRS | {
+    'History',
+    'History-journal',
+    'Favicons',
+    'Favicons-journal',
+    'Top Sites',
+    'Top Sites-journal',
+    'Visited Links',
+    'Shortcuts',
+    'Shortcuts-journal',
+    'Network Action Predictor',
+    'Network Action Predictor-journal',
+    'Service Worker',
+    'File System',
+    'blob_storage',
+    'VideoDecodeStats',
+    'GCM Store',
+    'Download Service',
+    'Feature Engagement Tracker',
+    'MediaFoundationWidevineCdm',
+    'WidevineCdm',
+    'hyphen-data',
+}
+
+# Locks do processo dono do perfil (impedem o Chrome de abrir a cópia)
+LOCK_FILES = {'SingletonLock', 'SingletonSocket', 'SingletonCookie', 'lockfile'}
+
+# Tabelas LevelDB: escritas uma vez e nunca alteradas (seguro compartilhar via hardlink)
+IMMUTABLE_SUFFIXES = {'.ldb'}
+
+# Estado da sessão sincronizado de volta no modo RAM (relativo ao perfil)
+SESSION_STATE_PATHS = [
+    'Local State',  # Contém a chave de criptografia dos cookies
+    'Default/Cookies',
+    'Default/Cookies-journal',
+    'Default/Network/Cookies',
+    'Default/Network/Cookies-journal',
+    'Default/Local Storage',
+]
+
+# Banco de cookies do perfil (versões novas do Chrome usam Default/Network)
+COOKIE_DB_PATHS = ['Default/Network/Cookies', 'Default/Cookies']
+
+# Cookie de autenticação por perfil: (cookie, domínio)
+# Perfis de conta ("linkedin-ana") usam a configuração do prefixo ("linkedin")
+AUTH_COOKIES = {
+    'linkedin': ('li_at', 'linkedin.com'),
+}
+
+# Origens exportadas no jar de sessão por perfil
+JAR_ORIGINS = {
+    'linkedin': ['https://www.linkedin.com'],
+}
+
+# Época dos timestamps do Chrome (microssegundos desde 1601-01-01 UTC)
+CHROME_EPOCH = datetime(1601, 1, 1, tzinfo=timezone.utc)
+
+# Diretórios em memória candidatos (além da variável CHROME_PROFILE_RAM_DIR)
+RAM_DIRS = ['/dev/shm']
+
+# ioctl FICLONE do Linux (reflink em btrfs, XFS, etc)
+FICLONE = 0x40049409
+
+
+def _reflink(src: str, dst: str) -> bool:
+    """Tenta clonar um arquivo por reflink (copy-on-write); False se não suportado"""
+    if fcntl is None:
+        return False
+    try:
+        with open(src, 'rb') as source, open(dst, 'wb') as target:
+            fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+        return True
+    except OSError:
+        return False
+
+
+def get_ram_dir() -> Optional[Path]:
+    """
+    Localiza um diretório em memória (tmpfs) para perfis temporários
+
+    Returns:
+        Path do diretório ou None se não houver tmpfs disponível
+    """
+    candidates = [os.environ.get('CHROME_PROFILE_RAM_DIR')] + RAM_DIRS
+    for candidate in candidates:
+        if candidate and os.path.isdir(candidate) and os.access(candidate, os.W_OK):
+            return Path(candidate) / "chrome_profiles"
+    return None
+
+
+def directory_size(path: Path) -> int:
+    """Tamanho total (bytes) dos arquivos de um diretório"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(root, name)
+            if not os.path.islink(file_path):
+                total += os.path.getsize(file_path)
+    return total
+
+
+def profile_in_use(path: Path) -> bool:
+    """
+    Verifica se um Chrome está usando um user-data-dir agora
+    
+    Args:
+        path: Diretório do perfil (principal ou cópia)
+    
+    Returns:
+        True se o perfil está aberto em algum processo
+    """
+    singleton = path / 'SingletonLock'
+    if os.path.islink(singleton):
+        # Linux/macOS: link simbólico "host-pid"
+        try:
+            pid = int(os.readlink(singleton).rsplit('-', 1)[-1])
+            return psutil.pid_exists(pid)
+        except (OSError, ValueError):
+            return True
+    
+    lockfile = path / 'lockfile'
+    if lockfile.exists():
+        # Windows: o Chrome mantém o arquivo aberto sem compartilhamento;
+        # abrir para escrita falha enquanto ele está em uso (sem apagar nada)
+        try:
+            fd = os.open(lockfile, os.O_RDWR)
+        except FileNotFoundError:
+            return False
+        except OSError:
+            return True
+        os.close(fd)
+    return False
+
+
+def file_sha256(path: Path) -> str:
+    """Hash SHA-256 de um arquivo (lido em blocos)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def copy_profile_tree(src: Path, dst: Path, exclude: Optional[set] = None) -> Dict[str, int]:
+    """
+    Copia um perfil do Chrome sem caches e locks
+
+    Cada arquivo é clonado por reflink quando possível; tabelas LevelDB
+    imutáveis usam hardlink; o resto é copiado.
+
+    Args:
+        src: Perfil de origem
+        dst: Destino (criado se não existir)
+        exclude: Nomes de diretórios ignorados (padrão: CACHE_DIRS)
+
+    Returns:
+        Dict com contagem de arquivos por método e bytes
+    """
+    exclude = CACHE_DIRS if exclude is None else exclude
+    stats = {'reflinked': 0, 'hardlinked': 0, 'copied': 0, 'bytes': 0}
+
+    for root, dirs, files in os.walk(src):
+        dirs[:] = [d for d in dirs if d not in exclude]
+        target_root = dst / Path(root).relative_to(src)
+        target_root.mkdir(parents=True, exist_ok=True)
+
+        for name in files:
+            if name in LOCK_FILES:
+                continue
+
+            source = os.path.join(root, name)
+            target = str(target_root / name)
+
+            if os.path.islink(source):
+                os.symlink(os.readlink(source), target)
+                continue
+
+            if _reflink(source, target):
+                shutil.copystat(source, target)
+                stats['reflinked'] += 1
+            elif Path(name).suffix in IMMUTABLE_SUFFIXES:
+                if os.path.exists(target):
+                    os.unlink(target)
+                try:
+                    os.link(source, target)
+                    stats['hardlinked'] += 1
+                except OSError:
+                    shutil.copy2(source, target)
+                    stats['copied'] += 1
+            else:
+                shutil.copy2(source, target)
+                stats['copied'] += 1
+
+            stats['bytes'] += os.path.getsize(source)
+
+    return stats
 
 
 class SessionManager:
@@ -26,6 +288,15 @@ class SessionManager:
         self.profiles_dir = Path("chrome_profiles")
         self.profile_path = self.profiles_dir / profile_name
         
+        # Cópias por worker (ver clone_profile)
+        self.clones_dir = self.profiles_dir / ".clones"
+        
+        # Jar de sessão portátil (ver export_jar)
+        self.jar_path = self.profiles_dir / f"{profile_name}.jar.json"
+        
+        # Cópia em memória do perfil (ver stage_in_ram)
+        self.staged_path: Optional[Path] = None
+        
         # Criar diretório de perfis se não existir
         self._ensure_profiles_directory()
     
@@ -60,10 +331,436 @@ class SessionManager:
         """
         return self.profile_path.exists() and len(list(self.profile_path.iterdir())) > 0
     
+    def _clone_path(self, worker_id, in_ram: bool = False) -> Path:
+        """Caminho da cópia de um worker (no disco ou em memória)"""
+        base = self.clones_dir
+        if in_ram:
+            base = (get_ram_dir() or self.profiles_dir) / ".clones"
+        return base / f"{self.profile_name}-{worker_id}"
+    
+    def clone_profile(self, worker_id, in_ram: bool = False) -> str:
+        """
+        Cria uma cópia leve do perfil para um worker paralelo
+        
+        A cópia é refeita a partir do perfil principal a cada chamada,
+        então todos os workers começam com o login mais recente.
+        
+        Args:
+            worker_id: Identificador do worker (ex: 1, 2, "job-a")
+            in_ram: Se True, cria a cópia em memória (tmpfs)
+        
+        Returns:
+            String com caminho absoluto da cópia
+        """
+        if not self.profile_exists():
+            raise FileNotFoundError(f"Perfil '{self.profile_name}' não existe (execute: make session)")
+        
+        clone_path = self._clone_path(worker_id, in_ram)
+        if clone_path.exists():
+            shutil.rmtree(clone_path)
+        
+        stats = copy_profile_tree(self.profile_path, clone_path)
+        print(f"🧬 Perfil clonado para worker {worker_id}: "
+              f"{stats['reflinked']} reflinks, {stats['hardlinked']} hardlinks, "
+              f"{stats['copied']} cópias ({stats['bytes'] / (1024 * 1024):.1f} MB)")
+        
+        return str(clone_path.absolute())
+    
+    def remove_clone(self, worker_id):
+        """Remove a cópia do perfil de um worker (no disco e em memória)"""
+        for clone_path in {self._clone_path(worker_id), self._clone_path(worker_id, in_ram=True)}:
+            if clone_path.exists():
+                shutil.rmtree(clone_path, ignore_errors=True)
+                print(f"🗑️ Cópia do perfil removida: worker {worker_id}")
+    
+    def cleanup_clones(self) -> int:
+        """
+        Remove as cópias deste perfil deixadas por workers que caíram
+        
+        Só considera cópias de workers numéricos ("<perfil>-<n>"), para não
+        apagar as de outra conta com prefixo parecido (ex: "linkedin-ana-1"),
+        e pula as que ainda estão abertas por um Chrome. Cópias em memória
+        de stage_in_ram só são removidas se o processo dono já terminou.
+        
+        Returns:
+            int: Quantidade de cópias removidas
+        """
+        removed = self._cleanup_stale_stages()
+        for clones_dir in {self._clone_path(0).parent, self._clone_path(0, in_ram=True).parent}:
+            if not clones_dir.exists():
+                continue
+            for clone_path in clones_dir.glob(f"{self.profile_name}-*"):
+                if not clone_path.name[len(self.profile_name) + 1:].isdigit():
+                    continue  # Outro perfil ou worker não numérico
+                if profile_in_use(clone_path):
+                    continue  # Worker em execução
+                shutil.rmtree(clone_path, ignore_errors=True)
+                removed += 1
+        
+        if removed:
+            print(f"🗑️ {removed} cópias do perfil '{self.profile_name}' removidas")
+        return removed
+    
+    def _staged_dir(self) -> Optional[Path]:
+        """Diretório das cópias em memória de stage_in_ram (None sem tmpfs)"""
+        ram_dir = get_ram_dir()
+        return ram_dir / ".staged" if ram_dir else None
+    
+    def _cleanup_stale_stages(self) -> int:
+        """
+        Remove cópias em memória deste perfil cujo processo já terminou
+        (Chrome que caiu ou start que falhou antes do sync_back)
+        
+        Returns:
+            int: Quantidade de cópias removidas
+        """
+        staged_dir = self._staged_dir()
+        if staged_dir is None or not staged_dir.exists():
+            return 0
+        
+        removed = 0
+        for staged_path in staged_dir.glob(f"{self.profile_name}-*"):
+            # Nome: "<perfil>-<pid>-<id da instância>"
+            parts = staged_path.name[len(self.profile_name) + 1:].split('-')
+            if len(parts) != 2 or not parts[0].isdigit():
+                continue  # Outro perfil com prefixo parecido (ex: "linkedin-2-123-ab12cd34")
+            pid = int(parts[0])
+            if pid != os.getpid() and not psutil.pid_exists(pid):
+                shutil.rmtree(staged_path, ignore_errors=True)
+                removed += 1
+        return removed
+    
+    def stage_in_ram(self) -> str:
+        """
+        Copia o perfil para a memória (tmpfs) e retorna o caminho da cópia
+        
+        Chame sync_back() depois de fechar o Chrome para salvar a sessão.
+        Cópias deixadas por processos que morreram são removidas aqui.
+        Sem tmpfs disponível, retorna o perfil em disco.
+        
+        Returns:
+            String com caminho absoluto do perfil a usar
+        """
+        staged_dir = self._staged_dir()
+        if staged_dir is None:
+            print("⚠️ Nenhum tmpfs disponível - usando o perfil em disco")
+            return self.get_profile_path()
+        
+        stale = self._cleanup_stale_stages()
+        if stale:
+            print(f"🗑️ {stale} cópias em memória abandonadas removidas")
+        
+        # Cópia anterior desta instância (stage_in_ram chamado de novo)
+        if self.staged_path is not None:
+            shutil.rmtree(self.staged_path, ignore_errors=True)
+        
+        # Uma cópia por instância: scrapers no mesmo processo não dividem a pasta
+        staged_path = staged_dir / f"{self.profile_name}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        
+        if self.profile_path.exists():
+            stats = copy_profile_tree(self.profile_path, staged_path)
+            print(f"⚡ Perfil '{self.profile_name}' em memória: {staged_path} "
+                  f"({stats['bytes'] / (1024 * 1024):.1f} MB)")
+        else:
+            staged_path.mkdir(parents=True)
+            print(f"⚡ Novo perfil '{self.profile_name}' em memória: {staged_path}")
+        
+        self.staged_path = staged_path
+        return str(staged_path)
+    
+    def sync_back(self):
+        """
+        Salva o estado da sessão (cookies, local storage) da cópia em memória
+        no perfil em disco e remove a cópia
+        
+        Deve ser chamado com o Chrome já fechado.
+        """
+        if self.staged_path is None:
+            return
+        
+        synced = 0
+        for relative in SESSION_STATE_PATHS:
+            source = self.staged_path / relative
+            if not source.exists():
+                continue
+            
+            target = self.profile_path / relative
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_target = target.with_name(target.name + '.sync')
+            
+            # Copiar ao lado e trocar, para não deixar o perfil pela metade
+            if source.is_dir():
+                shutil.rmtree(tmp_target, ignore_errors=True)
+                shutil.copytree(source, tmp_target, ignore=shutil.ignore_patterns(*LOCK_FILES))
+                shutil.rmtree(target, ignore_errors=True)
+            else:
+                shutil.copy2(source, tmp_target)
+            os.replace(tmp_target, target)
+            synced += 1
+        
+        shutil.rmtree(self.staged_path, ignore_errors=True)
+        self.staged_path = None
+        print(f"💾 Sessão sincronizada para o disco ({synced} itens)")
+
+    def _site_setting(self, table: Dict[str, Any], default: Any = None) -> Any:
+        """Configuração do perfil (ou do prefixo, para perfis de conta como "linkedin-ana")"""
+        if self.profile_name in table:
+            return table[self.profile_name]
+        return table.get(self.profile_name.split('-')[0], default)
+    
+    def check_session(self, cookie_name: Optional[str] = None, domain: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Verifica a sessão lendo o banco de cookies do perfil (sem abrir o Chrome)
+        
+        O valor do cookie é criptografado pelo Chrome; aqui só importam
+        a existência e a validade.
+        
+        Args:
+            cookie_name: Cookie de autenticação (padrão: AUTH_COOKIES do perfil)
+            domain: Domínio do cookie (padrão: AUTH_COOKIES do perfil)
+        
+        Returns:
+            Dict com 'valid' (True, False ou None se não foi possível verificar),
+            'reason', 'expires_at' e 'days_left'
+        """
+        default_cookie, default_domain = self._site_setting(AUTH_COOKIES, (None, None))
+        cookie_name = cookie_name or default_cookie
+        domain = domain or default_domain
+        
+        status: Dict[str, Any] = {'valid': None, 'reason': '', 'expires_at': None, 'days_left': None}
+        
+        if not cookie_name or not domain:
+            status['reason'] = f"cookie de autenticação não definido para o perfil '{self.profile_name}'"
+            return status
+        
+        db_path = next(
+            (self.profile_path / p for p in COOKIE_DB_PATHS if (self.profile_path / p).exists()),
+            None
+        )
+        if db_path is None:
+            status.update(valid=False, reason="perfil sem banco de cookies (login nunca feito)")
+            return status
+        
+        try:
+            # immutable=1: lê mesmo com o Chrome aberto, sem criar journal/locks
+            connection = sqlite3.connect(f"{db_path.absolute().as_uri()}?mode=ro&immutable=1", uri=True)
+            try:
+                row = connection.execute(
+                    "SELECT expires_utc, has_expires FROM cookies "
+                    "WHERE name = ? AND (host_key = ? OR host_key LIKE ?) "
+                    "ORDER BY expires_utc DESC LIMIT 1",
+                    (cookie_name, domain, f"%.{domain}")
+                ).fetchone()
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            status['reason'] = f"não foi possível ler {db_path}: {e}"
+            return status
+        
+        if row is None:
+            status.update(valid=False, reason=f"cookie {cookie_name} não encontrado (sessão encerrada)")
+            return status
+        
+        expires_utc, has_expires = row
+        if not has_expires or not expires_utc:
+            status.update(valid=True, reason=f"cookie {cookie_name} de sessão (sem data de expiração)")
+            return status
+        
+        expires_at = CHROME_EPOCH + timedelta(microseconds=expires_utc)
+        remaining = expires_at - datetime.now(timezone.utc)
+        status['expires_at'] = expires_at.isoformat(timespec='seconds')
+        status['days_left'] = round(remaining.total_seconds() / 86400, 1)
+        
+        if remaining.total_seconds() <= 0:
+            status.update(valid=False, reason=f"cookie {cookie_name} expirou em {status['expires_at']}")
+        else:
+            status.update(valid=True, reason=f"cookie {cookie_name} válido até {status['expires_at']}")
+        return status
+    
+    def export_jar(self, driver, origins: Optional[list] = None) -> str:
+        """
+        Exporta cookies e local storage do navegador logado para o jar do perfil
+        
+        Args:
+            driver: WebDriver do Chrome aberto com este perfil
+            origins: Origens a exportar (padrão: JAR_ORIGINS do perfil)
+        
+        Returns:
+            String com caminho do jar
+        """
+        origins = origins or self._site_setting(JAR_ORIGINS)
+        if not origins:
+            raise ValueError(f"Origens do jar não definidas para o perfil '{self.profile_name}'")
+        
+        export_jar(driver, str(self.jar_path), origins)
+        return str(self.jar_path)
+    
+    def check_jar(self, cookie_name: Optional[str] = None, domain: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Verifica o cookie de autenticação do jar (mesmo formato de check_session)
+        
+        Returns:
+            Dict com 'valid', 'reason', 'expires_at' e 'days_left'
+        """
+        default_cookie, default_domain = self._site_setting(AUTH_COOKIES, (None, None))
+        cookie_name = cookie_name or default_cookie
+        domain = domain or default_domain
+        
+        status: Dict[str, Any] = {'valid': None, 'reason': '', 'expires_at': None, 'days_left': None}
+        
+        if not self.jar_path.exists():
+            status.update(valid=False, reason=f"jar não encontrado: {self.jar_path}")
+            return status
+        if not cookie_name or not domain:
+            status['reason'] = f"cookie de autenticação não definido para o perfil '{self.profile_name}'"
+            return status
+        
+        cookie = find_cookie(load_jar(str(self.jar_path)), cookie_name, domain)
+        if cookie is None:
+            status.update(valid=False, reason=f"cookie {cookie_name} ausente no jar")
+            return status
+        
+        expires = cookie.get('expires', -1)
+        if cookie.get('session') or expires is None or expires < 0:
+            status.update(valid=True, reason=f"cookie {cookie_name} de sessão (sem data de expiração)")
+            return status
+        
+        expires_at = datetime.fromtimestamp(expires, timezone.utc)
+        remaining = expires_at - datetime.now(timezone.utc)
+        status['expires_at'] = expires_at.isoformat(timespec='seconds')
+        status['days_left'] = round(remaining.total_seconds() / 86400, 1)
+        
+        if remaining.total_seconds() <= 0:
+            status.update(valid=False, reason=f"cookie {cookie_name} do jar expirou em {status['expires_at']}")
+        else:
+            status.update(valid=True, reason=f"cookie {cookie_name} do jar válido até {status['expires_at']}")
+        return status
+    
+    def is_in_use(self) -> bool:
+        """
+        Verifica se um Chrome está usando o perfil agora
+        
+        Returns:
+            True se o perfil está aberto em algum processo
+        """
+        return profile_in_use(self.profile_path)
+    
+    def prune_profile(self) -> int:
+        """
+        Remove do perfil caches e dados que o login não precisa
+        
+        Returns:
+            int: Bytes liberados
+        """
+        if not self.profile_exists():
+            print(f"⚠️ Perfil '{self.profile_name}' não existe")
+            return 0
+        if self.is_in_use():
+            raise RuntimeError(f"Perfil '{self.profile_name}' está aberto no Chrome - feche antes de limpar")
+        
+        before = directory_size(self.profile_path)
+        
+        for root, dirs, files in os.walk(self.profile_path):
+            for name in [d for d in dirs if d in PRUNABLE_ENTRIES]:
+                shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+                dirs.remove(name)
+            for name in files:
+                if name in PRUNABLE_ENTRIES:
+                    os.remove(os.path.join(root, name))
+        
+        freed = before - directory_size(self.profile_path)
+        print(f"🧹 Perfil '{self.profile_name}' reduzido: "
+              f"{before / (1024 * 1024):.1f} MB -> {(before - freed) / (1024 * 1024):.1f} MB")
+        return freed
+    
+    def pack_profile(self, archive_path: Optional[str] = None) -> str:
+        """
+        Empacota o perfil (sem caches e dados dispensáveis) em um .tar.gz
+        
+        Grava ao lado o checksum no formato do sha256sum (<arquivo>.sha256).
+        
+        Args:
+            archive_path: Arquivo de destino (padrão: chrome_profiles/<perfil>.tar.gz)
+        
+        Returns:
+            String com caminho do arquivo gerado
+        """
+        if not self.profile_exists():
+            raise FileNotFoundError(f"Perfil '{self.profile_name}' não existe (execute: make session)")
+        if self.is_in_use():
+            raise RuntimeError(f"Perfil '{self.profile_name}' está aberto no Chrome - feche antes de empacotar")
+        
+        archive = Path(archive_path) if archive_path else self.profiles_dir / f"{self.profile_name}.tar.gz"
+        archive.parent.mkdir(parents=True, exist_ok=True)
+        
+        def exclude(member: tarfile.TarInfo) -> Optional[tarfile.TarInfo]:
+            name = Path(member.name).name
+            if name in PRUNABLE_ENTRIES or name in LOCK_FILES:
+                return None
+            return member
+        
+        tmp_archive = archive.with_name(archive.name + '.tmp')
+        with tarfile.open(tmp_archive, 'w:gz', compresslevel=6) as tar:
+            for entry in sorted(self.profile_path.iterdir()):
+                tar.add(entry, arcname=entry.name, filter=exclude)
+        os.replace(tmp_archive, archive)
+        
+        checksum = file_sha256(archive)
+        Path(f"{archive}.sha256").write_text(f"{checksum}  {archive.name}\n")
+        
+        print(f"📦 Perfil empacotado: {archive} ({archive.stat().st_size / (1024 * 1024):.1f} MB)")
+        print(f"   SHA-256: {checksum}")
+        return str(archive)
+    
+    def restore_profile(self, archive_path: str, checksum: Optional[str] = None):
+        """
+        Restaura o perfil a partir de um arquivo gerado por pack_profile
+        
+        Args:
+            archive_path: Arquivo .tar.gz
+            checksum: SHA-256 esperado (padrão: lido de <arquivo>.sha256)
+        
+        Raises:
+            ValueError: se o checksum não conferir
+        """
+        archive = Path(archive_path)
+        
+        if checksum is None:
+            checksum_file = Path(f"{archive}.sha256")
+            if not checksum_file.exists():
+                raise ValueError(f"Checksum não informado e {checksum_file} não existe")
+            checksum = checksum_file.read_text().split()[0]
+        
+        actual = file_sha256(archive)
+        if actual != checksum.lower():
+            raise ValueError(f"Checksum não confere para {archive}: esperado {checksum}, obtido {actual}")
+        
+        if self.profile_path.exists() and self.is_in_use():
+            raise RuntimeError(f"Perfil '{self.profile_name}' está aberto no Chrome - feche antes de restaurar")
+        
+        # Extrair ao lado e trocar, para não deixar o perfil pela metade
+        staging = self.profiles_dir / f".{self.profile_name}.restore"
+        shutil.rmtree(staging, ignore_errors=True)
+        
+        with tarfile.open(archive, 'r:gz') as tar:
+            if hasattr(tarfile, 'data_filter'):
+                tar.extractall(staging, filter='data')
+            else:
+                for member in tar.getmembers():
+                    target = (staging / member.name).resolve()
+                    if not str(target).startswith(str(staging.resolve())):
+                        raise ValueError(f"Caminho inválido no arquivo: {member.name}")
+                tar.extractall(staging)
+        
+        if self.profile_path.exists():
+            shutil.rmtree(self.profile_path)
+        os.replace(staging, self.profile_path)
+        
+        print(f"✅ Perfil '{self.profile_name}' restaurado de {archive} (checksum OK)")
+    
     def delete_profile(self):
         """Deleta o perfil atual (logout)"""
         if self.profile_path.exists():
-            import shutil
             shutil.rmtree(self.profile_path)
             print(f"🗑️ Perfil '{self.profile_name}' deletado")
         else:
@@ -75,7 +772,8 @@ class SessionManager:
             print("📁 Nenhum perfil criado ainda")
             return
         
-        profiles = [p.name for p in self.profiles_dir.iterdir() if p.is_dir()]
+        # Diretórios internos (.clones, .daemons) não são perfis
+        profiles = [p.name for p in self.profiles_dir.iterdir() if p.is_dir() and not p.name.startswith('.')]
         
         if not profiles:
             print("📁 Nenhum perfil criado ainda")
@@ -102,3 +800,52 @@ class SessionManager:
         }
 
 
+def main():
+    """Linha de comando do gerenciador de sessões"""
+    parser = argparse.ArgumentParser(description="Gerenciamento de perfis do Chrome")
+    parser.add_argument(
+        'command',
+        choices=['info', 'check', 'export-jar', 'prune', 'pack', 'restore', 'cleanup-clones']
+    )
+    parser.add_argument('--profile', default='linkedin', help="Nome do perfil")
+    parser.add_argument('--archive', help="Arquivo .tar.gz (pack/restore)")
+    parser.add_argument('--checksum', help="SHA-256 esperado (restore)")
+    args = parser.parse_args()
+
+    session = SessionManager(profile_name=args.profile)
+
+    if args.command == 'info':
+        info = session.get_info()
+        if session.profile_exists():
+            info['size_mb'] = round(directory_size(session.profile_path) / (1024 * 1024), 1)
+        for key, value in info.items():
+            print(f"   {key}: {value}")
+    elif args.command == 'check':
+        status = session.check_session()
+        icon = {True: '✅', False: '❌', None: '⚠️'}[status['valid']]
+        print(f"{icon} Sessão '{args.profile}': {status['reason']}")
+        if status['days_left'] is not None:
+            print(f"   Dias restantes: {status['days_left']}")
+        raise SystemExit(0 if status['valid'] else 1)
+    elif args.command == 'export-jar':
+        from .chrome_config import ChromeConfig
+        
+        driver = ChromeConfig(headless=True, profile_path=session.get_profile_path()).create_driver()
+        try:
+            session.export_jar(driver)
+        finally:
+            driver.quit()
+    elif args.command == 'prune':
+        session.prune_profile()
+    elif args.command == 'pack':
+        session.pack_profile(args.archive)
+    elif args.command == 'restore':
+        if not args.archive:
+            parser.error("restore requer --archive")
+        session.restore_profile(args.archive, args.checksum)
+    else:
+        session.cleanup_clones()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Cache de Snapshots de Páginas
+==============================
+
+Salva snapshots comprimidos das páginas visitadas (HTML + JSON capturado),
+endereçados pelo conteúdo (SHA-256) e indexados por URL e data.
+
+Permite rodar a extração novamente contra os snapshots (modo replay),
+sem navegador, sem proxy e sem risco de bloqueio.
+
+Estrutura no disco:
+    snapshots/
+        index.jsonl                 # uma linha por captura (url, data, hash)
+        objects/ab/abcdef....json.gz
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Forma canônica da URL usada no índice
+
+    Esquema e host em minúsculas, sem porta padrão, sem fragmento e com "/"
+    como caminho vazio: "HTTP://Site.com:80" e "http://site.com/" são a mesma página.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    if parts.username:
+        host = f"{parts.username}{':' + parts.password if parts.password else ''}@{host}"
+    return urlunsplit((scheme, host, parts.path or '/', parts.query, ''))
+
+
+class SnapshotStore:
+    """
+    Armazenamento de snapshots de páginas endereçado por conteúdo
+    """
+
+    def __init__(self, root: str = "snapshots"):
+        """
+        Inicializa o armazenamento
+
+        Args:
+            root: Diretório dos snapshots
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.index_file = self.root / "index.jsonl"
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+    def _object_path(self, digest: str) -> Path:
+        """Caminho do arquivo de um snapshot pelo hash"""
+        return self.objects_dir / digest[:2] / f"{digest}.json.gz"
+
+    def save(self, url: str, html: str, captured: Optional[List[Any]] = None) -> str:
+        """
+        Salva um snapshot da página
+
+        Conteúdo idêntico é gravado uma única vez (apenas o índice ganha
+        uma nova linha).
+
+        Args:
+            url: URL da página
+            html: HTML da página
+            captured: Respostas JSON capturadas durante o carregamento
+
+        Returns:
+            str: Hash SHA-256 do snapshot
+        """
+        payload = json.dumps(
+            {'url': url, 'html': html, 'captured': captured or []},
+            ensure_ascii=False,
+            sort_keys=True
+        ).encode('utf-8')
+        digest = hashlib.sha256(payload).hexdigest()
+
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with gzip.open(tmp_path, 'wb', compresslevel=6) as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+
+        entry = {
+            'url': url,
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'digest': digest,
+            'size': len(payload),
+        }
+        with open(self.index_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
+
+        print(f"💾 Snapshot salvo: {url[:80]} ({digest[:12]})")
+        return digest
+
+    def load(self, digest: str) -> Optional[Dict[str, Any]]:
+        """
+        Carrega um snapshot pelo hash
+
+        Returns:
+            Dict com 'url', 'html' e 'captured' ou None se não existir
+        """
+        path = self._object_path(digest)
+        if not path.exists():
+            return None
+
+        with gzip.open(path, 'rb') as f:
+            return json.loads(f.read().decode('utf-8'))
+
+    def entries(self, url: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre as entradas do índice (mais antigas primeiro)
+
+        Args:
+            url: Filtrar por URL (comparada na forma normalizada; None = todas)
+        """
+        if not self.index_file.exists():
+            return
+
+        wanted = normalize_url(url) if url is not None else None
+
+        with open(self.index_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Linha incompleta (escrita interrompida)
+
+                if wanted is None or normalize_url(entry.get('url', '')) == wanted:
+                    yield entry
+
+    def latest(self, url: str, before: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Carrega o snapshot mais recente de uma URL
+
+        Args:
+            url: URL da página
+            before: Data ISO limite (ex: "2025-12-08T10:00:00") para replay histórico
+
+        Returns:
+            Dict com 'url', 'html', 'captured' e 'timestamp' ou None
+        """
+        chosen = None
+        for entry in self.entries(url):
+            if before and entry['timestamp'] > before:
+                continue
+            if chosen is None or entry['timestamp'] >= chosen['timestamp']:
+                chosen = entry
+
+        if not chosen:
+            return None
+
+        snapshot = self.load(chosen['digest'])
+        if snapshot:
+            snapshot['timestamp'] = chosen['timestamp']
+        return snapshot
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do armazenamento
+
+        Returns:
+            Dict com estatísticas
+        """
+        entries = list(self.entries())
+        objects = list(self.objects_dir.glob('*/*.json.gz'))
+
+        return {
+            'captures': len(entries),
+            'urls': len({e['url'] for e in entries}),
+            'objects': len(objects),
+            'disk_bytes': sum(p.stat().st_size for p in objects),
+        }
@@ -0,0 +1,197 @@
+"""
+Pool de Abas para Carregamento Concorrente
+===========================================
+
+Abre K abas no mesmo Chrome, distribui URLs entre elas e extrai de cada
+aba assim que ela termina de carregar. O navegador carrega as páginas em
+paralelo; só a extração (rápida) é serial.
+
+Limites por aba:
+- timeout de carregamento por página
+- máximo de páginas por aba (a aba é recriada para liberar memória)
+
+A verificação das abas usa comandos CDP (Runtime.evaluate, Page.stopLoading):
+um execute_script numa aba que ainda está navegando fica bloqueado até o
+carregamento terminar, o que impediria aplicar o timeout por página.
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class TabPool:
+    """
+    Pool de abas do Chrome para carregar várias páginas ao mesmo tempo
+    """
+
+    def __init__(
+        self,
+        driver,
+        size: int = 4,
+        page_timeout: float = 30,
+        max_pages_per_tab: int = 50,
+        poll_interval: float = 0.1,
+        configure_tab: Optional[Callable[[Any], None]] = None
+    ):
+        """
+        Inicializa o pool
+
+        Args:
+            driver: WebDriver do Chrome
+            size: Quantidade de abas simultâneas
+            page_timeout: Tempo máximo de carregamento de cada página (segundos)
+            max_pages_per_tab: Páginas carregadas antes de recriar a aba
+            poll_interval: Intervalo entre verificações das abas (segundos)
+            configure_tab: Chamada com o driver em cada aba nova (ex:
+                           ChromeConfig.configure_tab: bloqueio, anti-detecção)
+        """
+        self.driver = driver
+        self.size = size
+        self.page_timeout = page_timeout
+        self.max_pages_per_tab = max_pages_per_tab
+        self.poll_interval = poll_interval
+        self.configure_tab = configure_tab
+
+        self.main_handle = None
+        # handle -> {'url', 'started', 'pages'}
+        self.tabs: Dict[str, Dict[str, Any]] = {}
+
+    def open(self):
+        """Abre as abas do pool"""
+        self.main_handle = self.driver.current_window_handle
+
+        while len(self.tabs) < self.size:
+            self._new_tab()
+
+        print(f"🗂️ Pool de {self.size} abas aberto")
+
+    def close(self):
+        """Fecha as abas do pool e volta para a aba principal"""
+        for handle in list(self.tabs):
+            self._close_tab(handle)
+
+        if self.main_handle:
+            self.driver.switch_to.window(self.main_handle)
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _new_tab(self) -> str:
+        """Cria uma aba vazia e registra no pool"""
+        self.driver.switch_to.new_window('tab')
+        handle = self.driver.current_window_handle
+        # Abas novas não herdam os comandos CDP da primeira aba
+        if self.configure_tab:
+            self.configure_tab(self.driver)
+        self.tabs[handle] = {'url': None, 'started': 0.0, 'pages': 0}
+        return handle
+
+    def _close_tab(self, handle: str):
+        """Fecha uma aba do pool"""
+        try:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        except Exception:
+            pass  # Aba já fechada ou travada
+        self.tabs.pop(handle, None)
+
+    def _dispatch(self, handle: str, url: str):
+        """Começa a carregar uma URL na aba, sem esperar o carregamento"""
+        tab = self.tabs[handle]
+
+        # Aba muito usada: recriar para liberar memória
+        if tab['pages'] >= self.max_pages_per_tab:
+            self._close_tab(handle)
+            handle = self._new_tab()
+            tab = self.tabs[handle]
+
+        self.driver.switch_to.window(handle)
+        # A marca some quando o novo documento substitui o anterior
+        self.driver.execute_script(
+            "window.__tabPoolPending = true; window.location.href = arguments[0];", url
+        )
+
+        tab['url'] = url
+        tab['started'] = time.time()
+        tab['pages'] += 1
+
+    def _is_loaded(self, handle: str) -> bool:
+        """Verifica se a página da aba terminou de carregar (sem esperar a navegação)"""
+        self.driver.switch_to.window(handle)
+        response = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': "!window.__tabPoolPending && document.readyState === 'complete'",
+            'returnByValue': True,
+            'timeout': 1000,
+        })
+        return bool(response.get('result', {}).get('value'))
+
+    def map(
+        self,
+        urls: List[str],
+        extract: Callable[[Any], Any]
+    ) -> Iterator[Tuple[str, Any, Optional[str]]]:
+        """
+        Carrega as URLs nas abas e extrai cada página assim que ela carrega
+
+        Args:
+            urls: Lista de URLs
+            extract: Função que recebe o driver (na aba carregada) e retorna os dados
+
+        Yields:
+            tuple: (url, resultado, erro) na ordem em que as páginas terminam
+        """
+        if not self.tabs:
+            self.open()
+
+        queue = list(urls)
+        queue.reverse()
+
+        # Preencher todas as abas livres
+        for handle in list(self.tabs):
+            if not queue:
+                break
+            self._dispatch(handle, queue.pop())
+
+        while any(tab['url'] for tab in self.tabs.values()):
+            progressed = False
+
+            for handle in list(self.tabs):
+                tab = self.tabs.get(handle)
+                if not tab or not tab['url']:
+                    continue
+
+                url = tab['url']
+                result, error = None, None
+
+                try:
+                    loaded = self._is_loaded(handle)
+                except Exception:
+                    loaded = False  # Documento trocando durante a verificação
+
+                if loaded:
+                    try:
+                        result = extract(self.driver)
+                    except Exception as e:
+                        error = str(e)
+                elif time.time() - tab['started'] > self.page_timeout:
+                    try:
+                        self.driver.execute_cdp_cmd('Page.stopLoading', {})
+                    except Exception:
+                        pass  # Aba travada: a próxima navegação substitui o documento
+                    error = f"timeout de {self.page_timeout}s"
+                else:
+                    continue
+
+                tab['url'] = None
+                progressed = True
+                yield url, result, error
+
+                if queue:
+                    self._dispatch(handle, queue.pop())
+
+            if not progressed:
+                time.sleep(self.poll_interval)
@@ -36,6 +36,9 @@ def setup_session():
     # Verificar se já existe sessão
     if session.profile_exists():
         print("⚠️  Já existe uma sessão salva!")
+        status = session.check_session()
+        if status['valid'] is not None:
+            print(f"   {'✅' if status['valid'] else '❌'} {status['reason']}")
         resposta = input("Deseja recriar a sessão? (s/n): ").lower()
         
         if resposta == 's':
@@ -0,0 +1,149 @@
+"""
+Testes da busca HTTP (LinkedInHttpClient) contra um servidor local que
+simula os endpoints JSON do LinkedIn
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from selenium_linkedin.linkedin_http import HttpSearchError, LinkedInHttpClient
+
+
+PAGE_SIZE = 2
+
+COOKIES = [
+    {'name': 'li_at', 'value': 'token-de-teste'},
+    {'name': 'JSESSIONID', 'value': '"ajax:123456"'},
+]
+
+
+def person(n):
+    """Entidade de resultado no formato Voyager"""
+    return {
+        '$type': 'com.linkedin.voyager.dash.search.EntityResultViewModel',
+        'title': {'text': f'Pessoa {n}'},
+        'primarySubtitle': {'text': f'Cargo {n}'},
+        'secondarySubtitle': {'text': 'São Paulo'},
+        'navigationUrl': f'https://www.linkedin.com/in/pessoa-{n}?miniProfileUrn=x',
+    }
+
+
+class FakeLinkedIn(BaseHTTPRequestHandler):
+    """Serve páginas de resultados por `start` (ou o status configurado)"""
+
+    pages = {}      # start -> lista de números de pessoas
+    failures = {}   # start -> status HTTP
+    requests = []   # (path, headers) recebidos
+
+    def do_GET(self):
+        type(self).requests.append((self.path, dict(self.headers)))
+        start = int(parse_qs(urlsplit(self.path).query)['start'][0])
+
+        status = self.failures.get(start)
+        if status:
+            self.send_response(status)
+            self.end_headers()
+            return
+
+        body = json.dumps({'included': [person(n) for n in self.pages.get(start, [])]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    FakeLinkedIn.pages = {0: [1, 2], 2: [3, 4], 4: [5]}
+    FakeLinkedIn.failures = {}
+    FakeLinkedIn.requests = []
+
+    httpd = HTTPServer(('127.0.0.1', 0), FakeLinkedIn)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def client(server):
+    client = LinkedInHttpClient(cookies=COOKIES, base_url=server)
+    yield client
+    client.close()
+
+
+def requested_starts():
+    return [int(parse_qs(urlsplit(path).query)['start'][0]) for path, _ in FakeLinkedIn.requests]
+
+
+def test_csrf_token_comes_from_jsessionid(client):
+    client.search_people("recrutador", max_results=1, page_size=PAGE_SIZE)
+
+    _, headers = FakeLinkedIn.requests[0]
+    assert headers['csrf-token'] == 'ajax:123456'
+    assert 'li_at=token-de-teste' in headers['Cookie']
+
+
+def test_missing_jsessionid_is_rejected(server):
+    with pytest.raises(ValueError):
+        LinkedInHttpClient(cookies=[{'name': 'li_at', 'value': 'x'}], base_url=server)
+
+
+def test_paginates_until_results_end(client):
+    people = client.search_people("recrutador", max_results=10, page_size=PAGE_SIZE)
+
+    assert [p['name'] for p in people] == [f'Pessoa {n}' for n in range(1, 6)]
+    assert people[0]['profile_url'] == 'https://www.linkedin.com/in/pessoa-1'
+    assert requested_starts() == [0, 2, 4, 6]
+
+
+def test_start_page_skips_earlier_pages(client):
+    people = client.search_people("recrutador", max_results=10, page_size=PAGE_SIZE, start_page=2)
+
+    assert [p['name'] for p in people] == ['Pessoa 3', 'Pessoa 4', 'Pessoa 5']
+    assert requested_starts()[0] == 2
+
+
+def test_seen_profiles_are_not_new(client):
+    seen = {'https://www.linkedin.com/in/pessoa-1', 'https://www.linkedin.com/in/pessoa-3'}
+    people = client.search_people("recrutador", max_results=2, page_size=PAGE_SIZE, seen=seen)
+
+    assert [p['name'] for p in people] == ['Pessoa 2', 'Pessoa 4']
+
+
+def test_before_page_can_stop_the_search(client):
+    pages = []
+
+    def before_page(page):
+        pages.append(page)
+        return page < 2
+
+    people = client.search_people("recrutador", max_results=10, page_size=PAGE_SIZE, before_page=before_page)
+
+    assert len(people) == 2
+    assert pages == [1, 2]
+
+
+@pytest.mark.parametrize('status', [401, 429])
+def test_error_carries_people_and_next_page(client, status):
+    FakeLinkedIn.failures = {2: status}
+
+    with pytest.raises(HttpSearchError) as info:
+        client.search_people("recrutador", max_results=10, page_size=PAGE_SIZE)
+
+    assert [p['name'] for p in info.value.people] == ['Pessoa 1', 'Pessoa 2']
+    assert info.value.next_page == 2
+    assert str(status) in str(info.value)
+
+
+def test_errors_do_not_share_people():
+    assert HttpSearchError("a").people is not HttpSearchError("b").people
@@ -0,0 +1,117 @@
+"""
+Testes da rotação HEALTH_WEIGHTED contra proxies locais de mentira
+(um http.server que responde a qualquer GET como se fosse o ipinfo.io)
+"""
+
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from selenium_linkedin.proxy_health import ProxyHealthChecker
+from selenium_linkedin.proxy_leases import ProxyLeaseAllocator
+from selenium_linkedin.proxy_manager import ProxyManager, ProxyRotation
+
+
+CHECK_URL = "http://ipinfo.test/json"
+
+
+class StandInProxy(BaseHTTPRequestHandler):
+    """Proxy HTTP de mentira: responde ele mesmo com o JSON do ipinfo"""
+
+    def do_GET(self):
+        status = self.server.status
+        body = json.dumps({'ip': f'10.0.0.{self.server.server_port % 250}', 'country': 'BR'}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def start_proxy():
+    servers = []
+
+    def start(status=200):
+        httpd = HTTPServer(('127.0.0.1', 0), StandInProxy)
+        httpd.status = status
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        servers.append(httpd)
+        return httpd
+
+    yield start
+    for httpd in servers:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def closed_port():
+    """Porta local sem nada escutando (proxy fora do ar)"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def make_manager(tmp_path, ports, recheck_after=600):
+    proxy_file = tmp_path / "proxies.txt"
+    proxy_file.write_text(''.join(f"127.0.0.1:{port}\n" for port in ports))
+    return ProxyManager(
+        proxy_file=str(proxy_file),
+        rotation_mode=ProxyRotation.HEALTH_WEIGHTED,
+        state_file=str(tmp_path / "proxy_state.json"),
+        health_checker=ProxyHealthChecker(check_url=CHECK_URL, timeout=2),
+        recheck_after=recheck_after,
+        leases=ProxyLeaseAllocator(str(tmp_path / "proxy_leases.json"))
+    )
+
+
+def test_weights_favor_fast_reliable_proxies():
+    checker = ProxyHealthChecker()
+    fast, slow, dead, new = ({'http': f'http://p{i}:1'} for i in range(4))
+
+    checker.record({'proxy': fast['http'], 'ok': True, 'latency_ms': 100})
+    checker.record({'proxy': slow['http'], 'ok': True, 'latency_ms': 800})
+    for _ in range(2):
+        checker.record({'proxy': dead['http'], 'ok': False, 'error': 'ConnectTimeout'})
+
+    assert checker.weight(fast) > checker.weight(slow) > 0
+    assert checker.weight(dead) == 0
+    assert checker.weight(new) == 1.0
+    assert checker.choose([dead]) is None
+
+
+def test_dead_proxies_are_never_chosen(tmp_path, start_proxy):
+    live = start_proxy()
+    manager = make_manager(tmp_path, [live.server_port, closed_port()])
+
+    chosen = {manager.get_next_proxy()['http'] for _ in range(20)}
+
+    assert chosen == {f"http://127.0.0.1:{live.server_port}"}
+    assert manager.health.health[f"http://127.0.0.1:{live.server_port}"]['exit_ip']
+
+
+def test_all_dead_returns_without_waiting_for_a_lease(tmp_path):
+    manager = make_manager(tmp_path, [closed_port(), closed_port()])
+
+    assert manager.acquire_proxy() is None
+    assert not manager.has_live_proxies()
+
+
+def test_dead_proxy_is_rechecked_after_recheck_after(tmp_path, start_proxy):
+    flaky = start_proxy(status=502)
+    url = f"http://127.0.0.1:{flaky.server_port}"
+
+    manager = make_manager(tmp_path, [flaky.server_port], recheck_after=3600)
+    assert manager.get_next_proxy() is None
+    flaky.status = 200
+    assert manager.get_next_proxy() is None  # Verificação recente: continua morto
+
+    manager.recheck_after = 0
+    assert manager.get_next_proxy()['http'] == url
+    assert not manager.health.is_dead({'http': url})